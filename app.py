@@ -22,6 +22,7 @@ Features
 Usage::
 
     python app.py
+    python app.py --batch ROOT [ROOT ...]   # headless JSON Lines scan
 """
 
 from __future__ import annotations
@@ -33,7 +34,9 @@ import shutil
 import sys
 import time
 import webbrowser
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -47,6 +50,7 @@ from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Input,
@@ -64,8 +68,22 @@ except ModuleNotFoundError:
         tomllib = None  # type: ignore[assignment]
 
 # Ecosystem support
-from base import Ecosystem, Package as BasePackage, EnvInfo
+from base import Ecosystem, Package as BasePackage, EnvInfo, latest_key, package_key
+from base import normalise_name as _normalise
 from ecosystems import detect_all
+from ecosystems.cache import MetadataCache
+from ecosystems.lockindex import load_lock_index
+from ecosystems.merge import merge_packages
+from ecosystems.pep508 import name_and_specifier as _parse_dep_string
+from ecosystems.python import (
+    _find_lock,
+    _parse_requirements,  # noqa: F401  (re-exported)
+    _remove_from_requirements,  # noqa: F401  (re-exported)
+    _resolve_requirements,
+)
+from ecosystems.sitepackages import SitePackagesIndex
+from ecosystems.workspace import Workspace, load_workspace
+from package_store import PackageStore
 
 
 # =============================================================================
@@ -73,21 +91,28 @@ from ecosystems import detect_all
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class DepSource:
     """One place where a dependency was declared or found."""
 
     file: str  # e.g. "pyproject.toml", "requirements-dev.txt", "venv"
     specifier: str  # e.g. ">=2.31", "==8.1.7", "*"
 
+    def __post_init__(self) -> None:
+        self.file = sys.intern(self.file)  # shared by every package in a file
+
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """A dependency aggregated across all discovered sources."""
 
     name: str
     sources: list[DepSource]  # every file/env that mentions this package
     installed_version: str  # from uv.lock or venv (resolved version)
+    key: str = field(init=False, repr=False, compare=False)  # normalised name
+
+    def __post_init__(self) -> None:
+        self.key = _normalise(self.name)
 
 
 # =============================================================================
@@ -182,50 +207,19 @@ class PackageManager:
 # Dependency Parsing  (multi-source scanner)
 # =============================================================================
 
-_DEP_RE = re.compile(
-    r"^\s*(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)"
-    r"(?:\[.*?\])?"  # optional extras
-    r"\s*(?P<spec>(?:[><=!~]+\s*[A-Za-z0-9.*+!_-]+\s*,?\s*)*)"
-)
-
-
-def _normalise(name: str) -> str:
-    """PEP 503 normalisation (lowercase, hyphens/underscores/dots -> -)."""
-    return re.sub(r"[-_.]+", "-", name).lower()
-
-
-def _parse_dep_string(raw: str) -> tuple[str, str] | None:
-    """Extract ``(name, specifier)`` from a PEP 508 dependency string."""
-    m = _DEP_RE.match(raw)
-    if not m:
-        return None
-    name = m.group("name")
-    spec = m.group("spec").strip() or "*"
-    return name, spec
 
-
-# -- uv.lock parser (unchanged) ----------------------------------------------
+# -- Lockfile parser ----------------------------------------------------------
 
 
 def _parse_lock(lock_path: Path) -> dict[str, str]:
-    """Parse ``uv.lock`` and return a ``{normalised_name: version}`` map.
+    """Parse a lockfile and return a ``{normalised_name: version}`` map.
 
-    ``uv.lock`` is a TOML file with repeated ``[[package]]`` tables.
+    ``uv.lock``, ``poetry.lock``, ``pdm.lock`` and ``Pipfile.lock`` are
+    understood; the compiled index is persisted by content hash (see
+    ``ecosystems.lockindex``).
     """
-    if not lock_path.is_file() or tomllib is None:
-        return {}
-    try:
-        with open(lock_path, "rb") as fh:
-            data = tomllib.load(fh)
-    except Exception:
-        return {}
-    result: dict[str, str] = {}
-    for pkg in data.get("package", []):
-        name = _normalise(pkg.get("name", ""))
-        version = pkg.get("version", "")
-        if name and version:
-            result[name] = version
-    return result
+    index = load_lock_index(lock_path)
+    return index.versions if index is not None else {}
 
 
 # -- Sub-parsers --------------------------------------------------------------
@@ -272,27 +266,6 @@ def _parse_pyproject(path: Path) -> list[tuple[str, str, str]]:
     return results
 
 
-def _parse_requirements(path: Path) -> list[tuple[str, str, str]]:
-    """Parse a ``requirements.txt``-style file (line-by-line)."""
-    if not path.is_file():
-        return []
-    results: list[tuple[str, str, str]] = []
-    label = path.name
-    try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-    except Exception:
-        return []
-    for line in lines:
-        line = line.strip()
-        # skip blank, comments, flags (-r, -e, --index-url, etc.)
-        if not line or line.startswith("#") or line.startswith("-"):
-            continue
-        parsed = _parse_dep_string(line)
-        if parsed:
-            results.append((parsed[0], parsed[1], label))
-    return results
-
-
 def _parse_setup_py(path: Path) -> list[tuple[str, str, str]]:
     """Extract ``install_requires`` from a ``setup.py`` using AST.
 
@@ -381,36 +354,22 @@ def _parse_pipfile(path: Path) -> list[tuple[str, str, str]]:
     return results
 
 
-async def _parse_installed(uv_path: str | None) -> list[tuple[str, str, str]]:
-    """Get packages installed in the active venv via ``uv pip list``.
+# Shared by _parse_installed and _get_package_requires; refreshed by mtime.
+_site_packages = SitePackagesIndex()
+
 
-    Returns ``[(name, "==version", "venv"), ...]``.
+async def _parse_installed(root: Path | None = None) -> list[tuple[str, str, str]]:
+    """Get packages installed in the project's venv from its dist-info METADATA.
+
+    Reads ``<root>/.venv`` (or the active ``VIRTUAL_ENV``); *root* defaults
+    to the current directory.  Returns ``[(name, "==version", "venv"), ...]``.
     """
-    if uv_path is None:
-        return []
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            uv_path,
-            "pip",
-            "list",
-            "--format",
-            "json",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await proc.communicate()
-        if proc.returncode != 0:
-            return []
-        packages = json.loads(stdout.decode())
-    except Exception:
-        return []
-    results: list[tuple[str, str, str]] = []
-    for pkg in packages:
-        name = pkg.get("name", "")
-        version = pkg.get("version", "")
-        if name and version:
-            results.append((name, f"=={version}", "venv"))
-    return results
+    dists = await asyncio.to_thread(_site_packages.distributions, root or Path.cwd())
+    return [
+        (info.name, f"=={info.version}", "venv")
+        for info in dists.values()
+        if info.version
+    ]
 
 
 # -- Aggregation --------------------------------------------------------------
@@ -432,9 +391,8 @@ def load_dependencies(
     # 1. pyproject.toml
     raw.extend(_parse_pyproject(cwd / "pyproject.toml"))
 
-    # 2. requirements*.txt  (glob)
-    for req_path in sorted(cwd.glob("requirements*.txt")):
-        raw.extend(_parse_requirements(req_path))
+    # 2. requirements*.txt  (glob, following -r / -c includes)
+    raw.extend(_resolve_requirements(cwd)[0])
 
     # 3. setup.py
     raw.extend(_parse_setup_py(cwd / "setup.py"))
@@ -449,33 +407,25 @@ def load_dependencies(
     if installed:
         raw.extend(installed)
 
-    # Merge by normalised name
-    lock_map = _parse_lock(cwd / "uv.lock")
-    merged: dict[str, Package] = {}
-
-    for name, spec, source_label in raw:
-        key = _normalise(name)
-        if key not in merged:
-            merged[key] = Package(
-                name=name,
-                sources=[],
-                installed_version=lock_map.get(key, ""),
-            )
-        pkg = merged[key]
-        # Avoid duplicate source entries (same file + same specifier)
-        dup = any(s.file == source_label and s.specifier == spec for s in pkg.sources)
-        if not dup:
-            pkg.sources.append(DepSource(file=source_label, specifier=spec))
-        # If this source is "venv" and we don't have an installed version yet,
-        # extract it from the ==version specifier.
-        if (
-            source_label == "venv"
-            and not pkg.installed_version
-            and spec.startswith("==")
-        ):
-            pkg.installed_version = spec[2:]
-
-    return sorted(merged.values(), key=lambda p: p.name.lower())
+    # Merge by normalised name.  The lock wins; a "venv" entry's ==version
+    # fills in packages the lock does not cover.
+    lock_map = _parse_lock(_find_lock(cwd))
+
+    def _installed(name: str, spec: str, source_label: str) -> str:
+        locked = lock_map.get(_normalise(name), "")
+        if not locked and source_label == "venv" and spec.startswith("=="):
+            return spec[2:]
+        return locked
+
+    return merge_packages(
+        (
+            (name, source_label, spec, _installed(name, spec, source_label))
+            for name, spec, source_label in raw
+        ),
+        key=_normalise,
+        package_cls=Package,
+        source_cls=DepSource,
+    )
 
 
 # =============================================================================
@@ -483,28 +433,6 @@ def load_dependencies(
 # =============================================================================
 
 
-def _remove_from_requirements(path: Path, pkg_name: str) -> tuple[bool, str]:
-    """Remove a package line from a ``requirements.txt``-style file."""
-    if not path.is_file():
-        return False, f"{path.name} not found"
-    norm = _normalise(pkg_name)
-    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-    new_lines: list[str] = []
-    removed = False
-    for line in lines:
-        stripped = line.strip()
-        if stripped and not stripped.startswith("#") and not stripped.startswith("-"):
-            parsed = _parse_dep_string(stripped)
-            if parsed and _normalise(parsed[0]) == norm:
-                removed = True
-                continue
-        new_lines.append(line)
-    if not removed:
-        return False, f"'{pkg_name}' not found in {path.name}"
-    path.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
-    return True, f"Removed '{pkg_name}' from {path.name}"
-
-
 def _remove_from_setup_cfg(path: Path, pkg_name: str) -> tuple[bool, str]:
     """Remove a package from ``setup.cfg`` ``[options].install_requires``."""
     if not path.is_file():
@@ -725,26 +653,9 @@ async def _get_uv_version() -> str:
 
 
 async def _get_package_requires(name: str) -> list[str]:
-    """Get direct dependencies of a package via ``uv pip show``."""
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            "uv",
-            "pip",
-            "show",
-            name,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await proc.communicate()
-        if proc.returncode == 0:
-            for line in stdout.decode().splitlines():
-                if line.startswith("Requires:"):
-                    reqs = line.split(":", 1)[1].strip()
-                    if reqs:
-                        return [r.strip() for r in reqs.split(",")]
-    except Exception:
-        pass
-    return []
+    """Get direct dependencies of a package from its dist-info METADATA."""
+    info = await asyncio.to_thread(_site_packages.get, Path.cwd(), name)
+    return info.requires() if info is not None else []
 
 
 def _venv_exists() -> bool:
@@ -757,6 +668,43 @@ def _venv_exists() -> bool:
 # =============================================================================
 
 
+def _highlight_matches(text: str, positions: tuple[int, ...], width: int) -> str:
+    """Pad *text* to *width* and mark the fuzzy-matched characters."""
+    padded = f"{text:<{width}}"
+    if not positions:
+        return padded
+    hits = set(positions)
+    return "".join(
+        f"[bold #ff9e64]{ch}[/]" if i in hits else ch for i, ch in enumerate(padded)
+    )
+
+
+class _RowCache:
+    """Formatted markup per list row, reused while the row's state is unchanged.
+
+    Lists redraw on every keystroke, but a selection move only changes two
+    rows and a version check only the rows whose status moved.  Callers
+    pass each row's identity and a *state* tuple of everything its markup
+    depends on; the row is only formatted again when that state differs.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[Any, tuple[Any, str]] = {}
+        self.formatted = 0
+
+    def get(self, row_id: Any, state: Any, build: Callable[[], str]) -> str:
+        entry = self._rows.get(row_id)
+        if entry is not None and entry[0] == state:
+            return entry[1]
+        self.formatted += 1
+        markup = build()
+        self._rows[row_id] = (state, markup)
+        return markup
+
+    def clear(self) -> None:
+        self._rows.clear()
+
+
 class PanelWidget(Static):
     """Base panel widget with a title and active/inactive border colors.
 
@@ -816,8 +764,13 @@ class StatusPanel(PanelWidget):
         source_count: int = 0,
         outdated_count: int = 0,
         env_info: EnvInfo | None = None,
+        workspace_members: int | None = None,
     ) -> None:
-        """Rebuild the status display."""
+        """Rebuild the status display.
+
+        *workspace_members* is set while the aggregated workspace view is
+        shown.
+        """
         app_version = _get_app_version()
         divider = "[#3b4261]──────────────────────[/]"
 
@@ -850,6 +803,11 @@ class StatusPanel(PanelWidget):
             pkg_line,
             f"[#565f89]Sources:[/]  [#7aa2f7]{source_count}[/]",
         ]
+        if workspace_members is not None:
+            lines.append(
+                f"[#565f89]Workspace:[/] [#bb9af7]{workspace_members} members[/]"
+                "  [#565f89](read-only)[/]"
+            )
 
         self._info_text = "\n".join(lines)
         self.update(self._info_text)
@@ -863,14 +821,23 @@ class SourcesPanel(PanelWidget):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(title="Sources", id="sources-panel", **kwargs)
         self._sources: list[str] = []
+        self._via: dict[str, str] = {}
+        self._rows = _RowCache()
 
     def on_mount(self) -> None:
         self.border_title = "Sources [0]"
         self.add_class("panel-inactive")
 
-    def set_sources(self, sources: list[str]) -> None:
-        """Update the list of source files."""
+    def set_sources(
+        self, sources: list[str], via: dict[str, str] | None = None
+    ) -> None:
+        """Update the list of source files.
+
+        *via* maps included sources (``-r`` / ``-c``) to the file that
+        pulled them in; those are shown with a dimmed ``← includer`` hint.
+        """
         self._sources = ["All Sources"] + sources
+        self._via = via or {}
         if self.selected_index >= len(self._sources):
             self.selected_index = 0
         self.border_title = f"Sources [{len(sources)}]"
@@ -893,14 +860,25 @@ class SourcesPanel(PanelWidget):
             return
 
         for i, src in enumerate(self._sources):
-            marker = "\u25b8" if i == self.selected_index else " "
-            color = "#7aa2f7" if i == 0 else _source_color(src)
-            if i == self.selected_index:
-                lines.append(f"[b {color}]{marker} {src}[/]")
-            else:
-                lines.append(f"[#565f89]{marker}[/] [{color}]{src}[/]")
+            selected = i == self.selected_index
+            origin = self._via.get(src.removesuffix(" [constraint]"))
+            lines.append(
+                self._rows.get(
+                    i,
+                    (selected, src, origin),
+                    partial(self._format_row, i, src, origin, selected),
+                )
+            )
         self.update("\n".join(lines))
 
+    @staticmethod
+    def _format_row(i: int, src: str, origin: str | None, selected: bool) -> str:
+        color = "#7aa2f7" if i == 0 else _source_color(src)
+        hint = f" [#565f89]\u2190 {origin}[/]" if origin else ""
+        if selected:
+            return f"[b {color}]\u25b8 {src}[/]{hint}"
+        return f"[#565f89] [/] [{color}]{src}[/]{hint}"
+
     def move_up(self) -> None:
         if self._sources and self.selected_index > 0:
             self.selected_index -= 1
@@ -931,38 +909,73 @@ class SourcesPanel(PanelWidget):
 
 
 class PackagesPanel(PanelWidget):
-    """Navigable list of packages replacing DataTable."""
+    """Navigable list of packages replacing DataTable.
+
+    The list is virtualized: the panel keeps its own viewport offset and
+    only formats the rows in view plus a small overscan, so navigation and
+    redraw cost do not grow with the number of packages.
+    """
+
+    # Extra rows drawn past the viewport (clipped by ``overflow-y: hidden``),
+    # so a height that is stale during a resize never leaves blank lines.
+    OVERSCAN = 3
+    # Rows of context kept above/below the selection when scrolling.
+    SCROLL_MARGIN = 2
+    # Viewport height assumed before the first layout.
+    DEFAULT_HEIGHT = 40
+    # Most fuzzy filter results ranked and listed.
+    FUZZY_LIMIT = 1000
 
     selected_index: reactive[int] = reactive(0)
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(title="Packages", id="packages-panel", **kwargs)
         self._all_packages: list[Package] = []
+        self._store = PackageStore([])
         self._filtered_packages: list[Package] = []
-        self._latest_versions: dict[str, str] = {}
+        self._match_positions: list[tuple[int, ...]] = []  # parallel to the above
+        self._match_total = 0
+        self._latest_versions: dict[tuple[str, str], str] = {}
         self._filter: str = ""
         self._source_filter: str | None = None
         self._filter_active: bool = False
+        self._top = 0  # index of the first row in view
+        self._rows = _RowCache()  # keyed by package identity
 
     def on_mount(self) -> None:
         self.border_title = "Packages [0]"
         self.add_class("panel-inactive")
 
+    def on_resize(self, event: events.Resize) -> None:
+        self._ensure_visible()
+        self._render_list()
+
+    def on_mouse_scroll_down(self, event: events.MouseScrollDown) -> None:
+        self._scroll_viewport(3)
+        event.stop()
+
+    def on_mouse_scroll_up(self, event: events.MouseScrollUp) -> None:
+        self._scroll_viewport(-3)
+        event.stop()
+
     def set_packages(
         self,
         packages: list[Package],
-        latest: dict[str, str] | None = None,
+        latest: dict[tuple[str, str], str] | None = None,
         source_filter: str | None = None,
     ) -> None:
         """Update the package list."""
         self._all_packages = packages
         if latest is not None:
             self._latest_versions = latest
+        self._store = PackageStore(packages, self._latest_versions)
+        self._rows.clear()
         self._source_filter = source_filter
         self._apply_filters()
 
-    def set_latest_versions(self, latest: dict[str, str]) -> None:
+    def set_latest_versions(self, latest: dict[tuple[str, str], str]) -> None:
         self._latest_versions = latest
+        self._store.set_latest(latest)
         self._apply_filters()
 
     def set_source_filter(self, source: str | None) -> None:
@@ -970,6 +983,8 @@ class PackagesPanel(PanelWidget):
         self._apply_filters()
 
     def set_text_filter(self, text: str) -> None:
+        if text != self._filter:
+            self.selected_index = 0  # results are re-ranked, best first
         self._filter = text
         self._apply_filters()
 
@@ -982,80 +997,62 @@ class PackagesPanel(PanelWidget):
         self._filter_active = val
 
     def _apply_filters(self) -> None:
-        pkgs = self._all_packages
-
-        # Filter by source
-        if self._source_filter:
-            pkgs = [
-                p for p in pkgs if any(s.file == self._source_filter for s in p.sources)
-            ]
-
-        # Filter by text
-        query = self._filter.lower()
-        if query:
-            pkgs = [
-                p
-                for p in pkgs
-                if query in p.name.lower()
-                or any(query in s.file.lower() for s in p.sources)
-            ]
-
-        self._filtered_packages = pkgs
+        """Select rows for the source and text filters.
+
+        Text is matched fuzzily against names and ranked fzf-style; a
+        leading ``'`` asks for an exact substring match (of the name or a
+        source label) in name order instead.
+        """
+        store = self._store
+        if self._filter.startswith("'"):
+            rows = store.select(self._source_filter, self._filter[1:])
+            hits = [(row, ()) for row in rows]
+            total = len(hits)
+        elif self._filter:
+            hits, total = store.fuzzy_select(
+                self._source_filter, self._filter, self.FUZZY_LIMIT
+            )
+        else:
+            rows = store.select(self._source_filter)
+            hits = [(row, ()) for row in rows]
+            total = len(hits)
+        self._filtered_packages = [store.packages[row] for row, _ in hits]
+        self._match_positions = [positions for _, positions in hits]
+        self._match_total = total
         if self.selected_index >= len(self._filtered_packages):
             self.selected_index = max(0, len(self._filtered_packages) - 1)
         count = len(self._filtered_packages)
+        shown = f"{count} of {total}" if total > count else str(count)
         if self._filter:
-            self.border_title = f"Packages [{count}] [filter: {self._filter}]"
+            self.border_title = f"Packages [{shown}] [filter: {self._filter}]"
         else:
-            self.border_title = f"Packages [{count}]"
+            self.border_title = f"Packages [{shown}]"
         if self._filter:
             self.add_class("filter-active")
         else:
             self.remove_class("filter-active")
+        self._ensure_visible()
         self._render_list()
 
+    def _viewport_height(self) -> int:
+        return self.content_size.height or self.DEFAULT_HEIGHT
+
     def _render_list(self) -> None:
         lines: list[str] = []
-        for i, pkg in enumerate(self._filtered_packages):
-            marker = "\u25b8" if i == self.selected_index else " "
-            norm = _normalise(pkg.name)
-            latest = self._latest_versions.get(norm, "")
-            ver = pkg.installed_version or "-"
-
-            if pkg.installed_version and latest:
-                if pkg.installed_version == latest:
-                    ver_style = "#9ece6a"
-                    icon = "●"
-                    icon_color = "#9ece6a"
-                else:
-                    ver_style = "#e0af68"
-                    icon = "●"
-                    icon_color = "#e0af68"
-            elif pkg.installed_version:
-                ver_style = "#9ece6a"
-                icon = "●"
-                icon_color = "#9ece6a"
-            else:
-                ver_style = "#565f89"
-                icon = "○"
-                icon_color = "#565f89"
-
-            src_tags = " ".join(_source_abbrev(s.file) for s in pkg.sources)
-
-            if i == self.selected_index:
-                lines.append(
-                    f"[#c0caf5]{marker} {pkg.name:<20}[/]"
-                    f" [{icon_color}]{icon}[/]"
-                    f" [{ver_style}]{ver:<10}[/]"
-                    f" [#565f89]{src_tags}[/]"
-                )
-            else:
-                lines.append(
-                    f"[#565f89]{marker}[/] [#8893b3]{pkg.name:<20}[/]"
-                    f" [{icon_color}]{icon}[/]"
-                    f" [{ver_style}]{ver:<10}[/]"
-                    f" [#3b4261]{src_tags}[/]"
+        end = self._top + self._viewport_height() + self.OVERSCAN
+        for i in range(self._top, min(end, len(self._filtered_packages))):
+            pkg = self._filtered_packages[i]
+            selected = i == self.selected_index
+            latest = self._latest_versions.get(latest_key(pkg), "")
+            positions = self._match_positions[i]
+            state = (selected, pkg.installed_version, latest, positions)
+            lines.append(
+                self._rows.get(
+                    id(pkg),
+                    state,
+                    partial(self._format_row, pkg, latest, selected, positions),
                 )
+            )
 
         if not lines:
             lines.append("[#565f89] No packages found[/]")
@@ -1066,6 +1063,46 @@ class PackagesPanel(PanelWidget):
 
         self.update("\n".join(lines))
 
+    @staticmethod
+    def _format_row(
+        pkg: Package, latest: str, selected: bool, positions: tuple[int, ...] = ()
+    ) -> str:
+        ver = pkg.installed_version or "-"
+        if pkg.installed_version and latest:
+            if pkg.installed_version == latest:
+                ver_style = "#9ece6a"
+                icon = "●"
+                icon_color = "#9ece6a"
+            else:
+                ver_style = "#e0af68"
+                icon = "●"
+                icon_color = "#e0af68"
+        elif pkg.installed_version:
+            ver_style = "#9ece6a"
+            icon = "●"
+            icon_color = "#9ece6a"
+        else:
+            ver_style = "#565f89"
+            icon = "○"
+            icon_color = "#565f89"
+
+        src_tags = " ".join(_source_abbrev(s.file) for s in pkg.sources)
+        name = _highlight_matches(pkg.name, positions, 20)
+
+        if selected:
+            return (
+                f"[#c0caf5]\u25b8 {name}[/]"
+                f" [{icon_color}]{icon}[/]"
+                f" [{ver_style}]{ver:<10}[/]"
+                f" [#565f89]{src_tags}[/]"
+            )
+        return (
+            f"[#565f89] [/] [#8893b3]{name}[/]"
+            f" [{icon_color}]{icon}[/]"
+            f" [{ver_style}]{ver:<10}[/]"
+            f" [#3b4261]{src_tags}[/]"
+        )
+
     def get_selected_package(self) -> Package | None:
         if not self._filtered_packages:
             return None
@@ -1080,8 +1117,8 @@ class PackagesPanel(PanelWidget):
     def move_up(self) -> None:
         if self._filtered_packages and self.selected_index > 0:
             self.selected_index -= 1
+            self._ensure_visible()
             self._render_list()
-            self._scroll_to_selected()
 
     def move_down(self) -> None:
         if (
@@ -1089,24 +1126,39 @@ class PackagesPanel(PanelWidget):
             and self.selected_index < len(self._filtered_packages) - 1
         ):
             self.selected_index += 1
+            self._ensure_visible()
             self._render_list()
-            self._scroll_to_selected()
 
     def jump_top(self) -> None:
         if self._filtered_packages:
             self.selected_index = 0
+            self._ensure_visible()
             self._render_list()
-            self._scroll_to_selected()
 
     def jump_bottom(self) -> None:
         if self._filtered_packages:
             self.selected_index = len(self._filtered_packages) - 1
+            self._ensure_visible()
             self._render_list()
-            self._scroll_to_selected()
 
-    def _scroll_to_selected(self) -> None:
-        """Scroll so the selected item stays visible with context."""
-        self.scroll_to(0, max(0, self.selected_index - 2), animate=False)
+    def _ensure_visible(self) -> None:
+        """Move the viewport so the selection stays in view with context."""
+        height = self._viewport_height()
+        margin = min(self.SCROLL_MARGIN, (height - 1) // 2)
+        top = self._top
+        if self.selected_index < top + margin:
+            top = self.selected_index - margin
+        elif self.selected_index > top + height - 1 - margin:
+            top = self.selected_index - height + 1 + margin
+        self._top = max(0, min(top, len(self._filtered_packages) - height))
+
+    def _scroll_viewport(self, delta: int) -> None:
+        """Scroll the viewport by *delta* rows without moving the selection."""
+        height = self._viewport_height()
+        top = max(0, min(self._top + delta, len(self._filtered_packages) - height))
+        if top != self._top:
+            self._top = top
+            self._render_list()
 
 
 class DetailsPanel(PanelWidget):
@@ -1124,7 +1176,7 @@ class DetailsPanel(PanelWidget):
     def show_package(
         self,
         pkg: Package | None,
-        latest_versions: dict[str, str] | None = None,
+        latest_versions: dict[tuple[str, str], str] | None = None,
         requires: list[str] | None = None,
         summary: str | None = None,
         license_str: str | None = None,
@@ -1137,8 +1189,7 @@ class DetailsPanel(PanelWidget):
             return
 
         latest_versions = latest_versions or {}
-        norm = _normalise(pkg.name)
-        latest = latest_versions.get(norm, "")
+        latest = latest_versions.get(latest_key(pkg), "")
 
         lines: list[str] = []
         lines.append(f"[bold #c0caf5]{pkg.name}[/]")
@@ -1234,6 +1285,8 @@ _SOURCE_ABBREV: dict[str, str] = {
 
 def _source_abbrev(filename: str) -> str:
     """Return readable abbreviation for a source filename."""
+    # workspace / include labels carry a directory prefix
+    filename = filename.rsplit("/", 1)[-1]
     if filename in _SOURCE_ABBREV:
         return _SOURCE_ABBREV[filename]
     if filename.startswith("pyproject.toml"):
@@ -1247,6 +1300,7 @@ def _source_abbrev(filename: str) -> str:
 
 def _source_color(label: str) -> str:
     """Return the Tokyo Night color for a given source label."""
+    label = label.rsplit("/", 1)[-1]
     for prefix, color in _SOURCE_COLORS.items():
         if label.startswith(prefix) or label == prefix:
             return color
@@ -1435,7 +1489,7 @@ class PackageModal(ModalScreen[tuple[str, str, str] | None]):
 
         error_label.update("Validating on PyPI...")
 
-        valid, error_msg, resolved = await validate_pypi(name, version_raw)
+        valid, error_msg, resolved = await self.app.validate_package(name, version_raw)
 
         if not valid:
             error_label.update(error_msg or "Validation failed.")
@@ -1537,7 +1591,7 @@ class AddPackageModal(ModalScreen[tuple[str, str, str, str] | None]):
 
         error_label.update("Validating on PyPI...")
 
-        valid, error_msg, resolved = await validate_pypi(name, version_raw)
+        valid, error_msg, resolved = await self.app.validate_package(name, version_raw)
 
         if not valid:
             error_label.update(error_msg or "Validation failed.")
@@ -1579,6 +1633,7 @@ _HELP_TEXT = """\
 [b #7aa2f7]GLOBAL[/]
   [#9ece6a]v[/]               Create virtual environment
   [#9ece6a]r[/]               Refresh
+  [#9ece6a]w[/]               Toggle workspace view  (all member projects)
   [#9ece6a]i[/]               Init project  (uv init)
   [#9ece6a]?[/]               Toggle this help
   [#9ece6a]q[/]               Quit
@@ -1701,6 +1756,7 @@ class SearchPyPIModal(ModalScreen[str | None]):
         super().__init__()
         self._results: list[tuple[str, str, str]] = []
         self._selected: int = 0
+        self._rows = _RowCache()
 
     def compose(self) -> ComposeResult:
         with Vertical(id="search-pypi-container"):
@@ -1762,20 +1818,28 @@ class SearchPyPIModal(ModalScreen[str | None]):
         if not self._results:
             self.query_one("#search-results", Static).update("")
             return
-        lines: list[str] = []
-        for i, (name, version, desc) in enumerate(self._results):
-            marker = "\u25b8" if i == self._selected else " "
-            short_desc = desc[:60] + "..." if len(desc) > 60 else desc
-            if i == self._selected:
-                lines.append(
-                    f"  [#c0caf5]{marker} {name}[/]"
-                    f"  [#9ece6a]{version}[/]"
-                    f"  [#565f89]{short_desc}[/]"
-                )
-            else:
-                lines.append(f"  [#565f89]{marker} {name}  {version}  {short_desc}[/]")
+        lines = [
+            self._rows.get(
+                i,
+                (i == self._selected, result),
+                partial(self._format_result, result, i == self._selected),
+            )
+            for i, result in enumerate(self._results)
+        ]
         self.query_one("#search-results", Static).update("\n".join(lines))
 
+    @staticmethod
+    def _format_result(result: tuple[str, str, str], selected: bool) -> str:
+        name, version, desc = result
+        short_desc = desc[:60] + "..." if len(desc) > 60 else desc
+        if selected:
+            return (
+                f"  [#c0caf5]\u25b8 {name}[/]"
+                f"  [#9ece6a]{version}[/]"
+                f"  [#565f89]{short_desc}[/]"
+            )
+        return f"  [#565f89]  {name}  {version}  {short_desc}[/]"
+
     def on_key(self, event: events.Key) -> None:
         """Handle ``j``/``k`` navigation and Enter selection in results."""
         if not self._results:
@@ -1821,6 +1885,12 @@ class SearchPyPIModal(ModalScreen[str | None]):
 # Timeout (seconds) for the ``gg`` key sequence.
 _GG_TIMEOUT = 0.5
 
+# Quiet period (seconds) after the last filter keystroke before filtering.
+_FILTER_DEBOUNCE = 0.08
+
+# Time (seconds) a selection must stay put before its details are fetched.
+_DETAILS_SETTLE = 0.15
+
 
 class DependencyManagerApp(App):
     """PyDep - manage Python dependencies with Vim motions."""
@@ -1836,6 +1906,7 @@ class DependencyManagerApp(App):
         Binding("o", "check_outdated", "Outdated", priority=True),
         Binding("U", "update_all_outdated", "Update All", priority=True),
         Binding("r", "refresh", "Refresh", priority=True),
+        Binding("w", "toggle_workspace", "Workspace", priority=True),
         Binding("slash", "focus_search", "/Filter", priority=True),
         Binding("i", "init_project", "Init", priority=True),
         Binding("v", "create_venv", "Venv", priority=True),
@@ -1851,10 +1922,17 @@ class DependencyManagerApp(App):
         super().__init__()
         self._ecosystems: list[Ecosystem] = []
         self._active_ecosystem: Ecosystem | None = None
+        # Aggregated monorepo view (``w``); read-only while set
+        self._workspace: Workspace | None = None
+        self._workspace_mode: bool = False
         self._packages: list[BasePackage] = []
-        self._latest_versions: dict[str, str] = {}
-        self._pypi_cache: dict[str, dict] = {}
+        self._latest_versions: dict[tuple[str, str], str] = {}
+        # registry metadata, latest versions and requires, shared by the
+        # details, outdated and validate paths
+        self._metadata = MetadataCache()
         self._filter: str = ""
+        self._filter_timer: Timer | None = None
+        self._details_timer: Timer | None = None
         self._selected_source: str | None = None
         # gg sequence state
         self._pending_g: bool = False
@@ -1881,13 +1959,12 @@ class DependencyManagerApp(App):
         """Return the number of packages with a known newer version on PyPI."""
         if not self._latest_versions:
             return 0
-        return sum(
-            1
-            for pkg in self._packages
-            if pkg.installed_version
-            and self._latest_versions.get(_normalise(pkg.name), "")
-            and pkg.installed_version
-            != self._latest_versions.get(_normalise(pkg.name), "")
+        return sum(1 for pkg in self._packages if self._is_outdated(pkg))
+
+    def _is_outdated(self, pkg: BasePackage) -> bool:
+        latest = self._latest_versions.get(latest_key(pkg), "")
+        return bool(
+            pkg.installed_version and latest and pkg.installed_version != latest
         )
 
     # -- layout ---------------------------------------------------------------
@@ -1943,8 +2020,14 @@ class DependencyManagerApp(App):
             if key == "escape":
                 event.prevent_default()
                 event.stop()
-                # Clear filter and close
-                focused.value = ""
+                # Clear filter and close; the clear is applied right here, so
+                # drop any pending edit and don't let it re-arm the debounce
+                if self._filter_timer is not None:
+                    self._filter_timer.stop()
+                    self._filter_timer = None
+                self._filter = ""
+                with focused.prevent(Input.Changed):
+                    focused.value = ""
                 self.query_one("#filter-bar").display = False
                 pkg_panel = self.query_one("#packages-panel", PackagesPanel)
                 pkg_panel.set_text_filter("")
@@ -1957,7 +2040,10 @@ class DependencyManagerApp(App):
             if key == "enter":
                 event.prevent_default()
                 event.stop()
-                # Keep filter text, close bar
+                # Keep filter text (applying any pending edit), close bar
+                if self._filter_timer is not None:
+                    self._filter_timer.stop()
+                    self._apply_text_filter()
                 self.query_one("#filter-bar").display = False
                 pkg_panel = self.query_one("#packages-panel", PackagesPanel)
                 pkg_panel.filter_active = False
@@ -2216,26 +2302,47 @@ class DependencyManagerApp(App):
             next_idx = (current_idx - 1) % len(self._ecosystems)
 
         self._active_ecosystem = self._ecosystems[next_idx]
+        self._workspace_mode = False
         self._refresh_data()
         self.notify(f"Switched to {self._active_ecosystem.display_name}")
 
     @work(exclusive=True, group="refresh")
     async def _refresh_data(self) -> None:
-        """Refresh package data from the active ecosystem."""
-        if self._active_ecosystem is None:
+        """Refresh package data from the active ecosystem or the workspace."""
+        if self._active_ecosystem is None and not self._workspace_mode:
             return
 
-        self._show_loading("Scanning dependency sources...")
-        try:
-            self._packages = await self._active_ecosystem.load_dependencies(Path.cwd())
-        except Exception as exc:
-            self.notify(f"Failed to load dependencies: {exc}", severity="error")
-            self._packages = []
+        # installs and removals change what is required; registry data stays
+        self._metadata.invalidate(lambda key: key[1] == "requires")
+        via: dict[str, str] = {}
+        if self._workspace_mode:
+            self._show_loading("Scanning workspace members...")
+            try:
+                self._workspace = await load_workspace(Path.cwd())
+                self._packages = self._workspace.packages
+            except Exception as exc:
+                self.notify(f"Failed to load workspace: {exc}", severity="error")
+                self._workspace = None
+                self._packages = []
+        else:
+            self._show_loading("Scanning dependency sources...")
+            try:
+                self._packages = await self._active_ecosystem.load_dependencies(
+                    Path.cwd()
+                )
+            except Exception as exc:
+                self.notify(f"Failed to load dependencies: {exc}", severity="error")
+                self._packages = []
+            self.log.debug(
+                f"{self._active_ecosystem.name} refresh",
+                **self._active_ecosystem.debug_stats(),
+            )
+            via = self._active_ecosystem.source_provenance()
 
         # Update panels
         await self._update_status_panel()
         sources_panel = self.query_one("#sources-panel", SourcesPanel)
-        sources_panel.set_sources(self._collect_sources())
+        sources_panel.set_sources(self._collect_sources(), via=via)
 
         pkg_panel = self.query_one("#packages-panel", PackagesPanel)
         source_filter = sources_panel.get_selected_source()
@@ -2261,6 +2368,11 @@ class DependencyManagerApp(App):
             source_count=len(self._collect_sources()),
             outdated_count=self._count_outdated(),
             env_info=env_info,
+            workspace_members=(
+                len(self._workspace.members)
+                if self._workspace_mode and self._workspace
+                else None
+            ),
         )
 
     def _update_details_for_selection(self) -> None:
@@ -2269,16 +2381,66 @@ class DependencyManagerApp(App):
         details = self.query_one("#details-panel", DetailsPanel)
         pkg = pkg_panel.get_selected_package()
         details.show_package(pkg, self._latest_versions)
-        if pkg is not None:
-            self._fetch_and_show_requires(pkg)
+        self._schedule_details_fetch(pkg)
+
+    def _schedule_details_fetch(self, pkg: BasePackage | None) -> None:
+        """Fetch *pkg*'s requires and metadata once the selection settles.
+
+        Holding ``j`` or typing a filter changes the selection many times
+        a second; only a selection that stays put for ``_DETAILS_SETTLE``
+        is fetched.  A pending or running fetch for an earlier selection
+        is cancelled, not just ignored when it finishes.
+        """
+        if self._details_timer is not None:
+            self._details_timer.stop()
+            self._details_timer = None
+        self.workers.cancel_group(self, "requires")
+        if pkg is None:
+            return
+        # a package seen before this session renders without waiting
+        eco = pkg.ecosystem or self._active_ecosystem
+        if eco is not None:
+            requires_key, meta_key = self._details_keys(eco, pkg)
+            if requires_key in self._metadata and meta_key in self._metadata:
+                self._show_details(
+                    pkg, self._metadata.get(requires_key), self._metadata.get(meta_key)
+                )
+                return
+        self._details_timer = self.set_timer(
+            _DETAILS_SETTLE, partial(self._fetch_and_show_requires, pkg)
+        )
+
+    @staticmethod
+    def _details_keys(
+        eco: Ecosystem, pkg: BasePackage
+    ) -> tuple[tuple[str, str, str], tuple[str, str, str]]:
+        """Metadata cache keys of *pkg*'s requires and registry metadata."""
+        return (eco.name, "requires", pkg.key), (eco.name, "metadata", pkg.key)
 
     @work(exclusive=True, group="requires")
     async def _fetch_and_show_requires(self, pkg: BasePackage) -> None:
         """Fetch dependency list and package metadata, then re-render details."""
-        if not self._active_ecosystem:
+        # In the workspace view packages can come from any ecosystem
+        eco = pkg.ecosystem or self._active_ecosystem
+        if not eco:
             return
-        requires = await self._active_ecosystem.get_package_requires(pkg.name)
-        meta = await self._active_ecosystem.fetch_package_metadata(pkg.name)
+        requires_key, meta_key = self._details_keys(eco, pkg)
+        requires = await self._metadata.fetch(
+            requires_key, partial(eco.get_package_requires, pkg.name)
+        )
+        meta = await self._metadata.fetch(
+            meta_key, partial(eco.fetch_package_metadata, pkg.name), keep=bool
+        )
+        # Re-check the selection hasn't changed while we were fetching
+        pkg_panel = self.query_one("#packages-panel", PackagesPanel)
+        current = pkg_panel.get_selected_package()
+        if current is not None and current.key == pkg.key:
+            self._show_details(pkg, requires, meta)
+
+    def _show_details(
+        self, pkg: BasePackage, requires: list[str], meta: dict[str, str]
+    ) -> None:
+        """Render *pkg* in the details panel with its requires and metadata."""
         summary: str | None = None
         license_str: str | None = None
         homepage: str | None = None
@@ -2290,31 +2452,34 @@ class DependencyManagerApp(App):
             homepage = meta.get("homepage")
             requires_python = meta.get("requires_python")
             author = meta.get("author")
-        # Re-check the selection hasn't changed while we were fetching
-        pkg_panel = self.query_one("#packages-panel", PackagesPanel)
-        current = pkg_panel.get_selected_package()
-        if current is not None and _normalise(current.name) == _normalise(pkg.name):
-            details = self.query_one("#details-panel", DetailsPanel)
-            details.show_package(
-                pkg,
-                self._latest_versions,
-                requires=requires,
-                summary=summary,
-                license_str=license_str,
-                homepage=homepage,
-                requires_python=requires_python,
-                author=author,
-            )
+        details = self.query_one("#details-panel", DetailsPanel)
+        details.show_package(
+            pkg,
+            self._latest_versions,
+            requires=requires,
+            summary=summary,
+            license_str=license_str,
+            homepage=homepage,
+            requires_python=requires_python,
+            author=author,
+        )
 
     async def _fetch_pypi_metadata(self, name: str) -> dict[str, Any]:
         """Fetch PyPI JSON metadata with caching."""
-        if name in self._pypi_cache:
-            return self._pypi_cache[name]
-        data = await _get_pypi_json(name)
-        if data is not None:
-            self._pypi_cache[name] = data
-            return data
-        return {}
+        data = await self._metadata.fetch(
+            ("python", "pypi", _normalise(name)), partial(_get_pypi_json, name)
+        )
+        return data or {}
+
+    async def validate_package(
+        self, name: str, version: str | None = None
+    ) -> tuple[bool, str | None, str | None]:
+        """:func:`validate_pypi` through the metadata cache (successes only)."""
+        return await self._metadata.fetch(
+            ("python", "validate", _normalise(name), version or ""),
+            partial(validate_pypi, name, version),
+            keep=lambda result: result[0],
+        )
 
     def _on_source_selection_changed(self) -> None:
         """When the selected source changes, filter the packages panel."""
@@ -2329,9 +2494,18 @@ class DependencyManagerApp(App):
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "filter-input":
             self._filter = event.value
-            pkg_panel = self.query_one("#packages-panel", PackagesPanel)
-            pkg_panel.set_text_filter(event.value)
-            self._update_details_for_selection()
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(
+                _FILTER_DEBOUNCE, self._apply_text_filter
+            )
+
+    def _apply_text_filter(self) -> None:
+        """Apply the filter text once typing pauses (see ``_FILTER_DEBOUNCE``)."""
+        self._filter_timer = None
+        pkg_panel = self.query_one("#packages-panel", PackagesPanel)
+        pkg_panel.set_text_filter(self._filter)
+        self._update_details_for_selection()
 
     # -- actions --------------------------------------------------------------
 
@@ -2344,6 +2518,17 @@ class DependencyManagerApp(App):
         pkg_panel = self.query_one("#packages-panel", PackagesPanel)
         pkg_panel.filter_active = True
 
+    def action_toggle_workspace(self) -> None:
+        """Switch between the active ecosystem and the aggregated workspace."""
+        self._workspace_mode = not self._workspace_mode
+        if not self._workspace_mode:
+            self._workspace = None
+        self._refresh_data()
+        if self._workspace_mode:
+            self.notify("Workspace view (read-only)")
+        elif self._active_ecosystem:
+            self.notify(f"Switched to {self._active_ecosystem.display_name}")
+
     def action_refresh(self) -> None:
         self._refresh_data()
 
@@ -2356,21 +2541,48 @@ class DependencyManagerApp(App):
         if not self._packages:
             self.notify("No packages to check.", severity="warning")
             return
-        if not self._active_ecosystem:
+        # In the workspace view packages come from several ecosystems; each
+        # is checked against its own registry
+        groups: dict[str, tuple[Ecosystem, list[str]]] = {}
+        for pkg in self._packages:
+            eco = pkg.ecosystem or self._active_ecosystem
+            if eco is not None:
+                groups.setdefault(eco.name, (eco, []))[1].append(pkg.name)
+        if not groups:
             self.notify("No active ecosystem", severity="error")
             return
-        names = [pkg.name for pkg in self._packages]
-        self._show_loading(f"Checking {len(names)} packages for updates...")
-        try:
-            latest_map = await self._active_ecosystem.fetch_latest_versions(names)
-        except Exception as exc:
-            self._hide_loading()
-            self.notify(f"Outdated check failed: {exc}", severity="error")
-            return
+        total = sum(len(names) for _, names in groups.values())
+        self._show_loading(f"Checking {total} packages for updates...")
+        # keyed like base.latest_key: registries are per ecosystem, so PyPI's
+        # and npm's "six" are different packages
+        latest_map: dict[tuple[str, str], str | None] = {}
+        for eco, names in groups.values():
+            # versions looked up earlier this session are reused until they expire
+            missing: list[str] = []
+            for name in names:
+                key = (eco.name, package_key(eco.name, name))
+                cached = self._metadata.get((eco.name, "latest", key[1]))
+                if cached is None:
+                    missing.append(name)
+                else:
+                    latest_map[key] = cached
+            if not missing:
+                continue
+            try:
+                fetched = await eco.fetch_latest_versions(missing)
+            except Exception as exc:
+                self._hide_loading()
+                self.notify(f"Outdated check failed: {exc}", severity="error")
+                return
+            for name, version in fetched.items():
+                key = (eco.name, package_key(eco.name, name))
+                if version:
+                    self._metadata.put((eco.name, "latest", key[1]), version)
+                latest_map[key] = version
 
         failures = sum(1 for version in latest_map.values() if version is None)
         self._latest_versions = {
-            _normalise(name): version or "" for name, version in latest_map.items()
+            key: version or "" for key, version in latest_map.items()
         }
 
         # Update packages panel with latest versions
@@ -2385,7 +2597,7 @@ class DependencyManagerApp(App):
         outdated = self._count_outdated()
         if failures:
             self.notify(
-                f"Checked {len(names)} packages. {failures} failed (network errors).",
+                f"Checked {total} packages. {failures} failed (network errors).",
                 severity="warning",
             )
         elif outdated:
@@ -2403,14 +2615,7 @@ class DependencyManagerApp(App):
         """Prompt to update every package that has a newer PyPI version."""
         if not self._ensure_toml_or_warn():
             return
-        outdated = [
-            pkg
-            for pkg in self._packages
-            if pkg.installed_version
-            and self._latest_versions.get(_normalise(pkg.name), "")
-            and pkg.installed_version
-            != self._latest_versions.get(_normalise(pkg.name), "")
-        ]
+        outdated = [pkg for pkg in self._packages if self._is_outdated(pkg)]
         if not outdated:
             self.notify("No outdated packages. Press 'o' to check.", severity="warning")
             return
@@ -2464,10 +2669,11 @@ class DependencyManagerApp(App):
         if not pkg:
             self.notify("Select a package first.", severity="warning")
             return
-        if not self._active_ecosystem:
+        eco = pkg.ecosystem or self._active_ecosystem
+        if not eco:
             self.notify("No active ecosystem", severity="error")
             return
-        doc_url = self._active_ecosystem.get_docs_url(pkg.name)
+        doc_url = eco.get_docs_url(pkg.name)
         webbrowser.open(doc_url)
         self.notify(f"Opened {doc_url}", severity="information")
 
@@ -2477,6 +2683,8 @@ class DependencyManagerApp(App):
     # -- Init project ---------------------------------------------------------
 
     def action_init_project(self) -> None:
+        if not self._ensure_writable_or_warn():
+            return
         self._show_init_modal()
 
     @work(exclusive=True, group="manage")
@@ -2499,6 +2707,8 @@ class DependencyManagerApp(App):
     # -- Create venv ----------------------------------------------------------
 
     def action_create_venv(self) -> None:
+        if not self._ensure_writable_or_warn():
+            return
         if _venv_exists():
             self.notify("Virtual environment already exists.", severity="warning")
             return
@@ -2523,6 +2733,8 @@ class DependencyManagerApp(App):
     @work(exclusive=True, group="sync")
     async def action_sync(self) -> None:
         """Sync dependencies using the active ecosystem."""
+        if not self._ensure_writable_or_warn():
+            return
         if not self._active_ecosystem:
             self.notify("No active ecosystem", severity="error")
             return
@@ -2540,6 +2752,8 @@ class DependencyManagerApp(App):
     @work(exclusive=True, group="lock")
     async def action_lock(self) -> None:
         """Lock dependencies using the active ecosystem."""
+        if not self._ensure_writable_or_warn():
+            return
         if not self._active_ecosystem:
             self.notify("No active ecosystem", severity="error")
             return
@@ -2718,8 +2932,20 @@ class DependencyManagerApp(App):
         pkg_panel = self.query_one("#packages-panel", PackagesPanel)
         return pkg_panel.get_selected_package()
 
+    def _ensure_writable_or_warn(self) -> bool:
+        """Return True unless the read-only workspace view is shown."""
+        if self._workspace_mode:
+            self.notify(
+                "Workspace view is read-only. Press 'w' to leave it.",
+                severity="warning",
+            )
+            return False
+        return True
+
     def _ensure_toml_or_warn(self) -> bool:
         """Return True if pyproject.toml exists, else notify and return False."""
+        if not self._ensure_writable_or_warn():
+            return False
         if not (Path.cwd() / "pyproject.toml").is_file():
             self.notify(
                 "No pyproject.toml found. Press 'i' to init.", severity="warning"
@@ -2733,5 +2959,13 @@ class DependencyManagerApp(App):
 # =============================================================================
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    # Lets frozen builds run batch-mode worker processes
+    multiprocessing.freeze_support()
+    if sys.argv[1:2] == ["--batch"]:
+        import batch
+
+        sys.exit(batch.main(sys.argv[2:]))
     app = DependencyManagerApp()
     app.run()
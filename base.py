@@ -1,26 +1,75 @@
 from __future__ import annotations
 
+import re
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass
+@lru_cache(maxsize=1 << 16)
+def normalise_name(name: str) -> str:
+    """PEP 503 normalisation (lowercase, hyphens/underscores/dots -> -).
+
+    Memoised: the same names are normalised on every refresh and redraw.
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def package_key(ecosystem: str, name: str) -> str:
+    """Identity of a package within *ecosystem*.
+
+    Python names are PEP 503-normalised; npm names and Go module paths are
+    already canonical and compared as-is.
+    """
+    return normalise_name(name) if ecosystem == "python" else name
+
+
+@dataclass(slots=True)
 class DepSource:
-    """One place a dependency was declared."""
+    """One place a dependency was declared.
+
+    The ``file`` label is interned: every package declared in the same file
+    shares one string.
+    """
 
     file: str
     specifier: str
 
+    def __post_init__(self) -> None:
+        self.file = sys.intern(self.file)
 
-@dataclass
+
+@dataclass(slots=True)
 class Package:
-    """Aggregated dependency across all sources."""
+    """Aggregated dependency across all sources.
+
+    ``key`` caches :func:`package_key` of ``name`` for lookups on hot UI
+    paths (latest versions, selection checks); without an ecosystem the name
+    is PEP 503-normalised.
+    """
 
     name: str
     sources: list[DepSource]
     installed_version: str
     ecosystem: Ecosystem | None = None
+    key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.ecosystem is not None:
+            self.key = package_key(self.ecosystem.name, self.name)
+        else:
+            self.key = normalise_name(self.name)
+
+
+def latest_key(pkg: Package) -> tuple[str, str]:
+    """Key of *pkg* in latest-version maps: ``(ecosystem name, package key)``.
+
+    Registries are per ecosystem, so same-named PyPI and npm packages
+    (``six``, ``debug``) must not share an entry.
+    """
+    return (pkg.ecosystem.name if pkg.ecosystem is not None else "", pkg.key)
 
 
 @dataclass
@@ -119,3 +168,11 @@ class Ecosystem(ABC):
     @abstractmethod
     def get_docs_url(self, name: str) -> str:
         """Get documentation URL for a package."""
+
+    def source_provenance(self) -> dict[str, str]:
+        """Map included source labels to the source that included them."""
+        return {}
+
+    def debug_stats(self) -> dict[str, int]:
+        """Return internal counters (cache hits, etc.) for debug logging."""
+        return {}
@@ -0,0 +1,283 @@
+"""
+PyDep batch mode
+================
+
+Scan many project roots without the TUI, using the same ecosystem parsers,
+and stream one JSON object per root (JSON Lines) as each scan finishes.
+
+Roots are scanned in a process pool.  With ``--latest`` every package is
+annotated with its latest registry version; lookups go through a single
+:class:`RegistryCache`, so each distinct package is fetched once per run no
+matter how many roots declare it.
+
+Usage::
+
+    python app.py --batch ~/src/repo-a ~/src/repo-b
+    python batch.py --roots-file repos.txt --latest -j 8 > fleet.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TextIO
+
+from base import package_key
+from ecosystems import all_ecosystems, detect_all
+from fleet_index import FleetIndex
+from snapshot import PackageSnapshot, ScanSnapshot
+
+# Latest versions stored in a fleet index are reused for this long.
+DEFAULT_MAX_AGE = 24 * 3600
+
+
+# =============================================================================
+# Per-root scan (runs in worker processes)
+# =============================================================================
+
+
+async def _scan_root(root: Path) -> ScanSnapshot:
+    if not root.is_dir():
+        return ScanSnapshot(str(root), errors=("not a directory",))
+    ecosystems = detect_all(root)
+    results = await asyncio.gather(
+        *(eco.load_dependencies(root) for eco in ecosystems),
+        return_exceptions=True,
+    )
+    packages: list[PackageSnapshot] = []
+    errors: list[str] = []
+    for eco, result in zip(ecosystems, results):
+        if isinstance(result, BaseException):
+            errors.append(f"{eco.name}: {result}")
+            continue
+        packages.extend(PackageSnapshot.from_package(pkg, eco.name) for pkg in result)
+    return ScanSnapshot(
+        str(root),
+        tuple(eco.name for eco in ecosystems),
+        tuple(packages),
+        tuple(errors),
+    )
+
+
+def scan_root(root: str) -> ScanSnapshot:
+    """Run ``detect_all`` + ``load_dependencies`` for *root*.
+
+    Returns an immutable :class:`~snapshot.ScanSnapshot`, which pickles
+    cheaply across the process boundary.
+    """
+    return asyncio.run(_scan_root(Path(root)))
+
+
+# =============================================================================
+# Shared registry cache
+# =============================================================================
+
+
+class RegistryCache:
+    """Latest-version lookups shared by every root in a batch run.
+
+    Each distinct ``(ecosystem, package)`` is fetched at most once;
+    requests for a package that is already being fetched await the same
+    task.  Python names are compared PEP 503-normalised, other ecosystems
+    by exact name.  With an *index*, versions fetched within *max_age*
+    seconds (even by an earlier run) are reused and new ones stored.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 16,
+        index: FleetIndex | None = None,
+        max_age: float = DEFAULT_MAX_AGE,
+    ) -> None:
+        self._ecosystems = {eco.name: eco for eco in all_ecosystems()}
+        self._index = index
+        self._max_age = max_age
+        self._lookups: dict[tuple[str, str], asyncio.Task[str]] = {}
+        self._concurrency = concurrency
+        self._sem: asyncio.Semaphore | None = None
+        self.fetched = 0
+
+    async def _fetch(self, ecosystem: str, name: str) -> str:
+        if self._index is not None:
+            stored = self._index.latest(ecosystem, name, self._max_age)
+            if stored is not None:
+                return stored
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._concurrency)
+        async with self._sem:
+            self.fetched += 1
+            try:
+                versions = await self._ecosystems[ecosystem].fetch_latest_versions(
+                    [name]
+                )
+            except Exception:  # noqa: BLE001  (a failed lookup never fails the batch)
+                return ""
+        version = versions.get(name, "")
+        if self._index is not None and version:
+            self._index.store_latest(ecosystem, name, version)
+        return version
+
+    async def latest(self, ecosystem: str, names: Iterable[str]) -> dict[str, str]:
+        """Return ``{name: latest_version}`` (``""`` when unknown)."""
+        if ecosystem not in self._ecosystems:
+            return {}
+        tasks: dict[str, asyncio.Task[str]] = {}
+        for name in names:
+            key = (ecosystem, package_key(ecosystem, name))
+            task = self._lookups.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._fetch(ecosystem, name))
+                self._lookups[key] = task
+            tasks[name] = task
+        await asyncio.gather(*tasks.values())
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def annotate(self, scan: ScanSnapshot) -> ScanSnapshot:
+        """Return *scan* with ``latest_version`` set on every package."""
+        by_ecosystem: dict[str, list[str]] = {}
+        for pkg in scan.packages:
+            by_ecosystem.setdefault(pkg.ecosystem, []).append(pkg.name)
+        found: dict[tuple[str, str], str] = {}
+        for ecosystem, names in by_ecosystem.items():
+            latest = await self.latest(ecosystem, names)
+            found.update(
+                ((ecosystem, name), version) for name, version in latest.items()
+            )
+        return scan.with_latest(found)
+
+    def stats(self) -> dict[str, int]:
+        return {"distinct": len(self._lookups), "fetched": self.fetched}
+
+
+# =============================================================================
+# Driver
+# =============================================================================
+
+
+async def run_batch(
+    roots: list[str],
+    out: TextIO,
+    jobs: int | None = None,
+    latest: bool = False,
+    registry: RegistryCache | None = None,
+    index: FleetIndex | None = None,
+) -> dict[str, int]:
+    """Scan *roots* in a process pool, writing one JSON line per root to *out*.
+
+    Lines are written in completion order (each carries its ``root``).
+    Workers are spawned rather than forked, so they never inherit the
+    threads used for registry lookups.  With an *index*, roots whose
+    manifests are unchanged since they were stored are answered from it
+    without a worker, and fresh scans are stored.  Returns summary
+    counters.
+    """
+    loop = asyncio.get_running_loop()
+    registry = registry or RegistryCache(index=index)
+    summary = {"roots": 0, "packages": 0, "errors": 0, "cached": 0}
+
+    async def _emit(root: str, pending: asyncio.Future[ScanSnapshot]) -> None:
+        try:
+            scan = await pending
+        except Exception as exc:  # noqa: BLE001  (worker crash becomes an error record)
+            scan = ScanSnapshot(root, errors=(f"worker: {exc}",))
+        if index is not None and not scan.errors:
+            index.store(scan)
+        await _emit_cached(scan)
+
+    async def _emit_cached(scan: ScanSnapshot) -> None:
+        if latest:
+            scan = await registry.annotate(scan)
+        out.write(json.dumps(scan.to_json(), separators=(",", ":")) + "\n")
+        out.flush()
+        summary["roots"] += 1
+        summary["packages"] += len(scan.packages)
+        summary["errors"] += bool(scan.errors)
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+        async with asyncio.TaskGroup() as tg:
+            for root in roots:
+                cached = index.cached_record(root) if index is not None else None
+                if cached is not None:
+                    summary["cached"] += 1
+                    tg.create_task(_emit_cached(cached))
+                    continue
+                scan = loop.run_in_executor(pool, scan_root, root)
+                tg.create_task(_emit(root, scan))
+
+    if latest:
+        summary.update({f"registry_{k}": v for k, v in registry.stats().items()})
+    return summary
+
+
+def _read_roots(path: str) -> list[str]:
+    if path == "-":
+        lines = sys.stdin.readlines()
+    else:
+        with open(path, encoding="utf-8") as fh:
+            lines = fh.readlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="pydep --batch",
+        description="Scan project roots headlessly and print JSON Lines.",
+    )
+    parser.add_argument("roots", nargs="*", help="project directories to scan")
+    parser.add_argument(
+        "--roots-file", help="file with one root per line ('-' reads stdin)"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="worker processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--latest",
+        action="store_true",
+        help="annotate packages with their latest registry version",
+    )
+    parser.add_argument("-o", "--output", help="write to this file instead of stdout")
+    parser.add_argument(
+        "--index",
+        help="SQLite fleet index: reuse unchanged scans and store new ones",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=DEFAULT_MAX_AGE / 3600,
+        help="hours a stored latest version stays fresh (default: 24)",
+    )
+    args = parser.parse_args(argv)
+
+    roots = list(args.roots)
+    if args.roots_file:
+        roots.extend(_read_roots(args.roots_file))
+    if not roots:
+        parser.error("no project roots given")
+
+    index = FleetIndex(args.index) if args.index else None
+    registry = RegistryCache(index=index, max_age=args.max_age * 3600)
+    with contextlib.ExitStack() as stack:
+        if index is not None:
+            stack.callback(index.close)
+        out = (
+            stack.enter_context(open(args.output, "w", encoding="utf-8"))
+            if args.output
+            else sys.stdout
+        )
+        summary = asyncio.run(
+            run_batch(roots, out, args.jobs, args.latest, registry, index)
+        )
+    print(" ".join(f"{key}={value}" for key, value in summary.items()), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,20 +5,23 @@ from pathlib import Path
 from base import Ecosystem
 
 
-def detect_all(path: Path) -> list[Ecosystem]:
-    """Scan directory, return list of detected ecosystems in priority order."""
+def all_ecosystems() -> list[Ecosystem]:
+    """Return a fresh instance of every supported ecosystem, in priority order."""
     from ecosystems.python import PythonEcosystem
     from ecosystems.javascript import JavaScriptEcosystem
     from ecosystems.go import GoEcosystem
 
-    all_ecosystems = [
+    return [
         PythonEcosystem(),
         JavaScriptEcosystem(),
         GoEcosystem(),
     ]
 
+
+def detect_all(path: Path) -> list[Ecosystem]:
+    """Scan directory, return list of detected ecosystems in priority order."""
     detected = []
-    for eco in all_ecosystems:
+    for eco in all_ecosystems():
         if eco.detect(path):
             detected.append(eco)
 
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Identity of a file's contents: stat data plus an optional content hash."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    digest: str = ""
+
+
+def fingerprint(path: Path, hash_contents: bool = False) -> FileFingerprint | None:
+    """Return the fingerprint of *path*, or ``None`` if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    digest = ""
+    if hash_contents:
+        try:
+            digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        except OSError:
+            return None
+    return FileFingerprint(str(path), st.st_mtime_ns, st.st_size, digest)
+
+
+class ParseCache:
+    """Memoise per-file parser results until the file's fingerprint changes.
+
+    Entries are keyed by ``(parser, path)`` so one file can be fed to several
+    parsers.  Missing files are cached too (with a ``None`` fingerprint), so a
+    refresh only re-runs the parsers whose inputs were created, edited or
+    deleted since the last call.  Set *hash_contents* to also compare a
+    content hash, which catches edits that keep both size and mtime.
+
+    The cache is safe to share between worker threads; parsers themselves
+    run outside the lock.
+    """
+
+    def __init__(self, hash_contents: bool = False) -> None:
+        self._hash_contents = hash_contents
+        self._entries: dict[tuple[Callable[..., Any], str], tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, parser: Callable[[Path], T]) -> T:
+        """Return ``parser(path)``, reusing the cached result when unchanged."""
+        key = (parser, str(path))
+        fp = fingerprint(path, self._hash_contents)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fp:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        result = parser(path)
+        with self._lock:
+            self._entries[key] = (fp, result)
+        return result
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Drop cached entries for *path*, or everything when *path* is ``None``."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            target = str(path)
+            for key in [k for k in self._entries if k[1] == target]:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, int]:
+        """Return hit / miss counters and the current entry count."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+def approx_size(obj: Any) -> int:
+    """Approximate deep size in bytes of *obj* (containers, strings, numbers).
+
+    Shared objects are counted once.  Good enough to bound a cache, not an
+    exact accounting of the interpreter's memory.
+    """
+    seen: set[int] = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
+class MetadataCache:
+    """Bounded LRU cache with per-entry expiry, for registry/package metadata.
+
+    Entries expire *ttl* seconds after they were stored.  Once more than
+    *max_entries* entries or more than *max_bytes* (by :func:`approx_size`)
+    are held, the least recently used entries are evicted.  Keys are any
+    hashable; callers use ``(ecosystem, kind, name)`` tuples so one cache
+    can serve every lookup of a session.
+
+    The cache is safe to share between worker threads.  *clock* is
+    injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (expires at, size, value), least recently used first
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._live(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _live(self, key: Hashable) -> tuple[float, int, Any] | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._clock():
+            self._drop(key)
+            return None
+        return entry
+
+    def _drop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for *key* (marking it recently used)."""
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store *value*, evicting least recently used entries over budget."""
+        size = approx_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (self._clock() + self.ttl, size, value)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    async def fetch(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+        keep: Callable[[T], bool] = lambda value: value is not None,
+    ) -> T:
+        """Return the cached value for *key*, or await *factory* and cache it.
+
+        Results for which *keep* is false (failed lookups, by default
+        ``None``) are returned but not cached, so they are retried.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+        value = await factory()
+        if keep(value):
+            self.put(key, value)
+        return value
+
+    def invalidate(self, match: Callable[[Hashable], bool] | None = None) -> None:
+        """Drop entries whose key satisfies *match*, or everything."""
+        with self._lock:
+            if match is None:
+                self._entries.clear()
+                self.bytes = 0
+                return
+            for key in [k for k in self._entries if match(k)]:
+                self._drop(key)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit / miss / eviction counters, entry count and size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+            }
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import re
 import shutil
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import NamedTuple
 
 import requests
 
-from base import Ecosystem, Package, DepSource, RegistryPackageInfo, EnvInfo
+from base import Ecosystem, EnvInfo, Package, RegistryPackageInfo
+from ecosystems.cache import ParseCache
+from ecosystems.merge import merge_packages
+from ecosystems.pep508 import version_key
 
 # === Registry Constants ===
 GO_PROXY = "https://proxy.golang.org"
@@ -56,6 +63,207 @@ async def _get_go_version() -> str:
         return ""
 
 
+# === Parsing ===
+# Every file is read once and walked in a single pass by _directives();
+# the readers below are cached per file by the ecosystem's ParseCache.
+
+
+class GoRequire(NamedTuple):
+    path: str
+    version: str
+    indirect: bool
+
+
+class GoReplace(NamedTuple):
+    """Target of a ``replace``; *version* is empty for local directories."""
+
+    path: str
+    version: str
+
+
+@dataclass
+class GoModFile:
+    """Directives from one ``go.mod`` (or, for ``uses``, ``go.work``).
+
+    ``replaces`` is keyed by ``"path@version"`` for version-specific
+    replacements and by ``"path"`` for replacements of every version.
+    """
+
+    module: str = ""
+    requires: list[GoRequire] = field(default_factory=list)
+    replaces: dict[str, GoReplace] = field(default_factory=dict)
+    excludes: set[tuple[str, str]] = field(default_factory=set)
+    uses: list[str] = field(default_factory=list)
+
+
+@dataclass
+class GoSum:
+    """Index of ``go.sum`` entries.
+
+    ``versions`` maps each module to every version listed, including those
+    that only have a ``/go.mod`` hash (needed for the module graph but never
+    downloaded); ``downloaded`` holds the versions with a full module hash.
+    """
+
+    versions: dict[str, set[str]] = field(default_factory=dict)
+    downloaded: dict[str, set[str]] = field(default_factory=dict)
+
+    def update(self, other: GoSum) -> None:
+        for module, versions in other.versions.items():
+            self.versions.setdefault(module, set()).update(versions)
+        for module, versions in other.downloaded.items():
+            self.downloaded.setdefault(module, set()).update(versions)
+
+
+def _unquote(token: str) -> str:
+    return token[1:-1] if len(token) >= 2 and token[0] == token[-1] == '"' else token
+
+
+def _directives(text: str) -> Iterator[tuple[str, list[str], str]]:
+    """Yield ``(verb, args, comment)`` for each directive, blocks expanded."""
+    block: str | None = None
+    for raw in text.splitlines():
+        line, _, comment = raw.partition("//")
+        tokens = line.split()
+        if not tokens:
+            continue
+        if block is not None:
+            if tokens == [")"]:
+                block = None
+            else:
+                yield block, [_unquote(t) for t in tokens], comment
+            continue
+        if tokens[-1].endswith("(") and len(tokens) <= 2:
+            block = tokens[0].removesuffix("(")
+            continue
+        yield tokens[0], [_unquote(t) for t in tokens[1:]], comment
+
+
+def _parse_replace(args: list[str], into: dict[str, GoReplace]) -> None:
+    if "=>" not in args:
+        return
+    arrow = args.index("=>")
+    old, new = args[:arrow], args[arrow + 1 :]
+    if not old or not new:
+        return
+    key = f"{old[0]}@{old[1]}" if len(old) > 1 else old[0]
+    into[key] = GoReplace(new[0], new[1] if len(new) > 1 else "")
+
+
+def _parse_go_directives(text: str) -> GoModFile:
+    parsed = GoModFile()
+    for verb, args, comment in _directives(text):
+        if verb == "module" and args:
+            parsed.module = args[0]
+        elif verb == "require" and len(args) >= 2:
+            indirect = "indirect" in comment
+            parsed.requires.append(GoRequire(args[0], args[1], indirect))
+        elif verb == "replace":
+            _parse_replace(args, parsed.replaces)
+        elif verb == "exclude" and len(args) >= 2:
+            parsed.excludes.add((args[0], args[1]))
+        elif verb == "use" and args:
+            parsed.uses.append(args[0])
+    return parsed
+
+
+def _read_go_directives_file(path: Path) -> GoModFile:
+    """Parse go.mod or go.work: module, require, replace, exclude and use."""
+    if not path.exists():
+        return GoModFile()
+    return _parse_go_directives(path.read_text(encoding="utf-8", errors="replace"))
+
+
+def _read_go_sum(path: Path) -> GoSum:
+    """Index go.sum (or go.work.sum) as module -> set of versions."""
+    index = GoSum()
+    if not path.exists():
+        return index
+    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
+        parts = line.split()
+        if len(parts) < 3:
+            continue
+        module, version = parts[0], parts[1]
+        mod_only = version.endswith("/go.mod")
+        version = version.removesuffix("/go.mod")
+        index.versions.setdefault(module, set()).add(version)
+        if not mod_only:
+            index.downloaded.setdefault(module, set()).add(version)
+    return index
+
+
+def _next_allowed(
+    module: str, version: str, excludes: set[tuple[str, str]], sums: GoSum
+) -> str:
+    """Version Go selects when *version* is excluded: the next higher one."""
+    want = version_key(version)
+    candidates = [
+        (key, v)
+        for v in sums.versions.get(module, ())
+        if (module, v) not in excludes
+        and (key := version_key(v)) is not None
+        and (want is None or key > want)
+    ]
+    return min(candidates)[1] if candidates else ""
+
+
+def _resolve_go(root: Path, cache: ParseCache) -> list[tuple[str, str, str, str]]:
+    """Return ``(module, source_label, specifier, installed)`` for *root*.
+
+    With a ``go.work`` every ``use``d module is read and labels are prefixed
+    by its directory; ``go.work`` replaces take precedence over those in
+    each ``go.mod``.  Excluded versions are bumped to the next version known
+    to ``go.sum``.  When any ``go.sum`` exists, a module only counts as
+    installed if its module hash (not just ``/go.mod``) is present.
+    """
+    work = cache.get(root / "go.work", _read_go_directives_file)
+    if work.uses:
+        dirs = [Path(os.path.normpath(use)).as_posix() for use in work.uses]
+    else:
+        dirs = ["."]
+
+    sums = GoSum()
+    have_sums = False
+    for sum_path in [root / "go.work.sum"] + [root / d / "go.sum" for d in dirs]:
+        if sum_path.is_file():
+            have_sums = True
+            sums.update(cache.get(sum_path, _read_go_sum))
+
+    mods = [(d, cache.get(root / d / "go.mod", _read_go_directives_file)) for d in dirs]
+    local = {mod.module: d for d, mod in mods if mod.module}
+    excludes: set[tuple[str, str]] = set()
+    for _, mod in mods:
+        excludes |= mod.excludes
+
+    raw: list[tuple[str, str, str, str]] = []
+    for rel, mod in mods:
+        replaces = {**mod.replaces, **work.replaces}
+        for req in mod.requires:
+            label = "indirect" if req.indirect else "main"
+            if rel != ".":
+                label = f"{rel}/{label}"
+            version = req.version
+            if (req.path, version) in excludes:
+                version = _next_allowed(req.path, version, excludes, sums)
+            rep = replaces.get(f"{req.path}@{req.version}") or replaces.get(req.path)
+            spec = req.version
+            target, installed = req.path, version
+            if req.path in local:
+                spec = f"{req.version} => ./{local[req.path]}"
+                installed = ""
+            elif rep is not None:
+                spec = f"{req.version} => {' '.join(filter(None, rep))}"
+                target, installed = rep.path, rep.version
+            if (
+                installed
+                and have_sums
+                and installed not in sums.downloaded.get(target, ())
+            ):
+                installed = ""
+            raw.append((req.path, label, spec, installed))
+    return raw
+
+
 # === Package Manager ===
 
 
@@ -118,79 +326,21 @@ class GoEcosystem(Ecosystem):
 
     def __init__(self) -> None:
         self._go_mgr = GoManager()
+        self._parse_cache = ParseCache()
 
     def detect(self, path: Path) -> bool:
-        return (path / "go.mod").exists()
+        return (path / "go.mod").exists() or (path / "go.work").exists()
 
     # === Parsing ===
 
-    async def _parse_go_mod(self, path: Path) -> list[tuple[str, str, bool]]:
-        """Parse go.mod for require statements."""
-        if not path.exists():
-            return []
-
-        deps = []
-        content = path.read_text()
-        in_require = False
-
-        for line in content.splitlines():
-            line = line.strip()
-
-            if line.startswith("require ("):
-                in_require = True
-                continue
-            elif line == ")" and in_require:
-                in_require = False
-                continue
-
-            if in_require or line.startswith("require "):
-                if line.startswith("require "):
-                    line = line[8:].strip()
-
-                # Parse "module v1.2.3" or "module v1.2.3 // indirect"
-                parts = line.split()
-                if len(parts) >= 2:
-                    module = parts[0]
-                    version = parts[1]
-                    is_indirect = "// indirect" in line
-                    deps.append((module, version, is_indirect))
-
-        return deps
-
-    async def _parse_go_sum(self, path: Path) -> dict[str, str]:
-        """Parse go.sum for module hashes (optional)."""
-        if not path.exists():
-            return {}
-        # go.sum format: module version hash
-        result = {}
-        for line in path.read_text().splitlines():
-            parts = line.split()
-            if len(parts) >= 2:
-                module = parts[0]
-                version = parts[1]
-                result[module] = version
-        return result
-
     async def load_dependencies(self, path: Path) -> list[Package]:
-        """Scan for Go module dependencies."""
-        deps = await self._parse_go_mod(path / "go.mod")
-
-        merged: dict[str, Package] = {}
-        for module, version, is_indirect in deps:
-            source_label = "indirect" if is_indirect else "main"
-            if module not in merged:
-                merged[module] = Package(
-                    name=module,
-                    sources=[DepSource(file=source_label, specifier=version)],
-                    installed_version=version,
-                    ecosystem=self,
-                )
-            else:
-                merged[module].sources.append(
-                    DepSource(file=source_label, specifier=version)
-                )
+        """Scan for Go module dependencies (go.work, go.mod, go.sum).
+
+        All files are parsed in a worker thread and cached until they change.
+        """
+        raw = await asyncio.to_thread(_resolve_go, path, self._parse_cache)
 
-        return sorted(merged.values(), key=lambda p: p.name.lower())
+        return merge_packages(raw, ecosystem=self)
 
     # === Package Manager ===
 
@@ -283,3 +433,6 @@ class GoEcosystem(Ecosystem):
 
     def get_docs_url(self, name: str) -> str:
         return f"https://pkg.go.dev/{name}"
+
+    def debug_stats(self) -> dict[str, int]:
+        return {f"parse_cache_{k}": v for k, v in self._parse_cache.stats().items()}
@@ -7,7 +7,16 @@ from pathlib import Path
 
 import requests
 
-from base import Ecosystem, Package, DepSource, RegistryPackageInfo, EnvInfo
+from base import Ecosystem, Package, RegistryPackageInfo, EnvInfo
+from ecosystems.cache import ParseCache
+from ecosystems.jslock import (
+    LockReadStats,
+    read_package_lock,
+    read_pnpm_lock,
+    read_yarn_lock,
+    yarn_versions,
+)
+from ecosystems.merge import merge_packages
 
 # === Registry Constants ===
 NPM_REGISTRY = "https://registry.npmjs.org"
@@ -71,6 +80,30 @@ async def _get_npm_version() -> str:
         return ""
 
 
+# === Parsing ===
+
+
+def _read_package_json(path: Path) -> list[tuple[str, str, str]]:
+    """Parse package.json dependencies."""
+    if not path.exists():
+        return []
+    try:
+        data = json.loads(path.read_text())
+    except Exception:
+        return []
+    deps = []
+    for group in [
+        "dependencies",
+        "devDependencies",
+        "peerDependencies",
+        "optionalDependencies",
+    ]:
+        if group in data:
+            for name, spec in data[group].items():
+                deps.append((name, spec, group))
+    return deps
+
+
 # === Package Manager ===
 
 
@@ -129,6 +162,8 @@ class JavaScriptEcosystem(Ecosystem):
 
     def __init__(self) -> None:
         self._npm_mgr = NpmManager()
+        self._lock_stats: LockReadStats | None = None
+        self._parse_cache = ParseCache()
 
     def detect(self, path: Path) -> bool:
         return (path / "package.json").exists()
@@ -136,72 +171,58 @@ class JavaScriptEcosystem(Ecosystem):
     # === Parsing ===
 
     async def _parse_package_json(self, path: Path) -> list[tuple[str, str, str]]:
-        """Parse package.json dependencies."""
-        if not path.exists():
-            return []
-        try:
-            data = json.loads(path.read_text())
-        except Exception:
-            return []
-        deps = []
-        for group in [
-            "dependencies",
-            "devDependencies",
-            "peerDependencies",
-            "optionalDependencies",
-        ]:
-            if group in data:
-                for name, spec in data[group].items():
-                    deps.append((name, spec, group))
-        return deps
-
-    async def _parse_package_lock(self, path: Path) -> dict[str, str]:
-        """Parse package-lock.json for installed versions."""
-        if not path.exists():
-            return {}
-        try:
-            data = json.loads(path.read_text())
-        except Exception:
-            return {}
-        result = {}
-        packages = data.get("packages", {})
-        for pkg_path, info in packages.items():
-            if pkg_path == "":
-                continue
-            if "node_modules/" in pkg_path:
-                name = pkg_path.split("node_modules/")[-1]
-                if "/" in name:
-                    name = name.split("/")[0]
-                version = info.get("version", "")
-                if name and version:
-                    result[name] = version
-        if not result:
-            deps = data.get("dependencies", {})
-            for name, info in deps.items():
-                version = info.get("version", "")
-                if version:
-                    result[name] = version
-        return result
+        """Parse package.json dependencies (off the event loop)."""
+        return await asyncio.to_thread(_read_package_json, path)
+
+    async def _parse_package_lock(
+        self, path: Path, names: list[str] | None = None
+    ) -> dict[str, str]:
+        """Stream package-lock.json for installed versions (off the event loop).
+
+        Only the entries for *names* are decoded; see
+        :func:`ecosystems.jslock.read_package_lock`.
+        """
+        versions, self._lock_stats = await asyncio.to_thread(
+            read_package_lock, path, names
+        )
+        return versions
+
+    async def _parse_lockfile(
+        self, path: Path, deps: list[tuple[str, str, str]]
+    ) -> dict[str, str]:
+        """Installed versions from whichever lockfile the project uses.
+
+        ``package-lock.json`` wins, then ``pnpm-lock.yaml``, then
+        ``yarn.lock``.  The pnpm and yarn readers stream the file and are
+        memoised per fingerprint, so an unchanged lock is not re-read.
+        """
+        if (path / "package-lock.json").is_file():
+            return await self._parse_package_lock(
+                path / "package-lock.json", [name for name, _, _ in deps]
+            )
+        if (path / "pnpm-lock.yaml").is_file():
+            return await asyncio.to_thread(
+                self._parse_cache.get, path / "pnpm-lock.yaml", read_pnpm_lock
+            )
+        if (path / "yarn.lock").is_file():
+            entries = await asyncio.to_thread(
+                self._parse_cache.get, path / "yarn.lock", read_yarn_lock
+            )
+            return yarn_versions(entries, [(name, spec) for name, spec, _ in deps])
+        return {}
 
     async def load_dependencies(self, path: Path) -> list[Package]:
         """Scan for JavaScript dependencies."""
         deps = await self._parse_package_json(path / "package.json")
-        lock_versions = await self._parse_package_lock(path / "package-lock.json")
-
-        merged: dict[str, Package] = {}
-        for name, spec, group in deps:
-            if name not in merged:
-                installed = lock_versions.get(name, "")
-                merged[name] = Package(
-                    name=name,
-                    sources=[DepSource(file=group, specifier=spec)],
-                    installed_version=installed,
-                    ecosystem=self,
-                )
-            else:
-                merged[name].sources.append(DepSource(file=group, specifier=spec))
-
-        return sorted(merged.values(), key=lambda p: p.name.lower())
+        lock_versions = await self._parse_lockfile(path, deps)
+
+        return merge_packages(
+            (
+                (name, group, spec, lock_versions.get(name, ""))
+                for name, spec, group in deps
+            ),
+            ecosystem=self,
+        )
 
     # === Package Manager ===
 
@@ -299,3 +320,15 @@ class JavaScriptEcosystem(Ecosystem):
 
     def get_docs_url(self, name: str) -> str:
         return f"https://www.npmjs.com/package/{name}"
+
+    def debug_stats(self) -> dict[str, int]:
+        result = {f"parse_cache_{k}": v for k, v in self._parse_cache.stats().items()}
+        stats = self._lock_stats
+        if stats is not None:
+            result.update(
+                lock_parse_ms=round(stats.elapsed_ms),
+                lock_entries=stats.entries,
+            )
+            if stats.peak_bytes is not None:
+                result["lock_peak_kib"] = stats.peak_bytes // 1024
+        return result
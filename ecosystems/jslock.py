@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import json
+import mmap
+import re
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+# Top-level install entries in lockfile v2/v3 ``packages``:
+#   "node_modules/<name>": {      or      "node_modules/@scope/<name>": {
+# Nested installs ("node_modules/a/node_modules/b") and workspace paths
+# ("packages/x/node_modules/b") never match because the key must start
+# right after the opening quote and end after a single name segment.
+_TOP_LEVEL_KEY_RE = re.compile(rb'"node_modules/((?:@[^"/]+/)?[^"/]+)"\s*:\s*\{')
+
+_INITIAL_WINDOW = 4096
+
+
+@dataclass
+class LockReadStats:
+    """Timing and memory figures for one lockfile read."""
+
+    path: str
+    elapsed_ms: float = 0.0
+    peak_bytes: int | None = None  # None when memory was not measured
+    entries: int = 0
+    streamed: bool = True
+
+
+def _decode_object(buf: mmap.mmap, start: int) -> dict | None:
+    """Decode the JSON object beginning at byte offset *start* of *buf*.
+
+    Only a small window is materialised; it grows geometrically until the
+    object fits, so memory stays proportional to the entry, not the file.
+    """
+    decoder = json.JSONDecoder()
+    size = len(buf)
+    window = _INITIAL_WINDOW
+    while True:
+        end = min(start + window, size)
+        chunk = buf[start:end].decode("utf-8", errors="replace")
+        try:
+            obj, _ = decoder.raw_decode(chunk)
+        except json.JSONDecodeError:
+            if end >= size:
+                return None
+            window *= 4
+            continue
+        return obj if isinstance(obj, dict) else None
+
+
+def _read_v1(path: Path, wanted: set[str] | None) -> dict[str, str]:
+    """Fallback for lockfile v1, which has no flat ``packages`` map."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    result: dict[str, str] = {}
+    for name, info in data.get("dependencies", {}).items():
+        if wanted is not None and name not in wanted:
+            continue
+        version = info.get("version", "") if isinstance(info, dict) else ""
+        if version:
+            result[name] = version
+    return result
+
+
+def read_package_lock(
+    path: Path,
+    names: Iterable[str] | None = None,
+    measure_memory: bool = False,
+) -> tuple[dict[str, str], LockReadStats]:
+    """Return ``({name: version}, stats)`` for top-level installs in *path*.
+
+    The file is memory-mapped and scanned for ``node_modules/<name>`` keys;
+    only entries whose name is in *names* (or every top-level entry when
+    *names* is ``None``) are decoded, and the scan stops once all requested
+    names are found.  *stats* records wall time and the peak Python heap
+    used by the read.  Heap tracking is costly, so it only happens when
+    *measure_memory* is set or :mod:`tracemalloc` is already tracing (e.g.
+    ``PYTHONTRACEMALLOC=1``); otherwise ``peak_bytes`` stays ``None``.
+    """
+    stats = LockReadStats(path=str(path))
+    if not path.is_file():
+        return {}, stats
+
+    wanted = set(names) if names is not None else None
+    if wanted is not None and not wanted:
+        return {}, stats
+    already_tracing = tracemalloc.is_tracing()
+    track_memory = measure_memory or already_tracing
+    started_tracing = track_memory and not already_tracing
+    if started_tracing:
+        tracemalloc.start()
+    elif track_memory:
+        tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+
+    result: dict[str, str] = {}
+    try:
+        with open(path, "rb") as fh:
+            if fh.seek(0, 2) == 0:
+                return {}, stats
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                if buf.find(b'"packages"') == -1:
+                    stats.streamed = False
+                    result = _read_v1(path, wanted)
+                else:
+                    for m in _TOP_LEVEL_KEY_RE.finditer(buf):
+                        name = m.group(1).decode("utf-8", errors="replace")
+                        if name in result:
+                            continue
+                        if wanted is not None and name not in wanted:
+                            continue
+                        info = _decode_object(buf, m.end() - 1)
+                        version = info.get("version", "") if info else ""
+                        if version:
+                            result[name] = version
+                            if wanted is not None and len(result) == len(wanted):
+                                break
+    except (OSError, ValueError):
+        result = {}
+    finally:
+        stats.elapsed_ms = (time.perf_counter() - t0) * 1000
+        if track_memory:
+            stats.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+
+    stats.entries = len(result)
+    return result, stats
+
+
+# -- pnpm-lock.yaml -----------------------------------------------------------
+# Only the root project's dependency maps are needed, and pnpm writes them
+# before the (much larger) ``packages:`` / ``snapshots:`` sections, so the
+# reader stops as soon as it reaches those.  Layouts handled:
+#
+#   v5:  dependencies:            v6:  dependencies:       v9:  importers:
+#          react: 18.2.0                 react:                   .:
+#                                          specifier: ^18           dependencies:
+#                                          version: 18.2.0            react:
+#                                                                       version: 18.2.0
+
+_PNPM_DEP_SECTIONS = frozenset(
+    {"dependencies", "devDependencies", "optionalDependencies", "peerDependencies"}
+)
+_PNPM_STOP_SECTIONS = frozenset({"packages", "snapshots"})
+
+
+def _yaml_key(text: str) -> tuple[str, str]:
+    """Split ``key: value`` and unquote the key."""
+    key, _, value = text.partition(":")
+    return key.strip().strip("'\""), value.strip()
+
+
+def _pnpm_version(value: str) -> str:
+    """Strip peer suffixes (``1.0.0(react@18)``, v5 ``1.0.0_react@18``).
+
+    ``link:``/``file:`` and aliased (``/name/1.0.0``) references yield ``""``.
+    """
+    value = value.strip("'\"").split("(", 1)[0].split("_", 1)[0]
+    if not value or ":" in value or value.startswith("/"):
+        return ""
+    return value
+
+
+def _read_lines(path: Path) -> Iterator[str]:
+    """Stream the lines of *path*; an unreadable file yields none."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as fh:
+            yield from fh
+    except OSError:
+        return
+
+
+def read_pnpm_lock(path: Path) -> dict[str, str]:
+    """Return ``{name: version}`` for the root project in ``pnpm-lock.yaml``.
+
+    The file is streamed line by line; package snapshots are never read.
+    """
+    result: dict[str, str] = {}
+    entry_indent = -1  # indent of dependency names in the current map
+    importer_indent = -1  # indent of the root importer's sections (v6+)
+    in_importers = False
+    current = ""  # name whose nested ``version:`` is pending
+    for line in _read_lines(path):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip(" "))
+        key, value = _yaml_key(stripped)
+
+        if indent == 0:
+            current = ""
+            entry_indent = 2 if key in _PNPM_DEP_SECTIONS else -1
+            in_importers = key == "importers"
+            importer_indent = -1
+            if key in _PNPM_STOP_SECTIONS:
+                break
+            continue
+        if in_importers and indent == 2:
+            current = ""
+            entry_indent = -1
+            importer_indent = 4 if key == "." else -1
+            continue
+        if importer_indent != -1 and indent == importer_indent:
+            current = ""
+            entry_indent = indent + 2 if key in _PNPM_DEP_SECTIONS else -1
+            continue
+        if entry_indent == -1:
+            continue
+        if indent == entry_indent:
+            current = ""
+            if value:
+                version = _pnpm_version(value)
+                if version:
+                    result.setdefault(key, version)
+            else:
+                current = key
+        elif current and indent > entry_indent and key == "version":
+            version = _pnpm_version(value)
+            if version:
+                result.setdefault(current, version)
+            current = ""
+    return result
+
+
+# -- yarn.lock ----------------------------------------------------------------
+# Classic (v1) and Berry (v2+) share an indentation-based layout: a header
+# line listing every descriptor resolved by the entry, then the entry's
+# fields.  Only ``version`` is kept.
+#
+#   v1:     "lodash@^4.17.0", lodash@^4.17.21:
+#             version "4.17.21"
+#   berry:  "lodash@npm:^4.17.0, lodash@npm:^4.17.21":
+#             version: 4.17.21
+
+
+def _descriptor_name(descriptor: str) -> str:
+    """``"@scope/pkg@npm:^1"`` -> ``"@scope/pkg"``."""
+    at = descriptor.find("@", 1)
+    return descriptor[:at] if at > 0 else descriptor
+
+
+def read_yarn_lock(path: Path) -> dict[str, str]:
+    """Return ``{descriptor: version}`` for every entry in ``yarn.lock``.
+
+    Descriptors are kept as written (``name@range`` for v1,
+    ``name@npm:range`` for Berry); see :func:`yarn_versions` to resolve
+    declared dependencies against them.  The file is streamed line by line.
+    """
+    result: dict[str, str] = {}
+    descriptors: list[str] = []
+    for line in _read_lines(path):
+        if not line.strip() or line.startswith("#"):
+            continue
+        if not line[0].isspace():
+            header = line.rstrip().removesuffix(":")
+            descriptors = [
+                d.strip().strip("\"'") for d in header.split(",") if d.strip()
+            ]
+            if descriptors == ["__metadata"]:
+                descriptors = []
+            continue
+        if not descriptors:
+            continue
+        field_line = line.strip()
+        if field_line.startswith("version"):
+            rest = field_line[len("version") :]
+            if rest[:1] not in (" ", ":"):
+                continue
+            version = rest.lstrip(": ").strip("\"'")
+            for descriptor in descriptors:
+                result[descriptor] = version
+            descriptors = []
+    return result
+
+
+def yarn_versions(
+    entries: dict[str, str], declared: Iterable[tuple[str, str]]
+) -> dict[str, str]:
+    """Resolve ``(name, range)`` pairs against :func:`read_yarn_lock` output.
+
+    The entry for the exact declared range wins; otherwise the first entry
+    locked for that name is used.
+    """
+    by_name: dict[str, str] = {}
+    for descriptor, version in entries.items():
+        by_name.setdefault(_descriptor_name(descriptor), version)
+    result: dict[str, str] = {}
+    for name, spec in declared:
+        version = (
+            entries.get(f"{name}@{spec}")
+            or entries.get(f"{name}@npm:{spec}")
+            or by_name.get(name, "")
+        )
+        if version:
+            result[name] = version
+    return result
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+try:
+    import tomllib
+except ModuleNotFoundError:
+    try:
+        import tomli as tomllib
+    except ModuleNotFoundError:
+        tomllib = None
+
+from base import normalise_name
+from ecosystems.pep508 import parse_requirement
+
+# Persisted indexes live next to the PyPI name index.
+CACHE_DIR = Path.home() / ".cache" / "pydep" / "locks"
+
+# Bump when the on-disk layout of LockIndex changes.
+INDEX_FORMAT = 1
+
+# Oldest persisted indexes beyond this count are pruned on write.
+MAX_PERSISTED = 64
+
+
+@dataclass
+class LockIndex:
+    """Compact, precompiled view of a lockfile.
+
+    All maps are keyed by normalised package name.  ``sources`` holds the
+    lockfile's source descriptor flattened to ``"<kind>+<location>"``
+    (e.g. ``"registry+https://pypi.org/simple"``, ``"editable+."``) and
+    ``deps`` the direct dependency edges of every locked package.
+    """
+
+    digest: str
+    versions: dict[str, str] = field(default_factory=dict)
+    sources: dict[str, str] = field(default_factory=dict)
+    deps: dict[str, list[str]] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "format": INDEX_FORMAT,
+            "digest": self.digest,
+            "versions": self.versions,
+            "sources": self.sources,
+            "deps": self.deps,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> LockIndex | None:
+        if data.get("format") != INDEX_FORMAT:
+            return None
+        return cls(
+            digest=data.get("digest", ""),
+            versions=data.get("versions", {}),
+            sources=data.get("sources", {}),
+            deps=data.get("deps", {}),
+        )
+
+
+def content_digest(data: bytes) -> str:
+    """Return the hex content hash used to key persisted indexes."""
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _flatten_source(source: Any) -> str:
+    if not isinstance(source, dict) or not source:
+        return ""
+    kind, location = next(iter(source.items()))
+    return f"{kind}+{location}"
+
+
+def build_uv_lock_index(data: dict[str, Any], digest: str) -> LockIndex:
+    """Compile parsed ``uv.lock`` TOML into a :class:`LockIndex`."""
+    index = LockIndex(digest=digest)
+    for pkg in data.get("package", []):
+        key = normalise_name(pkg.get("name", ""))
+        if not key:
+            continue
+        version = pkg.get("version", "")
+        if version:
+            index.versions[key] = version
+        source = _flatten_source(pkg.get("source"))
+        if source:
+            index.sources[key] = source
+        edges = [
+            normalise_name(dep["name"])
+            for dep in pkg.get("dependencies", [])
+            if isinstance(dep, dict) and dep.get("name")
+        ]
+        if edges:
+            index.deps[key] = edges
+    return index
+
+
+def build_poetry_lock_index(data: dict[str, Any], digest: str) -> LockIndex:
+    """Compile parsed ``poetry.lock`` TOML into a :class:`LockIndex`."""
+    index = LockIndex(digest=digest)
+    for pkg in data.get("package", []):
+        key = normalise_name(pkg.get("name", ""))
+        if not key:
+            continue
+        version = pkg.get("version", "")
+        if version:
+            index.versions[key] = version
+        source = pkg.get("source")
+        if isinstance(source, dict) and source.get("type"):
+            index.sources[key] = f"{source['type']}+{source.get('url', '')}"
+        edges = [normalise_name(name) for name in pkg.get("dependencies", {})]
+        if edges:
+            index.deps[key] = edges
+    return index
+
+
+def build_pdm_lock_index(data: dict[str, Any], digest: str) -> LockIndex:
+    """Compile parsed ``pdm.lock`` TOML into a :class:`LockIndex`."""
+    index = LockIndex(digest=digest)
+    for pkg in data.get("package", []):
+        key = normalise_name(pkg.get("name", ""))
+        if not key:
+            continue
+        version = pkg.get("version", "")
+        if version:
+            index.versions[key] = version
+        for kind in ("editable", "path", "git", "url"):
+            if pkg.get(kind):
+                index.sources[key] = f"{kind}+{pkg[kind]}"
+                break
+        edges = [
+            req.key
+            for req in map(parse_requirement, pkg.get("dependencies", []))
+            if req is not None
+        ]
+        if edges:
+            index.deps[key] = edges
+    return index
+
+
+def build_pipfile_lock_index(data: dict[str, Any], digest: str) -> LockIndex:
+    """Compile parsed ``Pipfile.lock`` JSON into a :class:`LockIndex`.
+
+    Pipfile.lock records no dependency edges, so ``deps`` stays empty.
+    """
+    index = LockIndex(digest=digest)
+    for section in ("default", "develop"):
+        for name, info in data.get(section, {}).items():
+            key = normalise_name(name)
+            if not isinstance(info, dict) or key in index.versions:
+                continue
+            version = info.get("version", "")
+            if isinstance(version, str) and version.startswith("=="):
+                index.versions[key] = version[2:]
+            for kind in ("editable", "path", "git", "file", "index"):
+                if info.get(kind):
+                    location = (
+                        info.get("path", "") if kind == "editable" else info[kind]
+                    )
+                    index.sources[key] = f"{kind}+{location}"
+                    break
+    return index
+
+
+def _read_persisted(cache_file: Path) -> LockIndex | None:
+    try:
+        return LockIndex.from_json(json.loads(cache_file.read_text()))
+    except (OSError, ValueError):
+        return None
+
+
+def _persist(cache_file: Path, index: LockIndex) -> None:
+    """Write *index* atomically; failures only cost a re-parse next time."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index.to_json(), separators=(",", ":")))
+        os.replace(tmp, cache_file)
+        stale = sorted(
+            cache_file.parent.glob("*.json"), key=lambda p: p.stat().st_mtime
+        )
+        for old in stale[:-MAX_PERSISTED]:
+            old.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _load_index(
+    lock_path: Path,
+    kind: str,
+    decode: Callable[[bytes], Any],
+    build: Callable[[Any, str], LockIndex],
+    cache_dir: Path | None,
+) -> LockIndex | None:
+    """Hash *lock_path* and return its persisted index, compiling on a miss."""
+    if not lock_path.is_file():
+        return None
+    try:
+        raw = lock_path.read_bytes()
+    except OSError:
+        return None
+    digest = content_digest(raw)
+    cache_file = (cache_dir or CACHE_DIR) / f"{kind}-{digest}.json"
+
+    index = _read_persisted(cache_file)
+    if index is not None and index.digest == digest:
+        return index
+
+    try:
+        data = decode(raw)
+    except ValueError:  # malformed JSON/TOML or undecodable bytes
+        return None
+    if not isinstance(data, dict):
+        return None
+    index = build(data, digest)
+    _persist(cache_file, index)
+    return index
+
+
+def _decode_toml(raw: bytes) -> Any:
+    if tomllib is None:
+        raise ValueError("no TOML parser available")
+    return tomllib.loads(raw.decode("utf-8"))
+
+
+def load_uv_lock_index(
+    lock_path: Path, cache_dir: Path | None = None
+) -> LockIndex | None:
+    """Return the :class:`LockIndex` for ``uv.lock`` at *lock_path*.
+
+    The lock is hashed and, if an index for that hash was persisted by an
+    earlier run, it is loaded without touching TOML.  Otherwise the lock is
+    parsed, compiled and the index written to *cache_dir* (default
+    :data:`CACHE_DIR`).  Returns ``None`` when the file is missing or
+    unparsable.
+    """
+    return _load_index(lock_path, "uv", _decode_toml, build_uv_lock_index, cache_dir)
+
+
+def load_lock_index(lock_path: Path, cache_dir: Path | None = None) -> LockIndex | None:
+    """Return the :class:`LockIndex` for any supported lockfile.
+
+    The format is chosen by file name (see :data:`LOCK_FILES`); persistence
+    works as for :func:`load_uv_lock_index`.
+    """
+    spec = _LOADERS.get(lock_path.name)
+    if spec is None:
+        return None
+    kind, decode, build = spec
+    return _load_index(lock_path, kind, decode, build, cache_dir)
+
+
+_LOADERS: dict[str, tuple[str, Callable[[bytes], Any], Callable[..., LockIndex]]] = {
+    "uv.lock": ("uv", _decode_toml, build_uv_lock_index),
+    "poetry.lock": ("poetry", _decode_toml, build_poetry_lock_index),
+    "pdm.lock": ("pdm", _decode_toml, build_pdm_lock_index),
+    "Pipfile.lock": ("pipfile", json.loads, build_pipfile_lock_index),
+}
+
+# Lockfiles in the order a project's installed versions are taken from.
+LOCK_FILES = tuple(_LOADERS)
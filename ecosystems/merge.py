@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from base import DepSource, Ecosystem, Package, package_key
+
+# (name, source label, specifier, installed version or "")
+Declaration = tuple[str, str, str, str]
+
+
+def merge_packages(
+    rows: Iterable[Declaration],
+    key: Callable[[str], str] | None = None,
+    ecosystem: Ecosystem | None = None,
+    package_cls: type = Package,
+    source_cls: type = DepSource,
+) -> list[Any]:
+    """Merge declarations into one package per ``key(name)``, sorted by name.
+
+    Runs in linear time: packages and ``(key, file, specifier)`` pairs are
+    deduplicated through hash lookups, never by scanning a package's
+    sources.  The first declaration of a package fixes its display name;
+    sources keep first-seen order and the first non-empty installed version
+    wins.  The result is sorted once, case-insensitively and stably, so
+    names differing only in case keep first-seen order.
+
+    *package_cls* and *source_cls* let callers with their own model (the
+    legacy single-ecosystem path in ``app``) reuse the engine.
+    """
+    merged: dict[str, Any] = {}
+    seen: set[tuple[str, str, str]] = set()
+    for name, file, specifier, installed in rows:
+        k = key(name) if key is not None else name
+        pkg = merged.get(k)
+        if pkg is None:
+            pkg = merged[k] = package_cls(
+                name=name, sources=[], installed_version=installed
+            )
+            if ecosystem is not None:
+                pkg.ecosystem = ecosystem
+                pkg.key = package_key(ecosystem.name, name)
+        elif installed and not pkg.installed_version:
+            pkg.installed_version = installed
+        marker = (k, file, specifier)
+        if marker not in seen:
+            seen.add(marker)
+            pkg.sources.append(source_cls(file=file, specifier=specifier))
+    return sorted(merged.values(), key=lambda p: p.name.lower())
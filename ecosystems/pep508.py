@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from base import normalise_name
+
+_NAME_RE = re.compile(r"\s*([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*")
+_EXTRAS_RE = re.compile(r"\[([^\]]*)\]\s*")
+_CLAUSE_RE = re.compile(r"(~=|===|==|!=|<=|>=|<|>)\s*([A-Za-z0-9.*+!_-]+)")
+_EXTRA_NAME_RE = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?")
+
+# Bound on memoised requirement strings (a few MB at most).
+_CACHE_SIZE = 1 << 16
+
+
+class Requirement(NamedTuple):
+    """A parsed PEP 508 requirement.
+
+    ``specifier`` is normalised (no whitespace, clauses joined by ``,``) and
+    empty when unconstrained; ``url`` is set for ``name @ url`` direct
+    references; ``marker`` holds the raw environment marker text.
+    """
+
+    name: str
+    key: str
+    extras: tuple[str, ...]
+    specifier: str
+    marker: str | None
+    url: str | None
+
+
+def _parse_specifier(text: str) -> str | None:
+    """Normalise a comma-separated specifier list; ``None`` if malformed."""
+    text = text.strip()
+    if text.startswith("(") and text.endswith(")"):
+        text = text[1:-1].strip()
+    if not text:
+        return ""
+    clauses: list[str] = []
+    for part in text.split(","):
+        m = _CLAUSE_RE.fullmatch(part.strip())
+        if not m:
+            return None
+        clauses.append(m.group(1) + m.group(2))
+    return ",".join(clauses)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_requirement(raw: str) -> Requirement | None:
+    """Parse a PEP 508 requirement string; ``None`` if it is not one.
+
+    Results are memoised by the raw string, so the same declaration seen by
+    the loaders, the removal helpers and the outdated check is parsed once
+    per process.  A trailing `` # comment`` is ignored.
+    """
+    text = raw.split(" #", 1)[0].split("\t#", 1)[0]
+    m = _NAME_RE.match(text)
+    if not m:
+        return None
+    name = m.group(1)
+    pos = m.end()
+
+    extras: tuple[str, ...] = ()
+    em = _EXTRAS_RE.match(text, pos)
+    if em:
+        parts = [e.strip() for e in em.group(1).split(",") if e.strip()]
+        if not all(_EXTRA_NAME_RE.fullmatch(e) for e in parts):
+            return None
+        extras = tuple(normalise_name(e) for e in parts)
+        pos = em.end()
+
+    rest = text[pos:]
+    marker: str | None = None
+    url: str | None = None
+    specifier = ""
+
+    if rest.startswith("@"):
+        # Direct reference: the URL ends at whitespace; a marker must be
+        # separated from it by whitespace before the ";".
+        ref = rest[1:].strip()
+        if not ref:
+            return None
+        url, _, tail = ref.partition(" ")
+        tail = tail.strip()
+        if tail:
+            if not tail.startswith(";"):
+                return None
+            marker = tail[1:].strip() or None
+    else:
+        spec_text, sep, marker_text = rest.partition(";")
+        parsed = _parse_specifier(spec_text)
+        if parsed is None:
+            return None
+        specifier = parsed
+        if sep:
+            marker = marker_text.strip() or None
+
+    return Requirement(
+        name=name,
+        key=normalise_name(name),
+        extras=extras,
+        specifier=specifier,
+        marker=marker,
+        url=url,
+    )
+
+
+def name_and_specifier(raw: str) -> tuple[str, str] | None:
+    """Return ``(name, display_specifier)`` for a requirement string.
+
+    The display specifier is the version specifier (``"*"`` when absent),
+    or ``"@ <url>"`` for direct references, followed by ``"; <marker>"``
+    when an environment marker is present.
+    """
+    req = parse_requirement(raw)
+    if req is None:
+        return None
+    spec = f"@ {req.url}" if req.url else req.specifier or "*"
+    if req.marker:
+        spec = f"{spec}; {req.marker}"
+    return req.name, spec
+
+
+# -- Version matching ---------------------------------------------------------
+# Enough of PEP 440 to answer "does this pinned version satisfy that
+# specifier" for fleet queries; also accepts Go's leading "v".
+
+_VERSION_RE = re.compile(
+    r"v?(?:\d+!)?(?P<release>\d+(?:\.\d+)*)"
+    r"(?:[-_.]?(?P<pre>a|b|c|rc|alpha|beta|pre|preview)[-_.]?(?P<pre_n>\d*))?"
+    r"(?:[-_.]?(?:post|rev|r)[-_.]?(?P<post>\d*))?"
+    r"(?:[-_.]?dev[-_.]?(?P<dev>\d*))?"
+    r"(?:\+[A-Za-z0-9.]*)?",
+    re.IGNORECASE,
+)
+_PRE_RANK = {"a": -3, "alpha": -3, "b": -2, "beta": -2}
+
+
+def _release(text: str) -> tuple[int, ...]:
+    parts = [int(p) for p in text.split(".")]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def version_key(version: str) -> tuple | None:
+    """Return a sortable key for *version*, or ``None`` if unparsable."""
+    m = _VERSION_RE.fullmatch(version.strip())
+    if not m:
+        return None
+    if m.group("pre"):
+        pre = (_PRE_RANK.get(m.group("pre").lower(), -1), int(m.group("pre_n") or 0))
+    elif m.group("dev") is not None and m.group("post") is None:
+        pre = (-4, 0)  # 1.0.dev1 sorts before 1.0a1
+    else:
+        pre = (0, 0)
+    post = int(m.group("post") or 0) if m.group("post") is not None else -1
+    dev = int(m.group("dev") or 0) if m.group("dev") is not None else float("inf")
+    return (_release(m.group("release")), pre, post, dev)
+
+
+def _is_pre(key: tuple) -> bool:
+    """Whether a :func:`version_key` is a pre- or development release."""
+    return key[1] != (0, 0) or key[3] != float("inf")
+
+
+def _prefix_match(version: str, prefix: str) -> bool:
+    vm = _VERSION_RE.fullmatch(version.strip())
+    if not vm:
+        return False
+    want = [int(p) for p in prefix.split(".") if p]
+    have = [int(p) for p in vm.group("release").split(".")]
+    have += [0] * (len(want) - len(have))
+    return have[: len(want)] == want
+
+
+def _clause_matches(version: str, op: str, target: str) -> bool:
+    if op == "===":
+        return version.strip() == target
+    if target.endswith(".*"):
+        if op not in ("==", "!="):
+            return False
+        matched = _prefix_match(version, target[:-2])
+        return matched if op == "==" else not matched
+    have, want = version_key(version), version_key(target)
+    if have is None or want is None:
+        return False
+    if op == "~=":
+        release = target.split("+")[0].split(".")
+        prefix = ".".join(release[:-1]) if len(release) > 1 else release[0]
+        return have >= want and _prefix_match(version, prefix)
+    # PEP 440 exclusive ordering: ``<V`` excludes pre-releases of V and
+    # ``>V`` excludes post-releases and local versions of V, unless V is
+    # one itself
+    if op == "<" and have[0] == want[0] and _is_pre(have) and not _is_pre(want):
+        return False
+    if op == ">" and have[0] == want[0]:
+        if have[2] != -1 and want[2] == -1:
+            return False
+        if "+" in version and "+" not in target:
+            return False
+    return {
+        "==": have == want,
+        "!=": have != want,
+        "<": have < want,
+        "<=": have <= want,
+        ">": have > want,
+        ">=": have >= want,
+    }[op]
+
+
+def version_matches(version: str, specifier: str) -> bool:
+    """Return True if *version* satisfies every clause of *specifier*.
+
+    An empty specifier (or ``"*"``) matches any parsable version.
+    """
+    spec = _parse_specifier("" if specifier.strip() == "*" else specifier)
+    if spec is None or version_key(version) is None:
+        return False
+    return all(
+        _clause_matches(version, *_CLAUSE_RE.fullmatch(clause).groups())
+        for clause in spec.split(",")
+        if clause
+    )
@@ -4,14 +4,23 @@ import ast
 import asyncio
 import configparser
 import json
+import os
 import re
 import shutil
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import requests
 
-from base import DepSource, Ecosystem, Package, RegistryPackageInfo, EnvInfo
+from base import Ecosystem, EnvInfo, Package, RegistryPackageInfo
+from base import normalise_name as _normalise
+from ecosystems.cache import ParseCache
+from ecosystems.lockindex import LOCK_FILES, LockIndex, load_lock_index
+from ecosystems.merge import merge_packages
+from ecosystems.pep508 import name_and_specifier as _parse_dep_string
+from ecosystems.sitepackages import SitePackagesIndex
 
 try:
     import tomllib
@@ -22,47 +31,26 @@ except ModuleNotFoundError:
         tomllib = None
 
 
-_DEP_RE = re.compile(
-    r"^\s*(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)"
-    r"(?:\[.*?\])?"  # optional extras
-    r"\s*(?P<spec>(?:[><=!~]+\s*[A-Za-z0-9.*+!_-]+\s*,?\s*)*)"
-)
-
-
-def _normalise(name: str) -> str:
-    """PEP 503 normalisation (lowercase, hyphens/underscores/dots -> -)."""
-    return re.sub(r"[-_.]+", "-", name).lower()
-
+def _parse_lock(lock_path: Path) -> dict[str, str]:
+    """Parse a lockfile and return a ``{normalised_name: version}`` map.
 
-def _parse_dep_string(raw: str) -> tuple[str, str] | None:
-    """Extract ``(name, specifier)`` from a PEP 508 dependency string."""
-    m = _DEP_RE.match(raw)
-    if not m:
-        return None
-    name = m.group("name")
-    spec = m.group("spec").strip() or "*"
-    return name, spec
+    Backed by the persisted :class:`~ecosystems.lockindex.LockIndex`, so an
+    unchanged lock is not re-parsed across runs.  ``uv.lock``,
+    ``poetry.lock``, ``pdm.lock`` and ``Pipfile.lock`` are understood.
+    """
+    index = load_lock_index(lock_path)
+    return index.versions if index is not None else {}
 
 
-def _parse_lock(lock_path: Path) -> dict[str, str]:
-    """Parse ``uv.lock`` and return a ``{normalised_name: version}`` map.
+def _find_lock(path: Path) -> Path:
+    """Return the project's lockfile (first of :data:`LOCK_FILES` present).
 
-    ``uv.lock`` is a TOML file with repeated ``[[package]]`` tables.
+    Falls back to ``uv.lock`` so a missing lock is still cached as missing.
     """
-    if not lock_path.is_file() or tomllib is None:
-        return {}
-    try:
-        with open(lock_path, "rb") as fh:
-            data = tomllib.load(fh)
-    except Exception:
-        return {}
-    result: dict[str, str] = {}
-    for pkg in data.get("package", []):
-        name = _normalise(pkg.get("name", ""))
-        version = pkg.get("version", "")
-        if name and version:
-            result[name] = version
-    return result
+    for name in LOCK_FILES:
+        if (path / name).is_file():
+            return path / name
+    return path / "uv.lock"
 
 
 def _parse_pyproject(path: Path) -> list[tuple[str, str, str]]:
@@ -105,25 +93,163 @@ def _parse_pyproject(path: Path) -> list[tuple[str, str, str]]:
     return results
 
 
-def _parse_requirements(path: Path) -> list[tuple[str, str, str]]:
-    """Parse a ``requirements.txt``-style file (line-by-line)."""
-    if not path.is_file():
-        return []
-    results: list[tuple[str, str, str]] = []
-    label = path.name
-    try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-    except Exception:
-        return []
+# ``--hash`` options (``pip-compile --generate-hashes``) are located with a
+# search rather than by splitting, so hash-only continuation lines are
+# dropped without slicing out their payloads.
+_HASH_OPT_RE = re.compile(r"(?:^|\s)--hash[=\s]")
+_HASH_VALUE_RE = re.compile(r"--hash[=\s]\s*([^\s\\]+)")
+_COMMENT_LINE_RE = re.compile(r"\s*#")
+
+
+def _iter_requirement_lines(
+    lines: Iterable[str], keep_hashes: bool = False
+) -> Iterator[tuple[str, list[str]]]:
+    """Yield ``(logical_line, hashes)`` from physical requirements lines.
+
+    Backslash continuations are joined, full-line comments dropped and
+    ``--hash`` options cut out of the logical line.  Hash values are only
+    collected when *keep_hashes* is set; otherwise *hashes* is always
+    empty.  Works in a single pass over any line iterable (typically an
+    open file), so memory is bounded by the longest logical line.
+    """
+    parts: list[str] = []
+    hashes: list[str] = []
     for line in lines:
-        line = line.strip()
-        # skip blank, comments, flags (-r, -e, --index-url, etc.)
-        if not line or line.startswith("#") or line.startswith("-"):
+        if not parts and _COMMENT_LINE_RE.match(line):
             continue
-        parsed = _parse_dep_string(line)
-        if parsed:
-            results.append((parsed[0], parsed[1], label))
-    return results
+        line = line.rstrip()
+        continued = line.endswith("\\")
+        if continued:
+            line = line[:-1]
+        m = _HASH_OPT_RE.search(line)
+        if m:
+            if keep_hashes:
+                hashes.extend(_HASH_VALUE_RE.findall(line, m.start()))
+            line = line[: m.start()]
+        if line and not line.isspace():
+            parts.append(line.strip())
+        if continued:
+            continue
+        if parts:
+            yield " ".join(parts), hashes
+        parts, hashes = [], []
+    if parts:
+        yield " ".join(parts), hashes
+
+
+class _RequirementsFile(NamedTuple):
+    """Parsed contents of one requirements file, before include resolution."""
+
+    entries: list[tuple[str, str]]
+    includes: list[str]  # -r / --requirement targets, as written
+    constraints: list[str]  # -c / --constraint targets, as written
+    hashes: dict[str, list[str]]  # normalised name -> hashes, when requested
+
+
+_INCLUDE_OPTS = {"-r": "includes", "--requirement": "includes"}
+_INCLUDE_OPTS.update({"-c": "constraints", "--constraint": "constraints"})
+
+
+def _split_include(line: str) -> tuple[str, str] | None:
+    """Return ``(kind, target)`` for an include/constraint line, else ``None``."""
+    for opt, kind in _INCLUDE_OPTS.items():
+        if not line.startswith(opt):
+            continue
+        rest = line[len(opt) :]
+        if opt.startswith("--"):
+            if not rest or rest[0] not in " \t=":
+                continue
+            rest = rest.lstrip("=")
+        target = rest.strip().split(" #", 1)[0].strip()
+        return (kind, target) if target else None
+    return None
+
+
+def _scan_requirements_file(path: Path, keep_hashes: bool = False) -> _RequirementsFile:
+    """Parse one requirements file, collecting ``-r`` / ``-c`` targets.
+
+    The file is streamed through :func:`_iter_requirement_lines`; set
+    *keep_hashes* to also record each requirement's ``--hash`` values.
+    """
+    scanned = _RequirementsFile([], [], [], {})
+    if not path.is_file():
+        return scanned
+    try:
+        with open(path, encoding="utf-8", errors="replace") as fh:
+            for line, hashes in _iter_requirement_lines(fh, keep_hashes):
+                if line.startswith("-"):
+                    # -r / -c are followed; other flags (-e, --index-url, ...)
+                    # are skipped
+                    include = _split_include(line)
+                    if include:
+                        getattr(scanned, include[0]).append(include[1])
+                    continue
+                # drop remaining per-requirement options (--config-settings ...)
+                parsed = _parse_dep_string(line.split(" --", 1)[0])
+                if parsed:
+                    scanned.entries.append(parsed)
+                    if hashes:
+                        scanned.hashes[_normalise(parsed[0])] = hashes
+    except OSError:
+        return _RequirementsFile([], [], [], {})
+    return scanned
+
+
+def _parse_requirements(path: Path) -> list[tuple[str, str, str]]:
+    """Parse a single ``requirements.txt``-style file (includes not followed)."""
+    label = path.name
+    return [(name, spec, label) for name, spec in _scan_requirements_file(path).entries]
+
+
+def _resolve_requirements(
+    root: Path, cache: ParseCache | None = None
+) -> tuple[list[tuple[str, str, str]], dict[str, str]]:
+    """Parse ``requirements*.txt`` in *root*, following ``-r`` and ``-c``.
+
+    Returns ``(raw, provenance)``.  Included files are labelled by their
+    path relative to *root*; constraint files get a ``" [constraint]"``
+    suffix and only contribute pins for packages declared elsewhere (as
+    pip does).  *provenance* maps each included label to the label of the
+    file that first pulled it in.  Every file is parsed at most once, which
+    also breaks include cycles; *cache* lets unchanged files skip parsing
+    across refreshes.
+    """
+    requirements: list[tuple[str, str, str]] = []
+    constraints: list[tuple[str, str, str]] = []
+    provenance: dict[str, str] = {}
+    seen: set[Path] = set()
+
+    def _parse(path: Path) -> _RequirementsFile:
+        if cache is None:
+            return _scan_requirements_file(path)
+        return cache.get(path, _scan_requirements_file)
+
+    def _visit(path: Path, via: str | None, constraint: bool) -> None:
+        real = path.resolve()
+        if real in seen:
+            return
+        seen.add(real)
+        label = Path(os.path.relpath(path, root)).as_posix()
+        if via is not None:
+            provenance[label] = via
+        scanned = _parse(path)
+        if constraint:
+            constraints.extend(
+                (name, spec, f"{label} [constraint]") for name, spec in scanned.entries
+            )
+        else:
+            requirements.extend((name, spec, label) for name, spec in scanned.entries)
+        for target in scanned.includes:
+            _visit(path.parent / target, label, constraint)
+        for target in scanned.constraints:
+            _visit(path.parent / target, label, True)
+
+    for req_path in sorted(root.glob("requirements*.txt")):
+        _visit(req_path, None, False)
+
+    declared = {_normalise(name) for name, _, _ in requirements}
+    requirements.extend(c for c in constraints if _normalise(c[0]) in declared)
+    return requirements, provenance
 
 
 def _parse_setup_py(path: Path) -> list[tuple[str, str, str]]:
@@ -322,19 +448,29 @@ async def _search_pypi_index(query: str, limit: int = 10) -> list[tuple[str, str
 
 
 def _remove_from_requirements(path: Path, pkg_name: str) -> tuple[bool, str]:
-    """Remove a package line from a ``requirements.txt``-style file."""
+    """Remove a package line from a ``requirements.txt``-style file.
+
+    Backslash continuation lines belonging to the removed requirement
+    (e.g. its ``--hash`` options) are removed with it.
+    """
     if not path.is_file():
         return False, f"{path.name} not found"
     norm = _normalise(pkg_name)
     lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
     new_lines: list[str] = []
     removed = False
+    dropping = False
     for line in lines:
         stripped = line.strip()
+        if dropping:
+            dropping = stripped.endswith("\\")
+            continue
         if stripped and not stripped.startswith("#") and not stripped.startswith("-"):
-            parsed = _parse_dep_string(stripped)
+            text = stripped.removesuffix("\\")
+            parsed = _parse_dep_string(text.split(" --", 1)[0].strip())
             if parsed and _normalise(parsed[0]) == norm:
                 removed = True
+                dropping = stripped.endswith("\\")
                 continue
         new_lines.append(line)
     if not removed:
@@ -528,6 +664,9 @@ class PythonEcosystem(Ecosystem):
             self._pkg_mgr = PackageManager()
         except RuntimeError:
             self._pkg_mgr = None
+        self._parse_cache = ParseCache()
+        self._provenance: dict[str, str] = {}
+        self._site_packages = SitePackagesIndex()
 
     def detect(self, path: Path) -> bool:
         files = [
@@ -540,47 +679,58 @@ class PythonEcosystem(Ecosystem):
         return any((path / f).exists() for f in files)
 
     async def load_dependencies(self, path: Path) -> list[Package]:
-        """Scan for Python dependency sources and merge by normalized name."""
-        raw: list[tuple[str, str, str]] = []
-
-        # 1. pyproject.toml
-        raw.extend(_parse_pyproject(path / "pyproject.toml"))
-
-        # 2. requirements*.txt  (glob)
-        for req_path in sorted(path.glob("requirements*.txt")):
-            raw.extend(_parse_requirements(req_path))
-
-        # 3. setup.py
-        raw.extend(_parse_setup_py(path / "setup.py"))
-
-        # 4. setup.cfg
-        raw.extend(_parse_setup_cfg(path / "setup.cfg"))
-
-        # 5. Pipfile
-        raw.extend(_parse_pipfile(path / "Pipfile"))
-
-        # Merge by normalised name
-        lock_map = _parse_lock(path / "uv.lock")
-        merged: dict[str, Package] = {}
-
-        for name, spec, source_label in raw:
-            key = _normalise(name)
-            if key not in merged:
-                merged[key] = Package(
-                    name=name,
-                    sources=[],
-                    installed_version=lock_map.get(key, ""),
-                    ecosystem=self,
-                )
-            pkg = merged[key]
-            # Avoid duplicate source entries
-            dup = any(
-                s.file == source_label and s.specifier == spec for s in pkg.sources
-            )
-            if not dup:
-                pkg.sources.append(DepSource(file=source_label, specifier=spec))
+        """Scan for Python dependency sources and merge by normalized name.
+
+        Every source file (and the lockfile) is parsed concurrently in worker
+        threads; results are merged in the fixed order of
+        :meth:`_source_jobs`, so the output does not depend on which parser
+        finishes first.
+        """
+        jobs = await asyncio.to_thread(self._source_jobs, path)
+        *parsed, lock_map = await asyncio.gather(
+            *(asyncio.to_thread(job) for job in jobs),
+            asyncio.to_thread(self._lock_versions, path),
+        )
+        raw = [entry for chunk in parsed for entry in chunk]
+        return self._merge(raw, lock_map)
+
+    def _source_jobs(
+        self, path: Path
+    ) -> list[Callable[[], list[tuple[str, str, str]]]]:
+        """Return one parse job per source, in merge order."""
+        cache = self._parse_cache
+        return [
+            # 1. pyproject.toml
+            partial(cache.get, path / "pyproject.toml", _parse_pyproject),
+            # 2. requirements*.txt  (glob, following -r / -c includes)
+            partial(self._parse_requirement_tree, path),
+            # 3. setup.py
+            partial(cache.get, path / "setup.py", _parse_setup_py),
+            # 4. setup.cfg
+            partial(cache.get, path / "setup.cfg", _parse_setup_cfg),
+            # 5. Pipfile
+            partial(cache.get, path / "Pipfile", _parse_pipfile),
+        ]
 
-        return sorted(merged.values(), key=lambda p: p.name.lower())
+    def _lock_versions(self, path: Path) -> dict[str, str]:
+        return self._parse_cache.get(_find_lock(path), _parse_lock)
+
+    def _parse_requirement_tree(self, path: Path) -> list[tuple[str, str, str]]:
+        raw, self._provenance = _resolve_requirements(path, self._parse_cache)
+        return raw
+
+    def _merge(
+        self, raw: list[tuple[str, str, str]], lock_map: dict[str, str]
+    ) -> list[Package]:
+        """Merge raw ``(name, spec, source)`` tuples by normalised name."""
+        return merge_packages(
+            (
+                (name, label, spec, lock_map.get(_normalise(name), ""))
+                for name, spec, label in raw
+            ),
+            key=_normalise,
+            ecosystem=self,
+        )
 
     async def remove(
         self, package: str, source: str, group: str | None = None
@@ -600,8 +750,10 @@ class PythonEcosystem(Ecosystem):
             # Group like "pyproject.toml [dev]"
             group_name = source.split("[")[1].rstrip("]")
             return await self._pkg_mgr.remove_from_group(package, group_name)
-        elif source == "requirements.txt" or source.startswith("requirements"):
-            return _remove_from_requirements(cwd / source, package)
+        elif source.endswith((".txt", ".txt [constraint]")):
+            # requirements*.txt and any -r / -c included file
+            path = cwd / source.removesuffix(" [constraint]")
+            return _remove_from_requirements(path, package)
         elif source == "setup.cfg":
             return _remove_from_setup_cfg(cwd / "setup.cfg", package)
         elif source == "Pipfile":
@@ -693,29 +845,9 @@ class PythonEcosystem(Ecosystem):
         }
 
     async def get_package_requires(self, name: str) -> list[str]:
-        """Get package dependencies via uv pip show."""
-        if self._pkg_mgr is None:
-            return []
-        try:
-            uv_path = self._pkg_mgr._uv
-            proc = await asyncio.create_subprocess_exec(
-                uv_path,
-                "pip",
-                "show",
-                name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-            if proc.returncode == 0:
-                for line in stdout.decode().splitlines():
-                    if line.startswith("Requires:"):
-                        reqs = line.split(":", 1)[1].strip()
-                        if reqs:
-                            return [r.strip() for r in reqs.split(",")]
-        except Exception:
-            pass
-        return []
+        """Get package dependencies from the environment's dist-info METADATA."""
+        info = await asyncio.to_thread(self._site_packages.get, Path.cwd(), name)
+        return info.requires() if info is not None else []
 
     async def get_env_info(self) -> EnvInfo:
         """Get environment information for Python ecosystem."""
@@ -734,3 +866,17 @@ class PythonEcosystem(Ecosystem):
 
     def get_docs_url(self, name: str) -> str:
         return f"https://pypi.org/project/{name}/"
+
+    def source_provenance(self) -> dict[str, str]:
+        return dict(self._provenance)
+
+    def lock_index(self, path: Path) -> LockIndex | None:
+        """Return the compiled lockfile index for the project at *path*."""
+        return self._parse_cache.get(_find_lock(path), load_lock_index)
+
+    def debug_stats(self) -> dict[str, int]:
+        stats = {f"parse_cache_{k}": v for k, v in self._parse_cache.stats().items()}
+        stats.update(
+            {f"site_packages_{k}": v for k, v in self._site_packages.stats().items()}
+        )
+        return stats
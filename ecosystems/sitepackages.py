@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from base import normalise_name
+from ecosystems.pep508 import parse_requirement
+
+
+class DistInfo(NamedTuple):
+    """One installed distribution, read from its ``*.dist-info/METADATA``."""
+
+    name: str
+    version: str
+    requires_dist: tuple[str, ...]
+
+    def requires(self) -> list[str]:
+        """Names of unconditional requirements, as ``uv pip show`` lists them.
+
+        Requirements only pulled in by an extra are left out.
+        """
+        names: list[str] = []
+        for raw in self.requires_dist:
+            req = parse_requirement(raw)
+            if req is None or (req.marker and "extra" in req.marker):
+                continue
+            if req.name not in names:
+                names.append(req.name)
+        return names
+
+
+def read_metadata(path: Path) -> DistInfo | None:
+    """Read ``Name``, ``Version`` and ``Requires-Dist`` from a METADATA file.
+
+    Only the header block is read; the long description after the first
+    blank line never is.
+    """
+    name = version = ""
+    requires: list[str] = []
+    try:
+        with open(path, encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                if not line.strip():
+                    break
+                if line[0] in " \t":
+                    continue  # folded continuation of a previous header
+                key, _, value = line.partition(":")
+                value = value.strip()
+                if key == "Name":
+                    name = value
+                elif key == "Version":
+                    version = value
+                elif key == "Requires-Dist":
+                    requires.append(value)
+    except OSError:
+        return None
+    if not name:
+        return None
+    return DistInfo(name, version, tuple(requires))
+
+
+def find_environment(root: Path) -> Path | None:
+    """Return the environment for the project at *root*.
+
+    The project's ``.venv`` wins; otherwise the activated ``VIRTUAL_ENV``.
+    """
+    venv = root / ".venv"
+    if venv.is_dir():
+        return venv
+    active = os.environ.get("VIRTUAL_ENV")
+    if active and Path(active).is_dir():
+        return Path(active)
+    return None
+
+
+def site_packages_dirs(env: Path) -> list[Path]:
+    """``site-packages`` directories of the environment at *env*."""
+    dirs = sorted(env.glob("lib/python*/site-packages"))
+    windows = env / "Lib" / "site-packages"
+    if windows.is_dir():
+        dirs.append(windows)
+    return [d for d in dirs if d.is_dir()]
+
+
+class _DirState(NamedTuple):
+    mtime_ns: int
+    entries: dict[str, tuple[int, DistInfo | None]]  # dist-info dir name -> ...
+
+
+class SitePackagesIndex:
+    """Installed distributions of an environment, refreshed incrementally.
+
+    A ``site-packages`` directory is only re-listed when its mtime changes
+    (installing or removing a package adds or removes a ``*.dist-info``
+    directory), and on a re-list only ``*.dist-info`` directories that are
+    new or whose own mtime changed have their METADATA read again.
+
+    The index is safe to share between worker threads.
+    """
+
+    def __init__(self) -> None:
+        self._dirs: dict[str, _DirState] = {}
+        self._lock = threading.Lock()
+        self.listings = 0
+        self.reads = 0
+
+    def _scan_dir(self, site: Path) -> dict[str, tuple[int, DistInfo | None]]:
+        key = str(site)
+        try:
+            mtime = os.stat(site).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._dirs.pop(key, None)
+            return {}
+        with self._lock:
+            state = self._dirs.get(key)
+            if state is not None and state.mtime_ns == mtime:
+                return state.entries
+            self.listings += 1
+        previous = state.entries if state is not None else {}
+
+        entries: dict[str, tuple[int, DistInfo | None]] = {}
+        try:
+            with os.scandir(site) as it:
+                for entry in it:
+                    if not entry.name.endswith(".dist-info"):
+                        continue
+                    try:
+                        entry_mtime = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    cached = previous.get(entry.name)
+                    if cached is not None and cached[0] == entry_mtime:
+                        entries[entry.name] = cached
+                        continue
+                    with self._lock:
+                        self.reads += 1
+                    info = read_metadata(Path(entry.path) / "METADATA")
+                    entries[entry.name] = (entry_mtime, info)
+        except OSError:
+            return {}
+        with self._lock:
+            self._dirs[key] = _DirState(mtime, entries)
+        return entries
+
+    def distributions(self, root: Path) -> dict[str, DistInfo]:
+        """Return ``{normalised_name: DistInfo}`` for *root*'s environment."""
+        env = find_environment(root)
+        if env is None:
+            return {}
+        result: dict[str, DistInfo] = {}
+        for site in site_packages_dirs(env):
+            for _, info in self._scan_dir(site).values():
+                if info is not None:
+                    result.setdefault(normalise_name(info.name), info)
+        return result
+
+    def get(self, root: Path, name: str) -> DistInfo | None:
+        """Return the installed distribution *name* in *root*'s environment."""
+        return self.distributions(root).get(normalise_name(name))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"listings": self.listings, "reads": self.reads}
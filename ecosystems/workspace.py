@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+try:
+    import tomllib
+except ModuleNotFoundError:
+    try:
+        import tomli as tomllib
+    except ModuleNotFoundError:
+        tomllib = None
+
+from base import DepSource, Ecosystem, Package, package_key
+from ecosystems.go import _read_go_directives_file
+from ecosystems.merge import merge_packages
+
+# Directories never descended into, regardless of ignore files.
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
+
+# A directory holding any of these is a candidate member; the ecosystems'
+# own ``detect`` decides what it actually is.
+MANIFEST_NAMES = frozenset(
+    {
+        "pyproject.toml",
+        "requirements.txt",
+        "setup.py",
+        "setup.cfg",
+        "Pipfile",
+        "package.json",
+        "go.mod",
+    }
+)
+
+
+@dataclass(frozen=True)
+class _IgnoreRule:
+    """One ``.gitignore`` pattern, relative to the directory that holds it."""
+
+    base: str  # posix path of the .gitignore's directory, relative to root
+    pattern: str
+    anchored: bool
+    dir_only: bool
+
+    def matches(self, rel: str, name: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if not self.anchored:
+            return fnmatch.fnmatchcase(name, self.pattern)
+        if self.base:
+            if not rel.startswith(self.base + "/"):
+                return False
+            rel = rel[len(self.base) + 1 :]
+        return fnmatch.fnmatchcase(rel, self.pattern)
+
+
+def _read_ignore_rules(path: Path, base: str) -> list[_IgnoreRule]:
+    """Parse a ``.gitignore`` (negations are not supported and skipped)."""
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return []
+    rules: list[_IgnoreRule] = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(("#", "!")):
+            continue
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        rules.append(_IgnoreRule(base, line.lstrip("/"), anchored, dir_only))
+    return rules
+
+
+@dataclass
+class WorkspaceMember:
+    """A project directory inside a workspace."""
+
+    path: Path
+    rel: str  # posix path relative to the workspace root ("." for the root)
+    manifests: tuple[str, ...]
+    declared_by: str | None = None  # "uv workspace", "npm workspaces", "go.work"
+
+
+@dataclass
+class Workspace:
+    """Discovered members plus their aggregated dependencies."""
+
+    root: Path
+    members: list[WorkspaceMember] = field(default_factory=list)
+    packages: list[Package] = field(default_factory=list)
+
+
+def _scan_dir(
+    path: str, rel: str, rules: tuple[_IgnoreRule, ...]
+) -> tuple[list[str], list[tuple[str, str, tuple[_IgnoreRule, ...]]]]:
+    """List one directory: its manifest names and the subdirectories to visit."""
+    manifests: list[str] = []
+    subdirs: list[tuple[str, str]] = []
+    has_gitignore = False
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if name in MANIFEST_NAMES:
+                    manifests.append(name)
+                elif name == ".gitignore":
+                    has_gitignore = True
+                elif name not in SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, name))
+    except OSError:
+        return [], []
+    if has_gitignore:
+        rules = rules + tuple(
+            _read_ignore_rules(Path(path) / ".gitignore", "" if rel == "." else rel)
+        )
+    children = []
+    for child_path, name in subdirs:
+        child_rel = name if rel == "." else f"{rel}/{name}"
+        if any(rule.matches(child_rel, name, True) for rule in rules):
+            continue
+        children.append((child_path, child_rel, rules))
+    return manifests, children
+
+
+def walk_projects(root: Path, max_workers: int | None = None) -> list[WorkspaceMember]:
+    """Find every directory under *root* that holds a dependency manifest.
+
+    Directories are listed with :func:`os.scandir` on a thread pool, each
+    listing scheduling its subdirectories as soon as it completes.  Names
+    in :data:`SKIP_DIRS` and paths matched by ``.gitignore`` files along
+    the way are never entered; symlinked directories are not followed.
+    Results are sorted by relative path.
+    """
+    members: list[WorkspaceMember] = []
+    workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_dir, str(root), ".", ()): "."}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                rel = pending.pop(fut)
+                manifests, children = fut.result()
+                if manifests:
+                    members.append(
+                        WorkspaceMember(
+                            path=root if rel == "." else root / rel,
+                            rel=rel,
+                            manifests=tuple(sorted(manifests)),
+                        )
+                    )
+                for child_path, child_rel, rules in children:
+                    pending[pool.submit(_scan_dir, child_path, child_rel, rules)] = (
+                        child_rel
+                    )
+    members.sort(key=lambda m: (m.rel != ".", m.rel))
+    return members
+
+
+# === Workspace declarations ===
+
+
+def _glob_dirs(root: Path, pattern: str) -> set[Path]:
+    pattern = os.path.normpath(pattern.strip().rstrip("/"))
+    if not any(ch in pattern for ch in "*?["):
+        target = root / pattern
+        return {target.resolve()} if target.is_dir() else set()
+    return {m.resolve() for m in root.glob(pattern) if m.is_dir()}
+
+
+def _expand(
+    root: Path, patterns: list[str], exclude: list[str] | None = None
+) -> set[Path]:
+    """Expand workspace member globs relative to *root*, minus *exclude*."""
+    found: set[Path] = set()
+    for pattern in patterns:
+        if isinstance(pattern, str) and pattern.strip():
+            found |= _glob_dirs(root, pattern)
+    for pattern in exclude or []:
+        if isinstance(pattern, str) and pattern.strip():
+            found -= _glob_dirs(root, pattern)
+    return found
+
+
+def _uv_members(root: Path) -> set[Path]:
+    path = root / "pyproject.toml"
+    if not path.is_file() or tomllib is None:
+        return set()
+    try:
+        with open(path, "rb") as fh:
+            data = tomllib.load(fh)
+    except (OSError, ValueError):
+        return set()
+    ws = data.get("tool", {}).get("uv", {}).get("workspace", {})
+    return _expand(root, ws.get("members", []), ws.get("exclude", []))
+
+
+def _npm_members(root: Path) -> set[Path]:
+    path = root / "package.json"
+    if not path.is_file():
+        return set()
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return set()
+    workspaces = data.get("workspaces", []) if isinstance(data, dict) else []
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get("packages", [])
+    if not isinstance(workspaces, list):
+        return set()
+    patterns = [p for p in workspaces if isinstance(p, str) and not p.startswith("!")]
+    negated = [p[1:] for p in workspaces if isinstance(p, str) and p.startswith("!")]
+    return _expand(root, patterns, negated)
+
+
+def _go_work_members(root: Path) -> set[Path]:
+    """Return ``use`` directories from ``go.work`` (single or block form)."""
+    path = root / "go.work"
+    if not path.is_file():
+        return set()
+    try:
+        uses = _read_go_directives_file(path).uses
+    except OSError:
+        return set()
+    return _expand(root, uses)
+
+
+def declared_members(root: Path) -> dict[Path, str]:
+    """Return ``{resolved member dir: declaring tool}`` for *root*'s workspaces."""
+    declared: dict[Path, str] = {}
+    for label, finder in (
+        ("uv workspace", _uv_members),
+        ("npm workspaces", _npm_members),
+        ("go.work", _go_work_members),
+    ):
+        for member in finder(root):
+            declared.setdefault(member, label)
+    return declared
+
+
+def discover_members(root: Path) -> list[WorkspaceMember]:
+    """Walk *root* for projects and tag those declared by a workspace file.
+
+    Declared members that the walk skipped (e.g. under an ignored path)
+    are still included.
+    """
+    members = walk_projects(root)
+    declared = declared_members(root)
+    by_path = {m.path.resolve(): m for m in members}
+    for path, label in declared.items():
+        member = by_path.get(path)
+        if member is not None:
+            member.declared_by = label
+            continue
+        try:
+            manifests = tuple(
+                sorted(n for n in os.listdir(path) if n in MANIFEST_NAMES)
+            )
+        except OSError:
+            continue
+        if manifests:
+            rel = Path(os.path.relpath(path, root.resolve())).as_posix()
+            members.append(WorkspaceMember(path, rel, manifests, label))
+    members.sort(key=lambda m: (m.rel != ".", m.rel))
+    return members
+
+
+# === Aggregation ===
+
+
+def _relabel(pkg: Package, rel: str) -> Package:
+    if rel == ".":
+        return pkg
+    pkg.sources = [DepSource(f"{rel}/{s.file}", s.specifier) for s in pkg.sources]
+    return pkg
+
+
+async def _load_member(member: WorkspaceMember) -> list[Package]:
+    from ecosystems import detect_all
+
+    ecosystems: list[Ecosystem] = await asyncio.to_thread(detect_all, member.path)
+    results = await asyncio.gather(
+        *(eco.load_dependencies(member.path) for eco in ecosystems),
+        return_exceptions=True,
+    )
+    packages: list[Package] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            continue
+        packages.extend(_relabel(pkg, member.rel) for pkg in result)
+    return packages
+
+
+async def load_workspace(root: Path) -> Workspace:
+    """Discover *root*'s members and load them all concurrently.
+
+    Every member gets its own ecosystem instances, so per-load state never
+    crosses members.  Packages are merged per ``(ecosystem, name)`` with
+    source labels prefixed by the member's relative path, which makes the
+    Sources panel a per-member filter.  A member that fails to load is
+    skipped rather than failing the whole view.
+    """
+    members = await asyncio.to_thread(discover_members, root)
+    per_member = await asyncio.gather(*(_load_member(m) for m in members))
+
+    # a go.work root and its used modules report the same sources, which
+    # the merge engine drops as duplicates
+    by_ecosystem: dict[str, list[Package]] = {}
+    for packages in per_member:
+        for pkg in packages:
+            eco_name = pkg.ecosystem.name if pkg.ecosystem else ""
+            by_ecosystem.setdefault(eco_name, []).append(pkg)
+    packages = []
+    for eco_name, pkgs in by_ecosystem.items():
+        packages.extend(
+            merge_packages(
+                (
+                    (pkg.name, src.file, src.specifier, pkg.installed_version)
+                    for pkg in pkgs
+                    for src in pkg.sources
+                ),
+                key=partial(package_key, eco_name),
+                ecosystem=pkgs[0].ecosystem,
+            )
+        )
+    packages.sort(key=lambda p: p.name.lower())
+    return Workspace(root=root, members=members, packages=packages)
@@ -0,0 +1,367 @@
+"""
+PyDep fleet index
+=================
+
+Persistent SQLite store of batch scan results, so nightly rescans of many
+repositories only reparse what changed and fleet-wide questions are answered
+with indexed queries instead of rescans.
+
+* Each repository is fingerprinted by a content hash of its manifests and
+  lockfiles (plus any included files its last scan read).  Scans are stored
+  per hash, so unchanged repositories -- and identical checkouts -- reuse the
+  stored packages without being parsed again.
+* Latest registry versions are stored with their fetch time and only
+  refetched once older than the caller's maximum age.
+
+Usage::
+
+    python app.py --batch --index fleet.db --roots-file repos.txt
+    python fleet_index.py fleet.db requests "<2.31"
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import NamedTuple, Self
+
+from base import package_key
+from ecosystems.go import _read_go_directives_file
+from ecosystems.pep508 import version_matches
+from snapshot import PackageSnapshot, ScanSnapshot, SourceSnapshot
+
+# Bump when the schema changes; older databases are rebuilt from scratch.
+SCHEMA_VERSION = 1
+
+# Files whose contents feed the parsers (requirements*.txt is globbed).
+TRACKED_FILES = frozenset(
+    {
+        "pyproject.toml",
+        "setup.py",
+        "setup.cfg",
+        "Pipfile",
+        "Pipfile.lock",
+        "uv.lock",
+        "poetry.lock",
+        "pdm.lock",
+        "package.json",
+        "package-lock.json",
+        "pnpm-lock.yaml",
+        "yarn.lock",
+        "go.mod",
+        "go.sum",
+        "go.work",
+        "go.work.sum",
+    }
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS repos (
+    root        TEXT PRIMARY KEY,
+    digest      TEXT NOT NULL,
+    files       TEXT NOT NULL,      -- JSON list of hashed relative paths
+    scanned_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS repos_digest ON repos (digest);
+
+CREATE TABLE IF NOT EXISTS scans (
+    digest      TEXT PRIMARY KEY,
+    ecosystems  TEXT NOT NULL       -- JSON list of ecosystem names
+);
+
+CREATE TABLE IF NOT EXISTS packages (
+    id                INTEGER PRIMARY KEY,
+    digest            TEXT NOT NULL REFERENCES scans (digest) ON DELETE CASCADE,
+    ecosystem         TEXT NOT NULL,
+    name              TEXT NOT NULL,
+    key               TEXT NOT NULL,
+    installed_version TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS packages_key ON packages (key, ecosystem);
+CREATE INDEX IF NOT EXISTS packages_digest ON packages (digest);
+
+CREATE TABLE IF NOT EXISTS sources (
+    package_id  INTEGER NOT NULL REFERENCES packages (id) ON DELETE CASCADE,
+    file        TEXT NOT NULL,
+    specifier   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sources_package ON sources (package_id);
+
+CREATE TABLE IF NOT EXISTS latest (
+    ecosystem   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    fetched_at  REAL NOT NULL,
+    PRIMARY KEY (ecosystem, key)
+);
+"""
+
+
+class Pin(NamedTuple):
+    """One repository's resolved version of a package (see :meth:`pins`)."""
+
+    root: str
+    ecosystem: str
+    name: str
+    version: str
+    file: str
+    specifier: str
+
+
+def _tracked(root: Path, extra: list[str]) -> list[str]:
+    """Relative paths hashed for *root*: top-level manifests plus *extra*.
+
+    With a ``go.work``, the ``go.mod`` and ``go.sum`` of every ``use``d
+    module are tracked too (their source labels are not file paths).
+    """
+    names: set[str] = set()
+    try:
+        for name in os.listdir(root):
+            if name in TRACKED_FILES or fnmatch(name, "requirements*.txt"):
+                names.add(name)
+    except OSError:
+        pass
+    if "go.work" in names:
+        try:
+            uses = _read_go_directives_file(root / "go.work").uses
+        except OSError:
+            uses = []
+        for use in uses:
+            use_dir = Path(os.path.normpath(use)).as_posix()
+            for name in ("go.mod", "go.sum"):
+                rel = name if use_dir == "." else f"{use_dir}/{name}"
+                if (root / rel).is_file():
+                    names.add(rel)
+    names.update(rel for rel in extra if (root / rel).is_file())
+    return sorted(names)
+
+
+def manifest_digest(root: Path, files: list[str]) -> str:
+    """Content hash of *files* (relative to *root*), names included."""
+    h = hashlib.blake2b(digest_size=20)
+    for rel in files:
+        try:
+            data = (root / rel).read_bytes()
+        except OSError:
+            continue
+        h.update(rel.encode())
+        h.update(b"\0")
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _pinned_version(installed: str, specifier: str) -> str:
+    """Locked version, else the version of an exact ``==`` pin."""
+    if installed:
+        return installed
+    if specifier.startswith("==") and "," not in specifier and ";" not in specifier:
+        return specifier[2:].strip()
+    return ""
+
+
+class FleetIndex:
+    """SQLite-backed store of per-repository scan results."""
+
+    def __init__(self, path: Path | str) -> None:
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._db.executescript(
+                "DROP TABLE IF EXISTS sources; DROP TABLE IF EXISTS packages;"
+                "DROP TABLE IF EXISTS scans; DROP TABLE IF EXISTS repos;"
+                "DROP TABLE IF EXISTS latest;"
+            )
+        self._db.executescript(_SCHEMA)
+        self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    # -- scans -----------------------------------------------------------------
+
+    def cached_record(self, root: Path | str) -> ScanSnapshot | None:
+        """Return the stored scan of *root* if its manifests are unchanged."""
+        root = Path(root)
+        row = self._db.execute(
+            "SELECT digest, files FROM repos WHERE root = ?", (str(root),)
+        ).fetchone()
+        if row is None:
+            return None
+        digest, files = row
+        if manifest_digest(root, _tracked(root, json.loads(files))) != digest:
+            return None
+        scan = self._db.execute(
+            "SELECT ecosystems FROM scans WHERE digest = ?", (digest,)
+        ).fetchone()
+        if scan is None:
+            return None
+        return ScanSnapshot(
+            str(root), tuple(json.loads(scan[0])), self._packages(digest)
+        )
+
+    def _packages(self, digest: str) -> tuple[PackageSnapshot, ...]:
+        rows = self._db.execute(
+            "SELECT p.id, p.ecosystem, p.name, p.installed_version, s.file,"
+            " s.specifier FROM packages p LEFT JOIN sources s ON s.package_id = p.id"
+            " WHERE p.digest = ? ORDER BY p.id, s.rowid",
+            (digest,),
+        )
+        packages: dict[int, tuple[str, str, str, list[SourceSnapshot]]] = {}
+        for pid, ecosystem, name, installed, file, specifier in rows:
+            pkg = packages.get(pid)
+            if pkg is None:
+                pkg = packages[pid] = (ecosystem, name, installed, [])
+            if file is not None:
+                pkg[3].append(SourceSnapshot(file, specifier))
+        return tuple(
+            PackageSnapshot(eco, name, installed, tuple(sources))
+            for eco, name, installed, sources in packages.values()
+        )
+
+    def store(self, scan: ScanSnapshot) -> str:
+        """Store a fresh *scan* and return its manifest digest.
+
+        Source files outside the top-level manifests (e.g. ``-r`` includes)
+        are added to the repository's hashed set, so editing them also
+        invalidates the stored scan.
+        """
+        root = Path(scan.root)
+        # "constraints.txt [constraint]" -> "constraints.txt"
+        extra = {
+            src.file.split(" [", 1)[0] for pkg in scan.packages for src in pkg.sources
+        }
+        files = _tracked(root, sorted(extra))
+        digest = manifest_digest(root, files)
+        with self._db:
+            known = self._db.execute(
+                "SELECT 1 FROM scans WHERE digest = ?", (digest,)
+            ).fetchone()
+            if known is None:
+                self._db.execute(
+                    "INSERT INTO scans (digest, ecosystems) VALUES (?, ?)",
+                    (digest, json.dumps(list(scan.ecosystems))),
+                )
+                for pkg in scan.packages:
+                    cur = self._db.execute(
+                        "INSERT INTO packages (digest, ecosystem, name, key,"
+                        " installed_version) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            digest,
+                            pkg.ecosystem,
+                            pkg.name,
+                            package_key(pkg.ecosystem, pkg.name),
+                            pkg.installed_version,
+                        ),
+                    )
+                    self._db.executemany(
+                        "INSERT INTO sources (package_id, file, specifier)"
+                        " VALUES (?, ?, ?)",
+                        [(cur.lastrowid, s.file, s.specifier) for s in pkg.sources],
+                    )
+            self._db.execute(
+                "INSERT OR REPLACE INTO repos (root, digest, files, scanned_at)"
+                " VALUES (?, ?, ?, ?)",
+                (str(root), digest, json.dumps(files), time.time()),
+            )
+            self._db.execute(
+                "DELETE FROM scans WHERE digest NOT IN (SELECT digest FROM repos)"
+            )
+        return digest
+
+    # -- latest versions -------------------------------------------------------
+
+    def latest(self, ecosystem: str, name: str, max_age: float) -> str | None:
+        """Stored latest version if fetched within *max_age* seconds."""
+        row = self._db.execute(
+            "SELECT version, fetched_at FROM latest WHERE ecosystem = ? AND key = ?",
+            (ecosystem, package_key(ecosystem, name)),
+        ).fetchone()
+        if row is None or time.time() - row[1] > max_age:
+            return None
+        return row[0]
+
+    def store_latest(self, ecosystem: str, name: str, version: str) -> None:
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO latest (ecosystem, key, version, fetched_at)"
+                " VALUES (?, ?, ?, ?)",
+                (ecosystem, package_key(ecosystem, name), version, time.time()),
+            )
+
+    # -- queries ---------------------------------------------------------------
+
+    def pins(
+        self, name: str, specifier: str = "", ecosystem: str = "python"
+    ) -> list[Pin]:
+        """Return repositories whose resolved version of *name* matches.
+
+        The resolved version is the locked one, or the exact ``==`` pin when
+        there is no lock entry.  With an empty *specifier* every repository
+        declaring *name* is returned, resolved or not.
+        """
+        rows = self._db.execute(
+            "SELECT r.root, p.name, p.installed_version, s.file, s.specifier"
+            " FROM packages p"
+            " JOIN repos r ON r.digest = p.digest"
+            " JOIN sources s ON s.package_id = p.id"
+            " WHERE p.key = ? AND p.ecosystem = ?"
+            " ORDER BY r.root, s.rowid",
+            (package_key(ecosystem, name), ecosystem),
+        )
+        pins: list[Pin] = []
+        for root, pkg_name, installed, file, spec in rows:
+            version = _pinned_version(installed, spec)
+            if specifier and not (version and version_matches(version, specifier)):
+                continue
+            pins.append(Pin(root, ecosystem, pkg_name, version, file, spec))
+        return pins
+
+    def stats(self) -> dict[str, int]:
+        """Return row counts per table."""
+        return {
+            table: self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("repos", "scans", "packages", "latest")
+        }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="fleet_index.py",
+        description="Query a fleet index written by 'pydep --batch --index'.",
+    )
+    parser.add_argument("database", help="SQLite file written by batch mode")
+    parser.add_argument("package", help="package name to look up")
+    parser.add_argument(
+        "specifier", nargs="?", default="", help="e.g. '<2.31' (default: any)"
+    )
+    parser.add_argument(
+        "-e", "--ecosystem", default="python", help="python, javascript or go"
+    )
+    args = parser.parse_args(argv)
+
+    with FleetIndex(args.database) as index:
+        for pin in index.pins(args.package, args.specifier, args.ecosystem):
+            version = pin.version or "?"
+            print(f"{pin.root}\t{pin.name} {version}\t{pin.file} {pin.specifier}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Fuzzy matching
+==============
+
+fzf-style subsequence matching for the package filter.  A query matches
+a name when its characters appear in order; among the ways they can, the
+shortest window is scored, rewarding matches at word starts and runs of
+consecutive characters and penalising gaps.  Both sides are expected to
+be lowercased already (the package store keeps a lowercased name column).
+"""
+
+from __future__ import annotations
+
+SCORE_MATCH = 16
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 4
+PENALTY_GAP_START = 3
+PENALTY_GAP_EXTENSION = 1
+
+# Characters after which a match counts as the start of a word.
+_BOUNDARY = frozenset("-_./ ")
+
+
+def char_mask(text: str) -> int:
+    """64-bit summary of the characters in *text*.
+
+    A query can only match *text* if ``char_mask(query) & ~char_mask(text)``
+    is zero, which rules out most rows without running the matcher.
+    """
+    mask = 0
+    for ch in set(text):
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+def fuzzy_match(query: str, text: str) -> tuple[int, tuple[int, ...]] | None:
+    """Score *query* against *text*; ``None`` when it is not a subsequence.
+
+    Returns ``(score, positions)`` where *positions* are the indices of the
+    matched characters in *text*, for highlighting.
+    """
+    if not query:
+        return 0, ()
+    # forward pass: the earliest position the whole query can end at
+    pos = -1
+    for ch in query:
+        pos = text.find(ch, pos + 1)
+        if pos < 0:
+            return None
+    # backward pass from there: the latest start, i.e. the shortest window
+    qi = len(query) - 1
+    start = pos
+    for i in range(pos, -1, -1):
+        if text[i] == query[qi]:
+            qi -= 1
+            if qi < 0:
+                start = i
+                break
+
+    positions: list[int] = []
+    score = 0
+    prev = -1
+    pos = start - 1
+    for ch in query:
+        pos = text.find(ch, pos + 1)
+        score += SCORE_MATCH
+        if pos == 0 or text[pos - 1] in _BOUNDARY:
+            score += BONUS_BOUNDARY
+        if prev >= 0:
+            if pos == prev + 1:
+                score += BONUS_CONSECUTIVE
+            else:
+                score -= PENALTY_GAP_START + (pos - prev - 2) * PENALTY_GAP_EXTENSION
+        positions.append(pos)
+        prev = pos
+    return score, tuple(positions)
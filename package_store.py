@@ -0,0 +1,219 @@
+"""
+Columnar package store
+======================
+
+Column-per-attribute view of a package list for the Packages panel, so
+filtering and sorting tens of thousands of packages (a monorepo workspace
+view) are index operations over flat lists rather than walks over
+``Package`` objects and their sources.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Sequence
+
+from base import Package, latest_key
+from fuzzy import char_mask, fuzzy_match
+
+# Status flags (one byte per row)
+INSTALLED = 1
+HAS_LATEST = 2
+OUTDATED = 4
+
+# Queries shorter than this cannot use the trigram index.
+_GRAM = 3
+
+
+class PackageStore:
+    """Immutable-shape columns over *packages* (row ``i`` is ``packages[i]``).
+
+    Columns: ``names``, ``keys`` (``(ecosystem, package key)`` pairs),
+    ``haystacks`` (lowercased name and source labels for text search),
+    ``source_masks`` (bit *n* set when the package is declared in
+    ``sources[n]``), ``installed``, ``latest`` and ``flags``.  ``order``
+    holds the rows sorted by name; the per-source row lists keep that order,
+    so a source filter is a lookup.
+    Latest versions can be swapped in with :meth:`set_latest` without
+    rebuilding the other columns.
+
+    Exact text selection (:meth:`select`) narrows the previous result when
+    the new query contains the previous one (typing on), and stores of at
+    least ``TRIGRAM_MIN_ROWS`` rows build a trigram index up front so a
+    fresh query only verifies the rows sharing its rarest trigram.
+    :meth:`fuzzy_select` ranks fuzzy name matches instead, over the
+    precomputed ``lowered`` names and their ``char_masks``; a subsequence
+    need not contain any of the query's trigrams, so it does not use the
+    index.
+    """
+
+    TRIGRAM_MIN_ROWS = 2000
+
+    def __init__(
+        self,
+        packages: Sequence[Package],
+        latest: dict[tuple[str, str], str] | None = None,
+    ) -> None:
+        self.packages = list(packages)
+        self.names = [p.name for p in self.packages]
+        self.keys = [latest_key(p) for p in self.packages]
+        self.installed = [p.installed_version for p in self.packages]
+        self.sources: list[str] = []
+        source_ids: dict[str, int] = {}
+        self.source_masks: list[int] = []
+        self.haystacks: list[str] = []
+        for pkg in self.packages:
+            mask = 0
+            for src in pkg.sources:
+                bit = source_ids.get(src.file)
+                if bit is None:
+                    bit = source_ids[src.file] = len(self.sources)
+                    self.sources.append(src.file)
+                mask |= 1 << bit
+            self.source_masks.append(mask)
+            # "\0" cannot be typed into the filter, so matches never span fields
+            self.haystacks.append(
+                "\0".join([pkg.name, *(s.file for s in pkg.sources)]).lower()
+            )
+        self._source_ids = source_ids
+
+        self.lowered = [name.lower() for name in self.names]
+        self.char_masks = [char_mask(name) for name in self.lowered]
+        self.order = sorted(range(len(self.packages)), key=self.lowered.__getitem__)
+        self._rank = [0] * len(self.order)  # row -> position in ``order``
+        for position, row in enumerate(self.order):
+            self._rank[row] = position
+        self._source_rows: list[list[int]] = [[] for _ in self.sources]
+        for row in self.order:
+            mask = self.source_masks[row]
+            while mask:
+                low = mask & -mask
+                self._source_rows[low.bit_length() - 1].append(row)
+                mask ^= low
+
+        self.latest: list[str] = []
+        self.flags = bytearray(len(self.packages))
+        self.set_latest(latest or {})
+
+        # built here rather than on the first query, which must fit in a frame
+        self._trigrams: dict[str, list[int]] = {}
+        if len(self.packages) >= self.TRIGRAM_MIN_ROWS:
+            for row in self.order:
+                hay = self.haystacks[row]
+                for gram in {hay[i : i + _GRAM] for i in range(len(hay) - _GRAM + 1)}:
+                    self._trigrams.setdefault(gram, []).append(row)
+        # (source id, query, rows) of the last text selection
+        self._last: tuple[int | None, str, list[int]] = (None, "", [])
+        # the same for fuzzy selection (rows in name order, before ranking)
+        self._last_fuzzy: tuple[int | None, str, list[int]] = (None, "", [])
+
+    def __len__(self) -> int:
+        return len(self.packages)
+
+    def set_latest(self, latest: dict[tuple[str, str], str]) -> None:
+        """Refresh the ``latest`` and ``flags`` columns.
+
+        *latest* is keyed like ``keys``: ``(ecosystem name, package key)``.
+        """
+        self.latest = [latest.get(key, "") for key in self.keys]
+        flags = self.flags
+        for row, (installed, newest) in enumerate(zip(self.installed, self.latest)):
+            flag = 0
+            if installed:
+                flag |= INSTALLED
+            if newest:
+                flag |= HAS_LATEST
+                if installed and installed != newest:
+                    flag |= OUTDATED
+            flags[row] = flag
+
+    def count(self, flag: int) -> int:
+        """Number of rows with *flag* set."""
+        return sum(1 for f in self.flags if f & flag)
+
+    def select(self, source: str | None = None, text: str = "") -> list[int]:
+        """Rows matching *source* (exact label) and *text*, in name order.
+
+        *text* matches case-insensitively against the name or any source
+        label.
+        """
+        sid = None
+        if source:
+            sid = self._source_ids.get(source)
+            if sid is None:
+                return []
+        rows = self._source_rows[sid] if sid is not None else self.order
+        query = text.lower()
+        if not query:
+            return list(rows)
+
+        last_sid, last_query, last_rows = self._last
+        if last_query and last_sid == sid and last_query in query:
+            rows = last_rows
+        if len(query) >= _GRAM and len(self) >= self.TRIGRAM_MIN_ROWS:
+            posting = self._rarest_posting(query)
+            if len(posting) < len(rows):
+                rows = posting
+                if sid is not None:
+                    masks = self.source_masks
+                    rows = [row for row in rows if masks[row] >> sid & 1]
+        haystacks = self.haystacks
+        rows = [row for row in rows if query in haystacks[row]]
+        self._last = (sid, query, rows)
+        return list(rows)
+
+    def fuzzy_select(
+        self, source: str | None = None, text: str = "", limit: int | None = None
+    ) -> tuple[list[tuple[int, tuple[int, ...]]], int]:
+        """Rank rows whose name fuzzily matches *text*, best first.
+
+        Returns ``([(row, matched positions), ...], total)``: at most *limit*
+        hits, picked with a bounded heap rather than a full sort, plus the
+        number of rows that matched.  Ties go to the earlier match, then
+        to the shorter name, then to name order.  A query that extends the
+        previous one (same source) only rescores the previous matches.
+        """
+        sid = None
+        if source:
+            sid = self._source_ids.get(source)
+            if sid is None:
+                return [], 0
+        rows = self._source_rows[sid] if sid is not None else self.order
+        query = text.lower()
+        if not query:
+            rows = rows if limit is None else rows[:limit]
+            return [(row, ()) for row in rows], len(rows)
+
+        last_sid, last_query, last_rows = self._last_fuzzy
+        if last_query and last_sid == sid and query.startswith(last_query):
+            rows = last_rows
+        qmask = char_mask(query)
+        masks, lowered, rank = self.char_masks, self.lowered, self._rank
+        scored: list[tuple[int, int, int, int, int, tuple[int, ...]]] = []
+        for row in rows:
+            if qmask & ~masks[row]:
+                continue
+            match = fuzzy_match(query, lowered[row])
+            if match is not None:
+                score, positions = match
+                scored.append(
+                    (-score, positions[0], len(lowered[row]), rank[row], row, positions)
+                )
+        self._last_fuzzy = (sid, query, [hit[4] for hit in scored])
+
+        if limit is not None and limit < len(scored):
+            best = heapq.nsmallest(limit, scored)
+        else:
+            best = sorted(scored)
+        return [(hit[4], hit[5]) for hit in best], len(scored)
+
+    def _rarest_posting(self, query: str) -> list[int]:
+        """Name-ordered rows holding the least common trigram of *query*."""
+        index = self._trigrams
+        return min(
+            (
+                index.get(query[i : i + _GRAM], [])
+                for i in range(len(query) - _GRAM + 1)
+            ),
+            key=len,
+        )
@@ -0,0 +1,138 @@
+"""
+Scan snapshots
+==============
+
+Immutable, picklable form of a scan result.  Live :class:`base.Package`
+objects point at their :class:`base.Ecosystem` instance (which may hold a
+package-manager wrapper), so they cannot cheaply cross a process boundary
+or be written to disk; snapshots carry the ecosystem's *name* instead and
+convert back to live packages on demand.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from typing import Any, NamedTuple
+
+from base import DepSource, Ecosystem, Package
+
+
+class SourceSnapshot(NamedTuple):
+    file: str
+    specifier: str
+
+
+class PackageSnapshot(NamedTuple):
+    """One package of a scan; ``latest_version`` is ``None`` until annotated."""
+
+    ecosystem: str
+    name: str
+    installed_version: str
+    sources: tuple[SourceSnapshot, ...]
+    latest_version: str | None = None
+
+    @classmethod
+    def from_package(cls, pkg: Package, ecosystem: str = "") -> PackageSnapshot:
+        if not ecosystem and pkg.ecosystem is not None:
+            ecosystem = pkg.ecosystem.name
+        return cls(
+            ecosystem,
+            pkg.name,
+            pkg.installed_version,
+            tuple(SourceSnapshot(s.file, s.specifier) for s in pkg.sources),
+        )
+
+    def to_package(self, ecosystem: Ecosystem | None = None) -> Package:
+        return Package(
+            name=self.name,
+            sources=[DepSource(s.file, s.specifier) for s in self.sources],
+            installed_version=self.installed_version,
+            ecosystem=ecosystem,
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "ecosystem": self.ecosystem,
+            "name": self.name,
+            "installed_version": self.installed_version,
+            "sources": [
+                {"file": s.file, "specifier": s.specifier} for s in self.sources
+            ],
+        }
+        if self.latest_version is not None:
+            data["latest_version"] = self.latest_version
+        return data
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> PackageSnapshot:
+        return cls(
+            data["ecosystem"],
+            data["name"],
+            data.get("installed_version", ""),
+            tuple(
+                SourceSnapshot(s["file"], s["specifier"])
+                for s in data.get("sources", [])
+            ),
+            data.get("latest_version"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ScanSnapshot:
+    """Everything one scan of *root* produced."""
+
+    root: str
+    ecosystems: tuple[str, ...] = ()
+    packages: tuple[PackageSnapshot, ...] = ()
+    errors: tuple[str, ...] = ()
+
+    @classmethod
+    def from_packages(
+        cls,
+        root: str,
+        packages: Iterable[Package],
+        ecosystems: Iterable[str] = (),
+        errors: Iterable[str] = (),
+    ) -> ScanSnapshot:
+        """Freeze live *packages* (each tagged with its ecosystem's name)."""
+        return cls(
+            root,
+            tuple(ecosystems),
+            tuple(PackageSnapshot.from_package(p) for p in packages),
+            tuple(errors),
+        )
+
+    def to_packages(
+        self, ecosystems: Mapping[str, Ecosystem] | None = None
+    ) -> list[Package]:
+        """Thaw into live packages, attaching instances from *ecosystems*."""
+        ecosystems = ecosystems or {}
+        return [p.to_package(ecosystems.get(p.ecosystem)) for p in self.packages]
+
+    def with_latest(self, latest: Mapping[tuple[str, str], str]) -> ScanSnapshot:
+        """Copy with ``latest_version`` set from ``{(ecosystem, name): version}``."""
+        return replace(
+            self,
+            packages=tuple(
+                p._replace(latest_version=latest.get((p.ecosystem, p.name), ""))
+                for p in self.packages
+            ),
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "root": self.root,
+            "ecosystems": list(self.ecosystems),
+            "packages": [p.to_json() for p in self.packages],
+            "errors": list(self.errors),
+        }
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> ScanSnapshot:
+        return cls(
+            data["root"],
+            tuple(data.get("ecosystems", ())),
+            tuple(PackageSnapshot.from_json(p) for p in data.get("packages", ())),
+            tuple(data.get("errors", ())),
+        )
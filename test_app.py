@@ -83,6 +83,18 @@ def mock_requests(monkeypatch: pytest.MonkeyPatch) -> dict[str, MockResponse]:
     return responses
 
 
+@pytest.fixture(autouse=True)
+def isolated_lock_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Keep persisted lockfile indexes out of the real ``~/.cache``."""
+    import ecosystems.lockindex
+
+    cache_dir = tmp_path_factory.mktemp("lock-index")
+    monkeypatch.setattr(ecosystems.lockindex, "CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 # ---------------------------------------------------------------------------
 # 1. Module imports
 # ---------------------------------------------------------------------------
@@ -601,7 +613,7 @@ async def test_app_mounts_and_populates_packages(app_with_deps):
         await pilot.pause()
         pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
         # pyproject.toml has 3 deps + 1 optional-dep (pytest) = 4
-        # uv pip list may add more from the venv -- at minimum we have 4
+        # an installed venv may add more -- at minimum we have 4
         assert pkg_panel.package_count >= 4
 
 
@@ -901,7 +913,7 @@ async def test_filter_filters_packages(app_with_deps):
 
         filter_input = app_with_deps.query_one("#filter-input", Input)
         filter_input.value = "req"
-        await pilot.pause()
+        await pilot.pause(0.2)  # past the filter debounce
 
         # Should filter to fewer packages
         assert pkg_panel.package_count < initial_count
@@ -1836,7 +1848,7 @@ async def test_lock_action(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
 @pytest.mark.asyncio
 async def test_update_all_outdated(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Pressing ``U`` with outdated packages opens a ConfirmModal."""
-    from app import ConfirmModal, DependencyManagerApp, _normalise
+    from app import ConfirmModal, DependencyManagerApp
 
     (tmp_path / "pyproject.toml").write_text(_PYPROJECT)
     (tmp_path / "uv.lock").write_text(_UVLOCK)
@@ -1849,9 +1861,9 @@ async def test_update_all_outdated(tmp_path: Path, monkeypatch: pytest.MonkeyPat
 
         # Manually set latest versions so some packages appear outdated
         app._latest_versions = {
-            _normalise("requests"): "99.0.0",
-            _normalise("httpx"): "99.0.0",
-            _normalise("click"): "99.0.0",
+            ("python", "requests"): "99.0.0",
+            ("python", "httpx"): "99.0.0",
+            ("python", "click"): "99.0.0",
         }
 
         await pilot.press("U")
@@ -1866,7 +1878,7 @@ async def test_update_all_outdated_none_outdated(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ):
     """Pressing ``U`` with no outdated packages shows a warning, no modal."""
-    from app import ConfirmModal, DependencyManagerApp, _normalise
+    from app import ConfirmModal, DependencyManagerApp
 
     (tmp_path / "pyproject.toml").write_text(_PYPROJECT)
     (tmp_path / "uv.lock").write_text(_UVLOCK)
@@ -1879,9 +1891,9 @@ async def test_update_all_outdated_none_outdated(
 
         # Set latest versions to match installed (no outdated)
         app._latest_versions = {
-            _normalise("requests"): "2.32.3",
-            _normalise("httpx"): "0.28.1",
-            _normalise("click"): "8.1.7",
+            ("python", "requests"): "2.32.3",
+            ("python", "httpx"): "0.28.1",
+            ("python", "click"): "8.1.7",
         }
 
         await pilot.press("U")
@@ -2205,62 +2217,62 @@ def test_parse_dep_string_invalid_comment():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_parse_installed_with_mock_output(monkeypatch: pytest.MonkeyPatch):
-    """``_parse_installed`` parses ``uv pip list --format=json`` output."""
-    from app import _parse_installed
+def _fake_dist(site: Path, name: str, version: str, *requires: str) -> Path:
+    """Create ``<name>-<version>.dist-info/METADATA`` under *site*."""
+    dist = site / f"{name}-{version}.dist-info"
+    dist.mkdir(parents=True)
+    headers = [f"Name: {name}", f"Version: {version}"]
+    headers += [f"Requires-Dist: {req}" for req in requires]
+    (dist / "METADATA").write_text("\n".join(headers) + "\n\nLong description\n")
+    return dist
 
-    json_output = json.dumps(
-        [
-            {"name": "requests", "version": "2.32.3"},
-            {"name": "click", "version": "8.1.7"},
-        ]
-    )
 
-    async def mock_exec(*args, **kwargs):
-        class FakeProc:
-            returncode = 0
-
-            async def communicate(self):
-                return json_output.encode(), b""
-
-        return FakeProc()
+@pytest.mark.asyncio
+async def test_parse_installed_reads_dist_info(tmp_path: Path):
+    """``_parse_installed`` reads ``.venv`` dist-info METADATA, no subprocess."""
+    from app import _parse_installed
 
-    monkeypatch.setattr("asyncio.create_subprocess_exec", mock_exec)
+    site = tmp_path / ".venv" / "lib" / "python3.12" / "site-packages"
+    _fake_dist(site, "requests", "2.32.3", "idna>=2.5")
+    _fake_dist(site, "click", "8.1.7")
 
-    results = await _parse_installed("/usr/bin/uv")
+    results = await _parse_installed(tmp_path)
     assert len(results) == 2
     assert ("requests", "==2.32.3", "venv") in results
     assert ("click", "==8.1.7", "venv") in results
 
 
 @pytest.mark.asyncio
-async def test_parse_installed_no_uv():
-    """``_parse_installed`` returns empty when uv_path is None."""
+async def test_parse_installed_no_venv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """``_parse_installed`` returns empty when there is no environment."""
     from app import _parse_installed
 
-    results = await _parse_installed(None)
+    monkeypatch.delenv("VIRTUAL_ENV", raising=False)
+
+    results = await _parse_installed(tmp_path)
     assert results == []
 
 
 @pytest.mark.asyncio
-async def test_parse_installed_error(monkeypatch: pytest.MonkeyPatch):
-    """``_parse_installed`` returns empty on subprocess failure."""
-    from app import _parse_installed
-
-    async def mock_exec(*args, **kwargs):
-        class FakeProc:
-            returncode = 1
-
-            async def communicate(self):
-                return b"", b"error"
-
-        return FakeProc()
-
-    monkeypatch.setattr("asyncio.create_subprocess_exec", mock_exec)
+async def test_get_package_requires_from_metadata(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Requires come from ``Requires-Dist``, skipping extra-only entries."""
+    from app import _get_package_requires
+
+    site = tmp_path / ".venv" / "lib" / "python3.12" / "site-packages"
+    _fake_dist(
+        site,
+        "requests",
+        "2.32.3",
+        "charset-normalizer<4,>=2",
+        "idna<4,>=2.5",
+        'PySocks!=1.5.7,>=1.5.6; extra == "socks"',
+    )
+    monkeypatch.chdir(tmp_path)
 
-    results = await _parse_installed("/usr/bin/uv")
-    assert results == []
+    assert await _get_package_requires("Requests") == ["charset-normalizer", "idna"]
+    assert await _get_package_requires("missing") == []
 
 
 # ---------------------------------------------------------------------------
@@ -2575,3 +2587,630 @@ async def test_package_manager_failure(monkeypatch: pytest.MonkeyPatch):
     ok, output = await mgr.add("nonexistent-pkg")
     assert ok is False
     assert "error" in output
+
+
+# ---------------------------------------------------------------------------
+# 32. Workspace view
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_workspace_view_aggregates_members(app_with_deps):
+    """``w`` shows packages from member projects and blocks mutations."""
+    from app import ConfirmModal, PackagesPanel, SourcesPanel
+
+    member = Path.cwd() / "libs" / "core"
+    member.mkdir(parents=True)
+    (member / "requirements.txt").write_text("attrs>=23\n")
+
+    async with app_with_deps.run_test(size=(140, 30)) as pilot:
+        await pilot.pause()
+        pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
+        before = pkg_panel.package_count
+
+        await pilot.press("w")
+        await app_with_deps.workers.wait_for_complete()
+        await pilot.pause()
+        assert pkg_panel.package_count == before + 1
+        sources = app_with_deps.query_one("#sources-panel", SourcesPanel)
+        assert "libs/core/requirements.txt" in sources._sources
+
+        await pilot.press("d")
+        await pilot.pause()
+        assert not isinstance(app_with_deps.screen, ConfirmModal)
+
+        await pilot.press("w")
+        await app_with_deps.workers.wait_for_complete()
+        await pilot.pause()
+        assert pkg_panel.package_count == before
+
+
+@pytest.mark.asyncio
+async def test_workspace_outdated_and_docs_use_each_ecosystem(
+    app_with_deps, monkeypatch
+):
+    """``o`` and ``D`` in the workspace view go to each package's own registry."""
+    from app import PackagesPanel
+    from base import normalise_name
+    from ecosystems.go import GoEcosystem
+    from ecosystems.javascript import JavaScriptEcosystem
+    from ecosystems.python import PythonEcosystem
+
+    member = Path.cwd() / "web"
+    member.mkdir()
+    (member / "package.json").write_text('{"dependencies": {"left-pad": "^1.3.0"}}')
+    (member / "go.mod").write_text(
+        "module example.com/web\n\ngo 1.21\n\nrequire github.com/pkg/errors v0.9.1\n"
+    )
+
+    looked_up: dict[str, list[str]] = {}
+
+    def fake_latest(label):
+        async def fetch(self, names):
+            looked_up.setdefault(label, []).extend(names)
+            return {n: "9.9" for n in names}
+
+        return fetch
+
+    for cls, label in (
+        (PythonEcosystem, "python"),
+        (JavaScriptEcosystem, "javascript"),
+        (GoEcosystem, "go"),
+    ):
+        monkeypatch.setattr(cls, "fetch_latest_versions", fake_latest(label))
+    opened: list[str] = []
+    monkeypatch.setattr("webbrowser.open", opened.append)
+
+    async with app_with_deps.run_test(size=(140, 30)) as pilot:
+        await pilot.pause()
+        await pilot.press("w")
+        await app_with_deps.workers.wait_for_complete()
+        await pilot.pause()
+
+        await pilot.press("o")
+        await app_with_deps.workers.wait_for_complete()
+        await pilot.pause()
+        assert looked_up["javascript"] == ["left-pad"]
+        assert looked_up["go"] == ["github.com/pkg/errors"]
+        assert "left-pad" not in looked_up["python"]
+        assert "github.com/pkg/errors" not in looked_up["python"]
+        cache = app_with_deps._metadata
+        assert cache.get(("go", "latest", "github.com/pkg/errors"))
+        assert cache.get(("python", "latest", normalise_name("left-pad"))) is None
+
+        pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
+        pkg_panel.focus()
+        pkg_panel.selected_index = [p.name for p in pkg_panel._filtered_packages].index(
+            "left-pad"
+        )
+        await pilot.press("D")
+        await pilot.pause()
+        assert opened == ["https://www.npmjs.com/package/left-pad"]
+
+
+@pytest.mark.asyncio
+async def test_workspace_latest_versions_are_per_ecosystem(app_with_deps, monkeypatch):
+    """A name on both PyPI and npm gets each registry's version, not one shared."""
+    from app import DetailsPanel, PackagesPanel
+    from ecosystems.javascript import JavaScriptEcosystem
+    from ecosystems.python import PythonEcosystem
+
+    member = Path.cwd() / "web"
+    member.mkdir()
+    (member / "package.json").write_text('{"dependencies": {"click": "^0.0.1"}}')
+
+    def fake_latest(version):
+        async def fetch(self, names):
+            return {n: version for n in names}
+
+        return fetch
+
+    monkeypatch.setattr(PythonEcosystem, "fetch_latest_versions", fake_latest("8.1.7"))
+    monkeypatch.setattr(
+        JavaScriptEcosystem, "fetch_latest_versions", fake_latest("0.0.1")
+    )
+
+    async with app_with_deps.run_test(size=(140, 30)) as pilot:
+        await pilot.pause()
+        await pilot.press("w")
+        await app_with_deps.workers.wait_for_complete()
+        await pilot.pause()
+        await pilot.press("o")
+        await app_with_deps.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert app_with_deps._latest_versions[("python", "click")] == "8.1.7"
+        assert app_with_deps._latest_versions[("javascript", "click")] == "0.0.1"
+        pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
+        clicks = [p for p in pkg_panel._filtered_packages if p.name == "click"]
+        assert {p.ecosystem.name for p in clicks} == {"python", "javascript"}
+        details = app_with_deps.query_one("#details-panel", DetailsPanel)
+        for pkg in clicks:
+            details.show_package(pkg, app_with_deps._latest_versions)
+            expected = "8.1.7" if pkg.ecosystem.name == "python" else "0.0.1"
+            assert expected in str(details.render())
+
+
+# ---------------------------------------------------------------------------
+# 33. Headless batch mode
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_batch_streams_json_lines_with_shared_registry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Each root yields one JSON line; each distinct package is looked up once."""
+    import io
+
+    import batch
+    from ecosystems.python import PythonEcosystem
+
+    for name, reqs in (("a", "requests>=2\nclick\n"), ("b", "Requests\n")):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "requirements.txt").write_text(reqs)
+
+    looked_up: list[str] = []
+
+    async def fake_latest(self, names):
+        looked_up.extend(names)
+        return {n: "9.9" for n in names}
+
+    monkeypatch.setattr(PythonEcosystem, "fetch_latest_versions", fake_latest)
+    out = io.StringIO()
+    roots = [str(tmp_path / "a"), str(tmp_path / "b"), str(tmp_path / "missing")]
+
+    summary = await batch.run_batch(roots, out, jobs=2, latest=True)
+
+    records = {r["root"]: r for r in map(json.loads, out.getvalue().splitlines())}
+    assert set(records) == set(roots)
+    assert records[roots[2]]["errors"] == ["not a directory"]
+    pkgs = {p["name"]: p for p in records[roots[0]]["packages"]}
+    assert pkgs["requests"]["latest_version"] == "9.9"
+    assert records[roots[1]]["packages"][0]["latest_version"] == "9.9"
+    assert sorted(n.lower() for n in looked_up) == ["click", "requests"]
+    assert summary["registry_distinct"] == 2
+
+
+# ---------------------------------------------------------------------------
+# 34. Fleet index
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_fleet_index_reuses_unchanged_scans(tmp_path: Path):
+    """A rescan only reparses roots whose manifests changed."""
+    import io
+
+    import batch
+    from fleet_index import FleetIndex
+
+    roots = []
+    for name, reqs in (("a", "requests==2.30.0\n"), ("b", "requests==2.32.3\n")):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "requirements.txt").write_text(reqs)
+        roots.append(str(tmp_path / name))
+
+    with FleetIndex(tmp_path / "fleet.db") as index:
+        first = await batch.run_batch(roots, io.StringIO(), jobs=1, index=index)
+        (tmp_path / "b" / "requirements.txt").write_text("requests==2.31.0\n")
+        second = await batch.run_batch(roots, io.StringIO(), jobs=1, index=index)
+
+        assert first["cached"] == 0
+        assert second["cached"] == 1
+        assert [p.root for p in index.pins("Requests", "<2.31")] == [roots[0]]
+        assert [p.version for p in index.pins("requests", ">=2.31")] == ["2.31.0"]
+
+
+def test_fleet_index_tracks_included_files(tmp_path: Path):
+    """Editing a ``-r`` include invalidates the stored scan."""
+    from fleet_index import FleetIndex
+    from snapshot import PackageSnapshot, ScanSnapshot, SourceSnapshot
+
+    (tmp_path / "requirements.txt").write_text("-r base.txt\n")
+    (tmp_path / "base.txt").write_text("click\n")
+    scan = ScanSnapshot(
+        str(tmp_path),
+        ("python",),
+        (PackageSnapshot("python", "click", "", (SourceSnapshot("base.txt", "*"),)),),
+    )
+
+    with FleetIndex(tmp_path / "fleet.db") as index:
+        index.store(scan)
+        cached = index.cached_record(tmp_path)
+        assert cached == scan
+
+        (tmp_path / "base.txt").write_text("click>=8\n")
+        assert index.cached_record(tmp_path) is None
+
+
+@pytest.mark.asyncio
+async def test_fleet_index_tracks_go_work_modules(tmp_path: Path):
+    """Editing a ``use``d module's go.mod invalidates the stored scan."""
+    import io
+
+    import batch
+    from fleet_index import FleetIndex
+
+    repo = tmp_path / "repo"
+    (repo / "svc").mkdir(parents=True)
+    (repo / "go.work").write_text("go 1.21\n\nuse ./svc\n")
+    go_mod = repo / "svc" / "go.mod"
+    go_mod.write_text(
+        "module example.com/svc\n\ngo 1.21\n\nrequire github.com/pkg/errors v0.9.1\n"
+    )
+
+    with FleetIndex(tmp_path / "fleet.db") as index:
+        await batch.run_batch([str(repo)], io.StringIO(), jobs=1, index=index)
+        go_mod.write_text(go_mod.read_text().replace("v0.9.1", "v0.9.2"))
+        out = io.StringIO()
+        second = await batch.run_batch([str(repo)], out, jobs=1, index=index)
+
+    assert second["cached"] == 0
+    (record,) = map(json.loads, out.getvalue().splitlines())
+    (pkg,) = record["packages"]
+    assert pkg["sources"][0]["specifier"].endswith("v0.9.2")
+
+
+def test_fleet_index_tracks_non_utf8_go_work(tmp_path: Path):
+    """A go.work that is not valid UTF-8 is still read for its ``use`` lines."""
+    from fleet_index import _tracked
+
+    (tmp_path / "svc").mkdir()
+    (tmp_path / "svc" / "go.mod").write_text("module example.com/svc\n")
+    (tmp_path / "go.work").write_bytes(b"// caf\xe9\ngo 1.21\n\nuse ./svc\n")
+
+    assert _tracked(tmp_path, []) == ["go.work", "svc/go.mod"]
+
+
+# ---------------------------------------------------------------------------
+# 35. Columnar package store
+# ---------------------------------------------------------------------------
+
+
+def test_package_store_filters_by_index():
+    """Source and text filters select rows in name order; flags track latest."""
+    from base import DepSource
+    from base import Package as BasePackage
+    from package_store import OUTDATED, PackageStore
+
+    packages = [
+        BasePackage("zope", [DepSource("requirements.txt", "*")], "5.0"),
+        BasePackage("Click", [DepSource("pyproject.toml", ">=8")], "8.1.0"),
+        BasePackage(
+            "attrs",
+            [DepSource("pyproject.toml", "*"), DepSource("pyproject.toml [dev]", "*")],
+            "23.1.0",
+        ),
+    ]
+    store = PackageStore(packages, {("", "click"): "8.1.7", ("", "attrs"): "23.1.0"})
+
+    assert [store.names[r] for r in store.select()] == ["attrs", "Click", "zope"]
+    assert [store.names[r] for r in store.select("pyproject.toml")] == [
+        "attrs",
+        "Click",
+    ]
+    assert [store.names[r] for r in store.select(text="DEV")] == ["attrs"]
+    assert store.select("missing.txt") == []
+    assert store.count(OUTDATED) == 1
+
+    store.set_latest({("", "zope"): "6.0"})
+    assert [store.names[r] for r in range(len(store)) if store.flags[r] & OUTDATED] == [
+        "zope"
+    ]
+
+
+def test_package_store_incremental_and_trigram_select():
+    """Narrowed and trigram-indexed selections match a plain substring scan."""
+    import random
+
+    from base import DepSource
+    from base import Package as BasePackage
+    from package_store import PackageStore
+
+    rng = random.Random(7)
+    words = ["http", "core", "lib", "py", "test", "json", "async", "util"]
+    packages = [
+        BasePackage(
+            f"{rng.choice(words)}-{rng.choice(words)}{i}",
+            [DepSource(rng.choice(["pyproject.toml", "requirements.txt"]), "*")],
+            "",
+        )
+        for i in range(3000)
+    ]
+    store = PackageStore(packages)
+    assert len(store) >= store.TRIGRAM_MIN_ROWS
+    assert store._trigrams  # built with the store, not by the first query
+
+    def scan(source, text):
+        return [
+            r
+            for r in store.order
+            if (not source or any(s.file == source for s in store.packages[r].sources))
+            and text.lower() in store.haystacks[r]
+        ]
+
+    for source in (None, "requirements.txt"):
+        for query in ("h", "ht", "htt", "http", "http-c", "http-co", "-lib1", "zzz"):
+            assert store.select(source, query) == scan(source, query)
+    assert store._trigrams is not None
+
+
+# ---------------------------------------------------------------------------
+# 36. Scan snapshots
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_scan_snapshot_round_trips(tmp_path: Path):
+    """Snapshots pickle, survive JSON and thaw back onto live ecosystems."""
+    import pickle
+
+    from ecosystems.python import PythonEcosystem
+    from snapshot import ScanSnapshot
+
+    (tmp_path / "requirements.txt").write_text("requests>=2\n")
+    eco = PythonEcosystem()
+    live = await eco.load_dependencies(tmp_path)
+
+    scan = ScanSnapshot.from_packages(str(tmp_path), live, ecosystems=["python"])
+    restored = pickle.loads(pickle.dumps(scan))
+
+    assert restored == scan
+    assert ScanSnapshot.from_json(json.loads(json.dumps(scan.to_json()))) == scan
+    (pkg,) = restored.to_packages({"python": eco})
+    assert pkg == live[0]
+    assert pkg.ecosystem is eco
+    annotated = scan.with_latest({("python", "requests"): "2.32.3"})
+    assert annotated.packages[0].latest_version == "2.32.3"
+    assert scan.packages[0].latest_version is None
+
+
+# ---------------------------------------------------------------------------
+# 37. Virtualized packages list
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_packages_panel_renders_only_visible_rows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Only the rows in view are drawn; the viewport follows the selection."""
+    from app import DependencyManagerApp, PackagesPanel
+
+    names = [f"pkg{i:04d}" for i in range(2000)]
+    (tmp_path / "requirements.txt").write_text("\n".join(names) + "\n")
+    monkeypatch.chdir(tmp_path)
+
+    app = DependencyManagerApp()
+    async with app.run_test(size=(140, 30)) as pilot:
+        await pilot.pause()
+        pkg_panel = app.query_one("#packages-panel", PackagesPanel)
+        pkg_panel.focus()
+        await pilot.pause()
+        height = pkg_panel.content_size.height
+        assert pkg_panel.package_count == 2000
+
+        rendered = str(pkg_panel.render())
+        assert len(rendered.splitlines()) <= height + PackagesPanel.OVERSCAN
+        assert "pkg0000" in rendered and "pkg1999" not in rendered
+
+        await pilot.press("G")
+        await pilot.pause()
+        rendered = str(pkg_panel.render())
+        assert "pkg1999" in rendered and "pkg0000" not in rendered
+
+        await pilot.press("g", "g")
+        await pilot.pause()
+        assert "pkg0000" in str(pkg_panel.render())
+
+
+# ---------------------------------------------------------------------------
+# 38. Row-level render cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_selection_move_reformats_only_changed_rows(app_with_deps):
+    """``j`` re-formats the old and new selection; other rows are reused."""
+    from app import PackagesPanel, SourcesPanel
+
+    async with app_with_deps.run_test(size=(140, 30)) as pilot:
+        await pilot.pause()
+        pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
+        pkg_panel.focus()
+        await pilot.pause()
+        assert pkg_panel.package_count >= 4
+
+        before = pkg_panel._rows.formatted
+        await pilot.press("j")
+        await pilot.pause()
+        assert pkg_panel._rows.formatted - before == 2
+        assert "▸" in str(pkg_panel.render()).splitlines()[1]
+
+        sources = app_with_deps.query_one("#sources-panel", SourcesPanel)
+        sources.focus()
+        await pilot.pause()
+        before = sources._rows.formatted
+        sources.move_down()
+        assert sources._rows.formatted - before == 2
+
+
+# ---------------------------------------------------------------------------
+# 39. Debounced filter and settled detail fetches
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_filter_is_debounced(app_with_deps):
+    """Keystrokes within the debounce window filter once, with the last text."""
+    from textual.widgets import Input
+
+    from app import PackagesPanel
+
+    async with app_with_deps.run_test(size=(140, 30)) as pilot:
+        await pilot.pause()
+        pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
+        calls: list[str] = []
+        original = pkg_panel.set_text_filter
+        pkg_panel.set_text_filter = lambda text: (calls.append(text), original(text))
+
+        await pilot.press("slash")
+        await pilot.pause()
+        filter_input = app_with_deps.query_one("#filter-input", Input)
+        for text in ("r", "re", "req"):
+            filter_input.value = text
+        assert calls == []
+        await pilot.pause(0.2)
+        assert calls == ["req"]
+        assert pkg_panel.package_count >= 1
+
+
+@pytest.mark.asyncio
+async def test_filter_escape_drops_pending_edit(app_with_deps):
+    """Escape clears the filter once; no debounced filter fires after it."""
+    from textual.widgets import Input
+
+    from app import PackagesPanel
+
+    async with app_with_deps.run_test(size=(140, 30)) as pilot:
+        await pilot.pause()
+        pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
+        calls: list[str] = []
+        original = pkg_panel.set_text_filter
+        pkg_panel.set_text_filter = lambda text: (calls.append(text), original(text))
+
+        await pilot.press("slash")
+        await pilot.pause()
+        app_with_deps.query_one("#filter-input", Input).value = "req"
+        await pilot.press("escape")
+        await pilot.pause(0.2)
+        assert calls == [""]
+        assert app_with_deps._filter_timer is None
+
+
+@pytest.mark.asyncio
+async def test_details_fetch_waits_for_settled_selection(app_with_deps):
+    """Rapid ``j`` presses fetch details for the final package only."""
+    from app import PackagesPanel
+
+    async with app_with_deps.run_test(size=(140, 30)) as pilot:
+        await pilot.pause(0.3)
+        fetched: list[str] = []
+        app_with_deps._fetch_and_show_requires = lambda pkg: fetched.append(pkg.name)
+        pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
+        pkg_panel.focus()
+        await pilot.pause()
+
+        # what ``j`` does, without key dispatch stretching past the settle time
+        for _ in range(3):
+            pkg_panel.move_down()
+            app_with_deps._update_details_for_selection()
+        assert fetched == []
+        await pilot.pause(0.3)
+        assert fetched == [pkg_panel.get_selected_package().name]
+
+
+# ---------------------------------------------------------------------------
+# 40. Fuzzy package filter
+# ---------------------------------------------------------------------------
+
+
+def test_fuzzy_match_prefers_word_starts_and_runs():
+    """Boundary and consecutive matches outscore scattered ones."""
+    from fuzzy import fuzzy_match
+
+    assert fuzzy_match("rq", "rich") is None
+    score, positions = fuzzy_match("req", "types-requests")
+    assert positions == (6, 7, 8)
+    assert score > fuzzy_match("req", "pyrefreq")[0]
+    assert fuzzy_match("dj", "django")[0] > fuzzy_match("dj", "pydantic-json")[0]
+
+
+def test_package_store_fuzzy_select_ranks_top_k():
+    """Best matches come first, capped at *limit*, with the total reported."""
+    from base import DepSource
+    from base import Package as BasePackage
+    from package_store import PackageStore
+
+    names = ["pyrefreq", "requests", "types-requests", "rich", "requests-oauthlib"]
+    store = PackageStore(
+        [BasePackage(n, [DepSource("requirements.txt", "*")], "") for n in names]
+    )
+    hits, total = store.fuzzy_select(text="req", limit=2)
+    assert total == 4
+    assert [store.names[row] for row, _ in hits] == ["requests", "requests-oauthlib"]
+    assert hits[0][1] == (0, 1, 2)
+
+    # extending the query rescoring only the previous matches gives the same
+    # answer as a fresh store
+    hits, total = store.fuzzy_select(text="reqo")
+    assert [store.names[row] for row, _ in hits] == ["requests-oauthlib"]
+    assert store.fuzzy_select("missing.txt", "req") == ([], 0)
+
+
+@pytest.mark.asyncio
+async def test_filter_ranks_and_highlights(app_with_deps):
+    """The panel lists fuzzy matches best first with matched letters marked."""
+    from app import PackagesPanel
+
+    async with app_with_deps.run_test(size=(140, 30)) as pilot:
+        await pilot.pause()
+        pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
+        pkg_panel.set_text_filter("ht")
+        await pilot.pause()
+        pkg = pkg_panel.get_selected_package()
+        assert pkg.name == "httpx"
+        assert pkg_panel._match_positions[0] == (0, 1)
+        markup = pkg_panel._format_row(pkg, "", True, (0, 1))
+        assert "[bold #ff9e64]h[/][bold #ff9e64]t[/]tpx" in markup
+
+        # a leading ' is an exact match, which also searches source labels
+        pkg_panel.set_text_filter("'dev")
+        await pilot.pause()
+        assert [p.name for p in pkg_panel._filtered_packages] == ["pytest"]
+
+
+# ---------------------------------------------------------------------------
+# 41. Session metadata cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_revisited_package_renders_from_metadata_cache(
+    app_with_deps, monkeypatch
+):
+    """Details fetched once are reused when the package is selected again."""
+    from app import DetailsPanel, PackagesPanel
+    from ecosystems.python import PythonEcosystem
+
+    calls: list[tuple[str, str]] = []
+
+    async def fake_requires(self, name):
+        calls.append(("requires", name))
+        return [f"{name}-dep"]
+
+    async def fake_metadata(self, name):
+        calls.append(("metadata", name))
+        return {"summary": f"About {name}"}
+
+    monkeypatch.setattr(PythonEcosystem, "get_package_requires", fake_requires)
+    monkeypatch.setattr(PythonEcosystem, "fetch_package_metadata", fake_metadata)
+
+    async with app_with_deps.run_test(size=(140, 30)) as pilot:
+        await pilot.pause(0.3)
+        pkg_panel = app_with_deps.query_one("#packages-panel", PackagesPanel)
+        details = app_with_deps.query_one("#details-panel", DetailsPanel)
+        first = pkg_panel.get_selected_package().name
+        assert calls == [("requires", first), ("metadata", first)]
+
+        pkg_panel.focus()
+        await pilot.press("j")
+        await pilot.pause(0.3)
+        assert len(calls) == 4
+
+        await pilot.press("k")
+        await pilot.pause()  # no settle delay: served from the cache
+        assert len(calls) == 4
+        assert f"{first}-dep" in str(details.render())
+        assert app_with_deps._metadata.stats()["hits"] >= 2
@@ -119,3 +119,916 @@ class TestGoEcosystemProperties:
     def test_source_colors(self):
         eco = GoEcosystem()
         assert "go.mod" in eco.source_colors
+
+
+class TestParseCache:
+    """Test the fingerprint-keyed manifest parse cache."""
+
+    def test_reparses_only_changed_files(self, tmp_path):
+        import os
+
+        from ecosystems.cache import ParseCache
+
+        calls: list[str] = []
+
+        def parser(path: Path) -> list[str]:
+            calls.append(path.name)
+            return path.read_text().split()
+
+        a = tmp_path / "a.txt"
+        b = tmp_path / "b.txt"
+        a.write_text("one")
+        b.write_text("two")
+        cache = ParseCache()
+        assert cache.get(a, parser) == ["one"]
+        assert cache.get(b, parser) == ["two"]
+        assert cache.get(a, parser) == ["one"]
+
+        a.write_text("one three")
+        st = a.stat()
+        os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert cache.get(a, parser) == ["one", "three"]
+        assert cache.get(b, parser) == ["two"]
+
+        assert calls == ["a.txt", "b.txt", "a.txt"]
+        assert cache.stats() == {"hits": 2, "misses": 3, "entries": 2}
+
+    @pytest.mark.asyncio
+    async def test_python_load_dependencies_uses_cache(self, tmp_path):
+        (tmp_path / "requirements.txt").write_text("requests>=2.0\n")
+        eco = PythonEcosystem()
+        first = await eco.load_dependencies(tmp_path)
+        misses = eco.debug_stats()["parse_cache_misses"]
+        second = await eco.load_dependencies(tmp_path)
+        assert [p.name for p in first] == [p.name for p in second] == ["requests"]
+        assert eco.debug_stats()["parse_cache_misses"] == misses
+        assert eco.debug_stats()["parse_cache_hits"] >= misses
+
+
+class TestMetadataCache:
+    """Test the bounded LRU + TTL metadata cache."""
+
+    def test_lru_eviction_and_expiry(self):
+        from ecosystems.cache import MetadataCache
+
+        now = [0.0]
+        cache = MetadataCache(max_entries=2, ttl=10.0, clock=lambda: now[0])
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.put("c", 3)
+        assert "b" not in cache
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+        now[0] = 10.0
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 1  # "c" expires on its next lookup
+
+    def test_byte_budget(self):
+        from ecosystems.cache import MetadataCache, approx_size
+
+        blob = {"releases": {str(i): [] for i in range(100)}}
+        cache = MetadataCache(max_bytes=approx_size(blob) * 2 + 1)
+        for name in ("a", "b", "c"):
+            cache.put(name, {"releases": {str(i): [] for i in range(100)}})
+        assert len(cache) == 2 and "a" not in cache
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+        cache.put("huge", [blob] * 10 + ["x" * cache.max_bytes])
+        assert "huge" not in cache
+
+    @pytest.mark.asyncio
+    async def test_fetch_caches_kept_results_only(self):
+        from functools import partial
+
+        from ecosystems.cache import MetadataCache
+
+        calls: list[str] = []
+
+        async def lookup(name: str) -> dict[str, str]:
+            calls.append(name)
+            return {} if name == "missing" else {"name": name}
+
+        cache = MetadataCache()
+        for name in ("requests", "requests", "missing", "missing"):
+            await cache.fetch(name, partial(lookup, name), keep=bool)
+        assert calls == ["requests", "missing", "missing"]
+
+
+class TestOffLoopParsing:
+    """Manifest parsing must not run on the event-loop thread."""
+
+    @pytest.mark.asyncio
+    async def test_parsers_run_in_worker_threads(self, tmp_path, monkeypatch):
+        import threading
+
+        import ecosystems.go as go_mod
+        import ecosystems.javascript as js_mod
+        import ecosystems.python as py_mod
+
+        on_main: list[bool] = []
+
+        def spy(real):
+            def wrapper(*args):
+                on_main.append(threading.current_thread() is threading.main_thread())
+                return real(*args)
+
+            return wrapper
+
+        monkeypatch.setattr(py_mod, "_parse_pyproject", spy(py_mod._parse_pyproject))
+        monkeypatch.setattr(js_mod, "read_package_lock", spy(js_mod.read_package_lock))
+        monkeypatch.setattr(
+            go_mod, "_read_go_directives_file", spy(go_mod._read_go_directives_file)
+        )
+
+        (tmp_path / "pyproject.toml").write_text(
+            "[project]\nname = 'x'\ndependencies = ['requests']\n"
+        )
+        (tmp_path / "package.json").write_text(
+            '{"dependencies": {"left-pad": "^1.0.0"}}'
+        )
+        (tmp_path / "package-lock.json").write_text(
+            '{"packages": {"node_modules/left-pad": {"version": "1.3.0"}}}'
+        )
+        (tmp_path / "go.mod").write_text("module x\n\nrequire github.com/a/b v1.0.0\n")
+
+        py = await PythonEcosystem().load_dependencies(tmp_path)
+        js = await JavaScriptEcosystem().load_dependencies(tmp_path)
+        go = await GoEcosystem().load_dependencies(tmp_path)
+
+        assert [p.name for p in py] == ["requests"]
+        assert js[0].installed_version == "1.3.0"
+        assert go[0].name == "github.com/a/b"
+        assert on_main and not any(on_main)  # go.mod and go.work share a reader
+
+
+class TestParallelPythonParsing:
+    """Concurrent source parsing keeps a deterministic merge order."""
+
+    @pytest.mark.asyncio
+    async def test_merge_order_independent_of_completion_order(
+        self, tmp_path, monkeypatch
+    ):
+        import time
+
+        import ecosystems.python as py_mod
+
+        real = py_mod._parse_pyproject
+
+        def slow_pyproject(path):
+            time.sleep(0.2)
+            return real(path)
+
+        monkeypatch.setattr(py_mod, "_parse_pyproject", slow_pyproject)
+        (tmp_path / "pyproject.toml").write_text(
+            "[project]\nname = 'x'\ndependencies = ['requests>=2.31']\n"
+        )
+        (tmp_path / "requirements.txt").write_text("requests>=2.0\n")
+        (tmp_path / "requirements-dev.txt").write_text("requests\n")
+
+        pkgs = await PythonEcosystem().load_dependencies(tmp_path)
+
+        assert [s.file for s in pkgs[0].sources] == [
+            "pyproject.toml",
+            "requirements-dev.txt",
+            "requirements.txt",
+        ]
+
+
+_PACKAGE_LOCK = {
+    "name": "app",
+    "lockfileVersion": 3,
+    "packages": {
+        "": {"name": "app", "dependencies": {"react": "^18.0.0"}},
+        "node_modules/react": {"version": "18.2.0", "dependencies": {"x": "1"}},
+        "node_modules/react/node_modules/loose-envify": {"version": "0.1.0"},
+        "node_modules/loose-envify": {"version": "1.4.0"},
+        "node_modules/@types/node": {"version": "20.11.5"},
+        "packages/web/node_modules/react": {"version": "17.0.0"},
+    },
+}
+
+
+class TestStreamingPackageLock:
+    """Test the memory-mapped package-lock.json reader."""
+
+    def test_reads_only_requested_top_level_entries(self, tmp_path):
+        import json
+
+        from ecosystems.jslock import read_package_lock
+
+        path = tmp_path / "package-lock.json"
+        path.write_text(json.dumps(_PACKAGE_LOCK, indent=2))
+
+        versions, stats = read_package_lock(
+            path, ["react", "@types/node"], measure_memory=True
+        )
+
+        assert versions == {"react": "18.2.0", "@types/node": "20.11.5"}
+        assert stats.entries == 2
+        assert stats.streamed is True
+        assert stats.elapsed_ms >= 0
+        assert stats.peak_bytes > 0
+
+    def test_peak_memory_unset_unless_measured(self, tmp_path):
+        import json
+        import tracemalloc
+
+        from ecosystems.jslock import read_package_lock
+
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already tracing")
+        path = tmp_path / "package-lock.json"
+        path.write_text(json.dumps(_PACKAGE_LOCK))
+        _, stats = read_package_lock(path, ["react"])
+        assert stats.peak_bytes is None
+
+    def test_all_entries_when_names_omitted(self, tmp_path):
+        import json
+
+        from ecosystems.jslock import read_package_lock
+
+        path = tmp_path / "package-lock.json"
+        path.write_text(json.dumps(_PACKAGE_LOCK))
+
+        versions, _ = read_package_lock(path)
+
+        assert versions["loose-envify"] == "1.4.0"
+        assert versions["react"] == "18.2.0"
+
+    def test_lockfile_v1_fallback(self, tmp_path):
+        import json
+
+        from ecosystems.jslock import read_package_lock
+
+        path = tmp_path / "package-lock.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "lockfileVersion": 1,
+                    "dependencies": {"lodash": {"version": "4.17.21"}},
+                }
+            )
+        )
+
+        versions, stats = read_package_lock(path, ["lodash"])
+
+        assert versions == {"lodash": "4.17.21"}
+        assert stats.streamed is False
+
+
+class TestPnpmYarnLocks:
+    """Test the streaming pnpm-lock.yaml and yarn.lock readers."""
+
+    def test_pnpm_v9_root_importer(self, tmp_path):
+        from ecosystems.jslock import read_pnpm_lock
+
+        path = tmp_path / "pnpm-lock.yaml"
+        path.write_text(
+            "lockfileVersion: '9.0'\n\n"
+            "importers:\n\n"
+            "  .:\n"
+            "    dependencies:\n"
+            "      react:\n"
+            "        specifier: ^18.0.0\n"
+            "        version: 18.2.0\n"
+            "      '@types/react':\n"
+            "        specifier: ^18\n"
+            "        version: 18.2.7(@types/prop-types@15.7.5)\n"
+            "      local-lib:\n"
+            "        specifier: link:../lib\n"
+            "        version: link:../lib\n"
+            "  packages/web:\n"
+            "    dependencies:\n"
+            "      react:\n"
+            "        specifier: ^17\n"
+            "        version: 17.0.2\n\n"
+            "packages:\n\n"
+            "  react@18.2.0:\n"
+            "    resolution: {integrity: sha512-x}\n"
+        )
+
+        assert read_pnpm_lock(path) == {"react": "18.2.0", "@types/react": "18.2.7"}
+
+    def test_pnpm_v5_inline_versions(self, tmp_path):
+        from ecosystems.jslock import read_pnpm_lock
+
+        path = tmp_path / "pnpm-lock.yaml"
+        path.write_text(
+            "lockfileVersion: 5.4\n\n"
+            "specifiers:\n  lodash: ^4.17.0\n\n"
+            "dependencies:\n  lodash: 4.17.21\n\n"
+            "devDependencies:\n  jest: 29.7.0_@types+node@20.0.0\n"
+        )
+
+        assert read_pnpm_lock(path) == {"lodash": "4.17.21", "jest": "29.7.0"}
+
+    def test_yarn_v1_and_berry_descriptors(self, tmp_path):
+        from ecosystems.jslock import read_yarn_lock, yarn_versions
+
+        classic = tmp_path / "classic.lock"
+        classic.write_text(
+            "# yarn lockfile v1\n\n"
+            '"@babel/core@^7.0.0", "@babel/core@^7.1.0":\n'
+            '  version "7.2.0"\n'
+            '  resolved "https://registry.yarnpkg.com/x"\n\n'
+            'lodash@^3.0.0:\n  version "3.10.1"\n\n'
+            'lodash@^4.17.21:\n  version "4.17.21"\n'
+            '  dependencies:\n    version-utils "^1"\n'
+        )
+        berry = tmp_path / "berry.lock"
+        berry.write_text(
+            "__metadata:\n  version: 6\n\n"
+            '"lodash@npm:^4.17.0, lodash@npm:^4.17.21":\n'
+            "  version: 4.17.21\n"
+            '  resolution: "lodash@npm:4.17.21"\n'
+        )
+
+        declared = [("lodash", "^4.17.21"), ("@babel/core", "^7.1.0")]
+        assert yarn_versions(read_yarn_lock(classic), declared) == {
+            "lodash": "4.17.21",
+            "@babel/core": "7.2.0",
+        }
+        assert yarn_versions(read_yarn_lock(berry), declared) == {"lodash": "4.17.21"}
+
+    @pytest.mark.asyncio
+    async def test_ecosystem_uses_cached_yarn_lock(self, tmp_path):
+        (tmp_path / "package.json").write_text(
+            '{"dependencies": {"lodash": "^4.17.21"}}'
+        )
+        (tmp_path / "yarn.lock").write_text('lodash@^4.17.21:\n  version "4.17.21"\n')
+        eco = JavaScriptEcosystem()
+
+        first = await eco.load_dependencies(tmp_path)
+        second = await eco.load_dependencies(tmp_path)
+
+        assert first[0].installed_version == second[0].installed_version == "4.17.21"
+        assert eco.debug_stats()["parse_cache_hits"] == 1
+
+
+class TestLockIndex:
+    """Test the persisted, content-addressed uv.lock index."""
+
+    _LOCK = (
+        "version = 1\n\n"
+        "[[package]]\n"
+        'name = "Requests"\n'
+        'version = "2.32.3"\n'
+        'source = { registry = "https://pypi.org/simple" }\n'
+        'dependencies = [{ name = "certifi" }, { name = "charset_normalizer" }]\n\n'
+        "[[package]]\n"
+        'name = "certifi"\n'
+        'version = "2024.8.30"\n'
+        'source = { registry = "https://pypi.org/simple" }\n'
+    )
+
+    def test_builds_versions_sources_and_edges(self, tmp_path):
+        from ecosystems.lockindex import load_uv_lock_index
+
+        (tmp_path / "uv.lock").write_text(self._LOCK)
+        index = load_uv_lock_index(tmp_path / "uv.lock", cache_dir=tmp_path / "c")
+
+        assert index is not None
+        assert index.versions == {"requests": "2.32.3", "certifi": "2024.8.30"}
+        assert index.sources["requests"] == "registry+https://pypi.org/simple"
+        assert index.deps == {"requests": ["certifi", "charset-normalizer"]}
+
+    def test_reuses_persisted_index_without_parsing(self, tmp_path, monkeypatch):
+        from ecosystems import lockindex
+
+        (tmp_path / "uv.lock").write_text(self._LOCK)
+        first = lockindex.load_uv_lock_index(
+            tmp_path / "uv.lock", cache_dir=tmp_path / "c"
+        )
+        assert len(list((tmp_path / "c").glob("uv-*.json"))) == 1
+
+        class NoToml:
+            @staticmethod
+            def loads(_text):
+                raise AssertionError("persisted index should have been used")
+
+        monkeypatch.setattr(lockindex, "tomllib", NoToml)
+        second = lockindex.load_uv_lock_index(
+            tmp_path / "uv.lock", cache_dir=tmp_path / "c"
+        )
+        assert second == first
+
+    def test_missing_or_invalid_lock(self, tmp_path):
+        from ecosystems.lockindex import load_uv_lock_index
+
+        assert load_uv_lock_index(tmp_path / "uv.lock", cache_dir=tmp_path) is None
+        (tmp_path / "uv.lock").write_text("not = [valid")
+        assert load_uv_lock_index(tmp_path / "uv.lock", cache_dir=tmp_path) is None
+
+    def test_poetry_pdm_and_pipfile_locks(self, tmp_path):
+        from ecosystems.lockindex import load_lock_index
+
+        (tmp_path / "poetry.lock").write_text(
+            '[[package]]\nname = "Requests"\nversion = "2.31.0"\n\n'
+            '[package.dependencies]\ncharset-normalizer = ">=2,<4"\n\n'
+            '[package.source]\ntype = "legacy"\nurl = "https://mirror/simple"\n'
+        )
+        (tmp_path / "pdm.lock").write_text(
+            '[[package]]\nname = "flask"\nversion = "3.0.0"\n'
+            'dependencies = ["Werkzeug>=3.0.0", "click>=8.1.3"]\n'
+        )
+        (tmp_path / "Pipfile.lock").write_text(
+            '{"default": {"django": {"version": "==4.2.7", "index": "pypi"}},'
+            ' "develop": {"pytest": {"version": "==7.4.3"},'
+            ' "mylib": {"editable": true, "path": "."}}}'
+        )
+
+        poetry = load_lock_index(tmp_path / "poetry.lock", cache_dir=tmp_path / "c")
+        pdm = load_lock_index(tmp_path / "pdm.lock", cache_dir=tmp_path / "c")
+        pipfile = load_lock_index(tmp_path / "Pipfile.lock", cache_dir=tmp_path / "c")
+
+        assert poetry.versions == {"requests": "2.31.0"}
+        assert poetry.sources["requests"] == "legacy+https://mirror/simple"
+        assert poetry.deps["requests"] == ["charset-normalizer"]
+        assert pdm.versions == {"flask": "3.0.0"}
+        assert pdm.deps["flask"] == ["werkzeug", "click"]
+        assert pipfile.versions == {"django": "4.2.7", "pytest": "7.4.3"}
+        assert pipfile.sources["mylib"] == "editable+."
+        assert len(list((tmp_path / "c").glob("*.json"))) == 3
+
+    @pytest.mark.asyncio
+    async def test_ecosystem_reads_pipfile_lock(self, tmp_path, monkeypatch):
+        from ecosystems import lockindex
+
+        monkeypatch.setattr(lockindex, "CACHE_DIR", tmp_path / "c")
+        (tmp_path / "Pipfile").write_text('[packages]\ndjango = "*"\n')
+        (tmp_path / "Pipfile.lock").write_text(
+            '{"default": {"django": {"version": "==4.2.7"}}}'
+        )
+
+        eco = PythonEcosystem()
+        pkgs = await eco.load_dependencies(tmp_path)
+
+        assert pkgs[0].installed_version == "4.2.7"
+        assert eco.lock_index(tmp_path).versions == {"django": "4.2.7"}
+
+
+class TestSitePackagesIndex:
+    """Test the incremental dist-info METADATA reader."""
+
+    @staticmethod
+    def _dist(site, name, version, *requires):
+        import os
+
+        dist = site / f"{name}-{version}.dist-info"
+        dist.mkdir(parents=True)
+        lines = [f"Name: {name}", f"Version: {version}"]
+        lines += [f"Requires-Dist: {r}" for r in requires]
+        (dist / "METADATA").write_text("\n".join(lines) + "\n\nbody\nName: x\n")
+        # make the parent's mtime visibly change between steps
+        st = os.stat(site)
+        os.utime(site, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    def test_refreshes_only_changed_entries(self, tmp_path):
+        import shutil
+
+        from ecosystems.sitepackages import SitePackagesIndex
+
+        site = tmp_path / ".venv" / "lib" / "python3.12" / "site-packages"
+        site.mkdir(parents=True)
+        self._dist(site, "Flask", "3.0.0", "Werkzeug>=3.0.0", "click>=8.1.3")
+        self._dist(site, "click", "8.1.7")
+        index = SitePackagesIndex()
+
+        dists = index.distributions(tmp_path)
+        assert dists["flask"].version == "3.0.0"
+        assert dists["flask"].requires() == ["Werkzeug", "click"]
+        assert index.stats() == {"listings": 1, "reads": 2}
+
+        index.distributions(tmp_path)
+        assert index.stats() == {"listings": 1, "reads": 2}
+
+        shutil.rmtree(site / "click-8.1.7.dist-info")
+        self._dist(site, "click", "8.1.8")
+        dists = index.distributions(tmp_path)
+        assert dists["click"].version == "8.1.8"
+        assert index.stats() == {"listings": 2, "reads": 3}
+
+    def test_virtual_env_fallback(self, tmp_path, monkeypatch):
+        from ecosystems.sitepackages import SitePackagesIndex
+
+        env = tmp_path / "env"
+        self._dist(env / "lib" / "python3.11" / "site-packages", "idna", "3.6")
+        monkeypatch.setenv("VIRTUAL_ENV", str(env))
+
+        info = SitePackagesIndex().get(tmp_path / "project", "IDNA")
+
+        assert info is not None and info.version == "3.6"
+
+
+class TestPackageModel:
+    """Test the slotted Package / DepSource model."""
+
+    def test_slots_interned_labels_and_cached_key(self):
+        from base import DepSource, Package
+
+        base_label = "pyproject.toml"
+        label = base_label + " [dev]"  # built at runtime: a fresh string object
+        a = Package("Flask_Login", [DepSource(label, "*")], "")
+        b = Package("requests", [DepSource("pyproject.toml [dev]", ">=2")], "")
+
+        assert not hasattr(a, "__dict__")
+        assert not hasattr(a.sources[0], "__dict__")
+        assert a.sources[0].file is b.sources[0].file
+        assert a.key == "flask-login"
+        assert a == Package("Flask_Login", [DepSource("pyproject.toml [dev]", "*")], "")
+
+
+class TestMergeEngine:
+    """Test the shared declaration merge."""
+
+    def test_dedupe_order_and_installed(self):
+        from base import normalise_name
+        from ecosystems.merge import merge_packages
+
+        rows = [
+            ("Requests", "pyproject.toml", ">=2", ""),
+            ("click", "requirements.txt", "*", ""),
+            ("requests", "requirements.txt", "==2.31.0", "2.31.0"),
+            ("requests", "pyproject.toml", ">=2", ""),
+            ("Click", "venv", "==8.1.7", "8.1.7"),
+        ]
+
+        pkgs = merge_packages(rows, key=normalise_name)
+
+        assert [p.name for p in pkgs] == ["click", "Requests"]
+        assert [(s.file, s.specifier) for s in pkgs[1].sources] == [
+            ("pyproject.toml", ">=2"),
+            ("requirements.txt", "==2.31.0"),
+        ]
+        assert pkgs[1].installed_version == "2.31.0"
+        assert pkgs[0].installed_version == "8.1.7"
+
+    def test_keys_follow_the_ecosystem(self):
+        from base import latest_key
+        from ecosystems.javascript import JavaScriptEcosystem
+        from ecosystems.merge import merge_packages
+
+        rows = [
+            ("lodash.merge", "package.json", "^4", ""),
+            ("lodash_merge", "package.json", "^1", ""),
+        ]
+
+        pkgs = merge_packages(rows, ecosystem=JavaScriptEcosystem())
+
+        assert [p.key for p in pkgs] == ["lodash.merge", "lodash_merge"]
+        assert latest_key(pkgs[0]) == ("javascript", "lodash.merge")
+
+    def test_scales_to_many_sources_per_package(self):
+        import time
+
+        from ecosystems.merge import merge_packages
+
+        rows = [("pkg", f"req-{i}.txt", ">=1", "") for i in range(20_000)] * 2
+
+        t0 = time.perf_counter()
+        (pkg,) = merge_packages(rows)
+
+        assert len(pkg.sources) == 20_000
+        assert time.perf_counter() - t0 < 1.0
+
+
+class TestPep508:
+    """Test the memoised PEP 508 requirement parser."""
+
+    def test_structured_fields(self):
+        from ecosystems.pep508 import parse_requirement
+
+        req = parse_requirement(
+            "Requests[Socks, security] >= 2.31 , <3 ; python_version < '3.13'"
+        )
+        assert req is not None
+        assert req.name == "Requests"
+        assert req.key == "requests"
+        assert req.extras == ("socks", "security")
+        assert req.specifier == ">=2.31,<3"
+        assert req.marker == "python_version < '3.13'"
+        assert req.url is None
+
+    def test_direct_reference_and_parenthesised_spec(self):
+        from ecosystems.pep508 import name_and_specifier, parse_requirement
+
+        req = parse_requirement("pip @ https://example.com/pip.whl ; os_name == 'nt'")
+        assert req is not None
+        assert req.url == "https://example.com/pip.whl"
+        assert req.marker == "os_name == 'nt'"
+        assert parse_requirement("name (>=1.0)").specifier == ">=1.0"
+        assert name_and_specifier("click") == ("click", "*")
+        assert name_and_specifier("x==1; sys_platform == 'linux'") == (
+            "x",
+            "==1; sys_platform == 'linux'",
+        )
+
+    def test_invalid_strings(self):
+        from ecosystems.pep508 import parse_requirement
+
+        for raw in ("", "# comment", "-e .", "pkg >>= 1", "pkg @", "pkg[b@d]"):
+            assert parse_requirement(raw) is None
+
+    def test_memoised_by_raw_string(self):
+        from ecosystems.pep508 import parse_requirement
+
+        parse_requirement.cache_clear()
+        first = parse_requirement("httpx>=0.27")
+        second = parse_requirement("httpx>=0.27")
+        assert first is second
+        assert parse_requirement.cache_info().hits == 1
+
+    def test_exclusive_ordering_excludes_pre_and_post_releases(self):
+        from ecosystems.pep508 import version_matches
+
+        assert not version_matches("2.31.0rc1", "<2.31")
+        assert not version_matches("2.31.0.dev1", "<2.31")
+        assert version_matches("2.31.0rc1", "<2.31rc2")
+        assert version_matches("2.30.0rc1", "<2.31")
+        assert version_matches("2.31.0rc1", "<=2.31")
+
+        assert not version_matches("1.0.post1", ">1.0")
+        assert not version_matches("1.0+local", ">1.0")
+        assert version_matches("1.0.post2", ">1.0.post1")
+        assert version_matches("1.0.1", ">1.0")
+        assert version_matches("1.0.post1", ">=1.0")
+
+
+class TestRequirementsIncludes:
+    """Test -r / -c include resolution in requirements files."""
+
+    def test_follows_includes_and_records_provenance(self, tmp_path):
+        from ecosystems.python import _resolve_requirements
+
+        (tmp_path / "requirements.txt").write_text("-r reqs/base.txt\nflask\n")
+        (tmp_path / "reqs").mkdir()
+        (tmp_path / "reqs" / "base.txt").write_text(
+            "--requirement=common.txt\nclick>=8\n"
+        )
+        (tmp_path / "reqs" / "common.txt").write_text("rich\n")
+
+        raw, provenance = _resolve_requirements(tmp_path)
+
+        assert ("flask", "*", "requirements.txt") in raw
+        assert ("click", ">=8", "reqs/base.txt") in raw
+        assert ("rich", "*", "reqs/common.txt") in raw
+        assert provenance == {
+            "reqs/base.txt": "requirements.txt",
+            "reqs/common.txt": "reqs/base.txt",
+        }
+
+    def test_cycles_and_shared_includes_parsed_once(self, tmp_path):
+        from ecosystems.cache import ParseCache
+        from ecosystems.python import _resolve_requirements
+
+        (tmp_path / "requirements.txt").write_text("-r shared.txt\n-r a.txt\n")
+        (tmp_path / "a.txt").write_text("-r requirements.txt\n-r shared.txt\nattrs\n")
+        (tmp_path / "shared.txt").write_text("six\n")
+        cache = ParseCache()
+
+        raw, _ = _resolve_requirements(tmp_path, cache)
+
+        assert sorted(name for name, _, _ in raw) == ["attrs", "six"]
+        assert cache.stats()["misses"] == 3
+
+    def test_constraints_only_pin_declared_packages(self, tmp_path):
+        from ecosystems.python import _resolve_requirements
+
+        (tmp_path / "requirements.txt").write_text("-c constraints.txt\nrequests\n")
+        (tmp_path / "constraints.txt").write_text("requests<2.32\nurllib3<2\n")
+
+        raw, provenance = _resolve_requirements(tmp_path)
+
+        assert ("requests", "<2.32", "constraints.txt [constraint]") in raw
+        assert all(name != "urllib3" for name, _, _ in raw)
+        assert provenance == {"constraints.txt": "requirements.txt"}
+
+    @pytest.mark.asyncio
+    async def test_ecosystem_exposes_provenance(self, tmp_path):
+        (tmp_path / "requirements.txt").write_text("-r dev.txt\n")
+        (tmp_path / "dev.txt").write_text("pytest\n")
+        eco = PythonEcosystem()
+
+        pkgs = await eco.load_dependencies(tmp_path)
+
+        assert [s.file for s in pkgs[0].sources] == ["dev.txt"]
+        assert eco.source_provenance() == {"dev.txt": "requirements.txt"}
+
+
+class TestHashPinnedRequirements:
+    """Test the streaming tokenizer on pip-compile --generate-hashes output."""
+
+    _HASHED = (
+        "# generated by pip-compile\n"
+        "certifi==2024.2.2 \\\n"
+        "    --hash=sha256:aaa \\\n"
+        "    --hash=sha256:bbb\n"
+        "    # via requests\n"
+        "requests==2.31.0 --hash=sha256:ccc \\\n"
+        "    --hash sha256:ddd\n"
+        "-r \\\n"
+        "    base.txt\n"
+        "idna==3.6\n"
+    )
+
+    def test_joins_continuations_and_skips_hashes(self, tmp_path):
+        from ecosystems.python import _iter_requirement_lines, _scan_requirements_file
+
+        path = tmp_path / "requirements.txt"
+        path.write_text(self._HASHED)
+
+        lines = list(_iter_requirement_lines(self._HASHED.splitlines()))
+        assert [text for text, _ in lines] == [
+            "certifi==2024.2.2",
+            "requests==2.31.0",
+            "-r base.txt",
+            "idna==3.6",
+        ]
+        assert all(hashes == [] for _, hashes in lines)
+
+        scanned = _scan_requirements_file(path)
+        assert scanned.entries == [
+            ("certifi", "==2024.2.2"),
+            ("requests", "==2.31.0"),
+            ("idna", "==3.6"),
+        ]
+        assert scanned.includes == ["base.txt"]
+        assert scanned.hashes == {}
+
+    def test_hashes_collected_when_asked(self, tmp_path):
+        from ecosystems.python import _scan_requirements_file
+
+        path = tmp_path / "requirements.txt"
+        path.write_text(self._HASHED)
+
+        scanned = _scan_requirements_file(path, keep_hashes=True)
+
+        assert scanned.hashes == {
+            "certifi": ["sha256:aaa", "sha256:bbb"],
+            "requests": ["sha256:ccc", "sha256:ddd"],
+        }
+
+    def test_remove_drops_continuation_lines(self, tmp_path):
+        from ecosystems.python import _remove_from_requirements, _scan_requirements_file
+
+        path = tmp_path / "requirements.txt"
+        path.write_text(self._HASHED)
+
+        ok, _ = _remove_from_requirements(path, "certifi")
+
+        assert ok
+        assert "sha256:aaa" not in path.read_text()
+        names = [name for name, _ in _scan_requirements_file(path).entries]
+        assert names == ["requests", "idna"]
+
+
+class TestWorkspaceDiscovery:
+    """Test monorepo member discovery and aggregated loading."""
+
+    def _make_monorepo(self, root):
+        (root / "pyproject.toml").write_text(
+            "[project]\nname = 'root'\ndependencies = ['requests>=2.31']\n"
+            "[tool.uv.workspace]\nmembers = ['libs/*']\nexclude = ['libs/skip']\n"
+        )
+        for name in ("core", "skip"):
+            (root / "libs" / name).mkdir(parents=True)
+            (root / "libs" / name / "pyproject.toml").write_text(
+                f"[project]\nname = '{name}'\ndependencies = ['Requests<3']\n"
+            )
+        (root / "web").mkdir()
+        (root / "web" / "package.json").write_text(
+            '{"dependencies": {"react": "^18.0.0"}}'
+        )
+        (root / "svc").mkdir()
+        (root / "svc" / "go.mod").write_text(
+            "module example.com/svc\n\ngo 1.22\n\nrequire github.com/pkg/errors v0.9.1\n"
+        )
+        (root / "go.work").write_text("go 1.22\n\nuse (\n\t./svc\n)\n")
+        # Never entered
+        for skipped in ("node_modules/left-pad", ".venv/lib", ".git/x", "build/gen"):
+            (root / skipped).mkdir(parents=True)
+            (root / skipped / "package.json").write_text("{}")
+        (root / ".gitignore").write_text("# generated\nbuild/\n")
+
+    def test_walk_skips_vendored_and_ignored_dirs(self, tmp_path):
+        from ecosystems.workspace import walk_projects
+
+        self._make_monorepo(tmp_path)
+
+        rels = [m.rel for m in walk_projects(tmp_path)]
+
+        assert rels == [".", "libs/core", "libs/skip", "svc", "web"]
+
+    def test_declared_members(self, tmp_path):
+        from ecosystems.workspace import discover_members
+
+        self._make_monorepo(tmp_path)
+
+        declared = {m.rel: m.declared_by for m in discover_members(tmp_path)}
+
+        assert declared["libs/core"] == "uv workspace"
+        assert declared["libs/skip"] is None
+        assert declared["svc"] == "go.work"
+        assert declared["web"] is None
+
+    def test_go_work_quoted_use(self, tmp_path):
+        from ecosystems.workspace import declared_members
+
+        (tmp_path / "b").mkdir()
+        (tmp_path / "go.work").write_text('go 1.22\n\nuse "./b"\n')
+
+        assert declared_members(tmp_path) == {(tmp_path / "b").resolve(): "go.work"}
+
+    @pytest.mark.asyncio
+    async def test_load_workspace_merges_members(self, tmp_path):
+        from ecosystems.workspace import load_workspace
+
+        self._make_monorepo(tmp_path)
+
+        ws = await load_workspace(tmp_path)
+        by_name = {p.name.lower(): p for p in ws.packages}
+
+        assert len(ws.members) == 5
+        assert [s.file for s in by_name["requests"].sources] == [
+            "pyproject.toml",
+            "libs/core/pyproject.toml",
+            "libs/skip/pyproject.toml",
+        ]
+        assert by_name["react"].sources[0].file == "web/dependencies"
+        assert by_name["github.com/pkg/errors"].sources[0].file.startswith("svc/")
+
+
+class TestGoEngine:
+    """Test go.mod / go.sum / go.work parsing and resolution."""
+
+    def test_go_sum_version_sets(self, tmp_path):
+        from ecosystems.go import _read_go_sum
+
+        (tmp_path / "go.sum").write_text(
+            "github.com/a/b v1.0.0 h1:x=\n"
+            "github.com/a/b v1.0.0/go.mod h1:y=\n"
+            "github.com/a/b v1.1.0/go.mod h1:z=\n"
+        )
+
+        index = _read_go_sum(tmp_path / "go.sum")
+
+        assert index.versions == {"github.com/a/b": {"v1.0.0", "v1.1.0"}}
+        assert index.downloaded == {"github.com/a/b": {"v1.0.0"}}
+
+    @pytest.mark.asyncio
+    async def test_replace_and_exclude(self, tmp_path):
+        (tmp_path / "go.mod").write_text(
+            "module example.com/app\n\n"
+            "require (\n"
+            "\tgithub.com/a/b v1.0.0\n"
+            "\tgithub.com/c/d v0.3.0 // indirect\n"
+            "\tgithub.com/e/f v2.0.0\n"
+            ")\n\n"
+            "replace github.com/c/d => ../d\n"
+            "replace github.com/e/f v2.0.0 => github.com/fork/f v2.0.1\n"
+            "exclude github.com/a/b v1.0.0\n"
+        )
+        (tmp_path / "go.sum").write_text(
+            "github.com/a/b v1.0.0 h1:x=\n"
+            "github.com/a/b v1.2.0 h1:x=\n"
+            "github.com/a/b v1.1.0 h1:x=\n"
+            "github.com/fork/f v2.0.1 h1:x=\n"
+        )
+
+        pkgs = {p.name: p for p in await GoEcosystem().load_dependencies(tmp_path)}
+
+        assert pkgs["github.com/a/b"].installed_version == "v1.1.0"
+        assert pkgs["github.com/c/d"].sources[0].file == "indirect"
+        assert pkgs["github.com/c/d"].sources[0].specifier == "v0.3.0 => ../d"
+        assert pkgs["github.com/c/d"].installed_version == ""
+        assert pkgs["github.com/e/f"].installed_version == "v2.0.1"
+
+    @pytest.mark.asyncio
+    async def test_go_work_multi_module(self, tmp_path):
+        (tmp_path / "go.work").write_text(
+            "go 1.22\n\nuse (\n\t./api\n\t./lib\n)\n"
+            "replace github.com/x/y => github.com/x/y v1.5.0\n"
+        )
+        (tmp_path / "api").mkdir()
+        (tmp_path / "api" / "go.mod").write_text(
+            "module example.com/api\n\n"
+            "require (\n\texample.com/lib v0.0.0\n\tgithub.com/x/y v1.0.0\n)\n"
+        )
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "lib" / "go.mod").write_text(
+            "module example.com/lib\n\nrequire github.com/x/y v1.2.0\n"
+        )
+
+        eco = GoEcosystem()
+        assert eco.detect(tmp_path)
+        pkgs = {p.name: p for p in await eco.load_dependencies(tmp_path)}
+
+        assert [s.file for s in pkgs["github.com/x/y"].sources] == [
+            "api/main",
+            "lib/main",
+        ]
+        assert pkgs["github.com/x/y"].installed_version == "v1.5.0"
+        assert pkgs["example.com/lib"].sources[0].specifier == "v0.0.0 => ./lib"